@@ -0,0 +1,43 @@
+"""
+Time numerical code using units, transformed as usual and with
+`check_dimensions`, which does the arithmetic on plain magnitudes where it
+can show the units are consistent.
+
+    $ python -m benchmarks.dimensions
+"""
+import timeit
+
+import numpy
+
+from unit_syntax.transform import UnitSourceTransform
+
+SOURCE = """
+def kinetic_energy(mass, velocity, height):
+    potential = (mass kg) * (9.81 m/s**2) * (height m)
+    return (mass kg) * (velocity m/s) ** 2 / 2 + potential
+"""
+
+ARGUMENTS = {
+    "scalars": (2.0, 3.0, 10.0),
+    "arrays": tuple(numpy.random.default_rng(0).random((3, 100_000))),
+}
+NUMBER = 200
+REPEAT = 5
+
+
+def main():
+    for check_dimensions in (False, True):
+        ust = UnitSourceTransform(None, check_dimensions=check_dimensions)
+        env = ust.injected_globals()
+        exec(compile(ust.transform(SOURCE), "<benchmark>", "exec"), env)
+        fn = env["kinetic_energy"]
+        for label, args in ARGUMENTS.items():
+            best = min(timeit.repeat(lambda: fn(*args), number=NUMBER, repeat=REPEAT))
+            print(
+                f"check_dimensions={check_dimensions!s:5} {label:>8}: "
+                f"{best / NUMBER * 1e6:8.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
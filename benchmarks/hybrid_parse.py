@@ -0,0 +1,53 @@
+"""
+Compare transforming a large module that has a few unit expressions with the
+units-aware parser alone against splitting it into top-level statements and
+only giving that parser the ones CPython rejects.
+
+    $ python -m benchmarks.hybrid_parse
+"""
+import ast
+import inspect
+import textwrap
+import timeit
+import typing
+
+from unit_syntax.parser import parse_string
+from unit_syntax.transform import UnitExprTransformer, UnitSourceTransform
+
+UNIT_STATEMENTS = textwrap.dedent(
+    """
+    def fall_time(height):
+        return (2 * height / (9.8 meters/second**2)) ** 0.5
+
+    SPEED_OF_SOUND = 343 meters/second
+    """
+)
+
+REPEAT = 5
+
+
+def _whole_module(transform: UnitSourceTransform, source: str):
+    tree = parse_string(source, mode="file")
+    return UnitExprTransformer(transform.ureg).visit(tree)
+
+
+def main():
+    # A large, ordinary module with unit statements at the start and end
+    source = UNIT_STATEMENTS + inspect.getsource(typing) + UNIT_STATEMENTS
+    lines = source.count("\n")
+    transform = UnitSourceTransform(None)
+
+    for label, fn in (
+        ("whole module", lambda: _whole_module(transform, source)),
+        ("statements", lambda: transform.transform(source)),
+    ):
+        best = min(timeit.repeat(fn, number=1, repeat=REPEAT))
+        print(f"{label:>12}: {best * 1e3:8.1f} ms for {lines} lines")
+
+    assert ast.dump(_whole_module(transform, source)) == ast.dump(
+        transform.transform(source)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Transform time for generated modules of unit statements, e.g. lookup tables,
+parsing them in this process and in a pool of worker processes.  Sources
+below `_PARALLEL_MIN_CHARS` are parsed in this process either way.
+
+    $ python -m benchmarks.parallel_parse
+"""
+import os
+import timeit
+
+from unit_syntax import transform
+from unit_syntax.transform import UnitSourceTransform
+
+ROW = "T{i} = ({i}.5 meters/second, {i} kg m**2/s**2, f(x{i}) newton)\n"
+
+SIZES = (100, 1000, 5000)
+REPEAT = 3
+
+
+def main():
+    print(f"{os.cpu_count()} CPUs, cutoff {transform._PARALLEL_MIN_CHARS} chars")
+    serial = UnitSourceTransform(None)
+    parallel = UnitSourceTransform(None, parallel=True)
+    # Start the pool up front, as it's shared by every later transform
+    transform._parse_pool()
+
+    for rows in SIZES:
+        source = "".join(ROW.format(i=i) for i in range(rows))
+        for label, ust in (("serial", serial), ("parallel", parallel)):
+            best = min(
+                timeit.repeat(lambda: ust.transform(source), number=1, repeat=REPEAT)
+            )
+            print(
+                f"{rows:>6} rows, {len(source):>7} chars, {label:>8}: {best * 1e3:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
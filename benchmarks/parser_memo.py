@@ -0,0 +1,36 @@
+"""
+Time and peak memory of the units-aware parser on a large module, which is
+dominated by the parser's memo of rule results.
+
+    $ python -m benchmarks.parser_memo
+"""
+import inspect
+import timeit
+import tracemalloc
+import typing
+
+from unit_syntax.parser import parse_string
+
+REPEAT = 5
+
+
+def main():
+    source = inspect.getsource(typing)
+    lines = source.count("\n")
+
+    best = min(
+        timeit.repeat(
+            lambda: parse_string(source, mode="file"), number=1, repeat=REPEAT
+        )
+    )
+    print(f"  parse: {best * 1e3:8.1f} ms for {lines} lines")
+
+    tracemalloc.start()
+    parse_string(source, mode="file")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"   peak: {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Time each stage of transforming a fixed corpus: the units-aware parser,
+`UnitExprTransformer`, `ast.unparse` and `compile`, with CPython's
+`ast.parse` of the same code without units as a baseline.  Also reports
+parser throughput and peak memory.
+
+    $ python -m benchmarks.suite --json before.json
+    $ python -m benchmarks.suite --compare before.json
+
+The corpus is a few standard library modules, so compare results from the
+same Python version, plus generated unit-dense modules and long expressions.
+"""
+import argparse
+import ast
+import inspect
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+import tokenize
+import tracemalloc
+
+import unit_syntax
+from unit_syntax.parser import parse_string
+from unit_syntax.transform import UnitExprTransformer, UnitSourceTransform
+
+STDLIB_MODULES = ("argparse", "dataclasses", "string", "typing")
+
+STAGES = ("ast.parse", "parse", "transform", "unparse", "compile")
+
+# Fractional slowdown of a stage reported as a regression by --compare
+THRESHOLD = 0.1
+
+REPEAT = 3
+
+UNIT_FUNCTION = """\
+def step{i}(state, dt):
+    force = state.mass * (9.81 meters/second**2) + (12.5 newton) * {i}
+    accel = force / state.mass
+    velocity = state.velocity + accel * dt
+    drag = (0.47 dimensionless) * (1.2 kg/m**3) * velocity ** 2 / 2
+    energy = [(x kg m**2/s**2) for x in state.samples[{i}:]]
+    return velocity, drag, energy, (3 hours) + (20 minutes)
+
+"""
+
+
+def _strip_units(template: str) -> str:
+    "The same code with each unit expression replaced by its value"
+    return (
+        template.replace(" meters/second**2", "")
+        .replace(" newton", "")
+        .replace(" dimensionless", "")
+        .replace(" kg/m**3", "")
+        .replace(" kg m**2/s**2", "")
+        .replace(" hours", "")
+        .replace(" minutes", "")
+        .replace(" meters/second", "")
+    )
+
+
+def _generated(template: str, count: int, sep: str = "") -> tuple[str, str]:
+    units = sep.join(template.format(i=i) for i in range(count))
+    plain = sep.join(_strip_units(template).format(i=i) for i in range(count))
+    return units, plain
+
+
+def corpus() -> dict[str, tuple[str, str]]:
+    "Name -> (source, the same source without units) for each benchmark"
+    items = {}
+    for name in STDLIB_MODULES:
+        source = inspect.getsource(__import__(name))
+        items[f"stdlib/{name}"] = (source, source)
+    items["units/functions"] = _generated(UNIT_FUNCTION, 150)
+    # Nested a level per term, which Python's ast visitors recurse through
+    sum_units, sum_plain = _generated("a{i} * ({i}.5 meters/second)", 250, " + ")
+    items["long/sum"] = (f"x = {sum_units}\n", f"x = {sum_plain}\n")
+    list_units, list_plain = _generated("({i} kg m**2/s**2, {i} newton)", 1000, ", ")
+    items["long/list"] = (f"x = [{list_units}]\n", f"x = [{list_plain}]\n")
+    return items
+
+
+def _count_tokens(source: str) -> int:
+    return sum(1 for _ in tokenize.generate_tokens(io.StringIO(source).readline))
+
+
+def _peak_memory(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_one(name: str, source: str, plain: str, ureg, repeat: int) -> dict:
+    times = {stage: float("inf") for stage in STAGES}
+
+    def timed(stage, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        times[stage] = min(times[stage], time.perf_counter() - start)
+        return result
+
+    for _ in range(repeat):
+        timed("ast.parse", ast.parse, plain)
+        tree = timed("parse", parse_string, source, "file")
+        tree = timed(
+            "transform",
+            lambda: ast.fix_missing_locations(UnitExprTransformer(ureg).visit(tree)),
+        )
+        timed("unparse", ast.unparse, tree)
+        timed("compile", compile, tree, name, "exec", 0, True)
+
+    tokens = _count_tokens(source)
+    return {
+        "lines": source.count("\n"),
+        "tokens": tokens,
+        "seconds": times,
+        "tokens_per_second": {
+            "ast.parse": tokens / times["ast.parse"],
+            "parse": tokens / times["parse"],
+        },
+        "peak_bytes": {
+            "ast.parse": _peak_memory(lambda: ast.parse(plain)),
+            "parse": _peak_memory(lambda: parse_string(source, "file")),
+        },
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: dict) -> None:
+    print(
+        f"{'':18}"
+        + "".join(f"{stage:>11}" for stage in STAGES)
+        + "   tokens/s   peak MiB"
+    )
+    for name, r in results["benchmarks"].items():
+        ms = "".join(f"{r['seconds'][stage] * 1e3:9.1f}ms" for stage in STAGES)
+        print(
+            f"{name:18}{ms}{r['tokens_per_second']['parse']:11.0f}"
+            f"{r['peak_bytes']['parse'] / 2**20:11.1f}"
+        )
+
+
+def compare(old: dict, new: dict, threshold: float) -> bool:
+    "Print the change in each stage's time, returning False on any regression"
+    ok = True
+    for key in ("python", "unit_syntax", "commit"):
+        print(f"{key}: {old.get(key)} -> {new.get(key)}")
+    for name, r in new["benchmarks"].items():
+        before = old["benchmarks"].get(name)
+        if before is None:
+            continue
+        changes = []
+        for stage in STAGES:
+            ratio = r["seconds"][stage] / before["seconds"][stage]
+            flag = ""
+            # The baseline is only there to show machine noise
+            if stage != "ast.parse" and ratio > 1 + threshold:
+                flag = " REGRESSED"
+                ok = False
+            changes.append(f"{stage} {ratio - 1:+.0%}{flag}")
+        print(f"{name:18}" + ", ".join(changes))
+    return ok
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Time each stage of the transform",
+    )
+    parser.add_argument("--json", metavar="PATH", help="write the results to PATH")
+    parser.add_argument(
+        "--compare", metavar="PATH", help="compare with results from PATH"
+    )
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument(
+        "names", nargs="*", help="only run benchmarks starting with these"
+    )
+    args = parser.parse_args(argv)
+
+    ureg = UnitSourceTransform(None).ureg
+    # pint loads its definitions on first use, which isn't part of any stage
+    ureg.get_name("meter")
+    results = {
+        "python": platform.python_version(),
+        "unit_syntax": unit_syntax.__version__,
+        "commit": _git_commit(),
+        "benchmarks": {},
+    }
+    for name, (source, plain) in corpus().items():
+        if args.names and not name.startswith(tuple(args.names)):
+            continue
+        results["benchmarks"][name] = run_one(name, source, plain, ureg, args.repeat)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            return 0 if compare(json.load(f), results, args.threshold) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
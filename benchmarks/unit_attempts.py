@@ -0,0 +1,45 @@
+"""
+How often the parser tries the unit rules on ordinary code, from a profile
+of parsing part of the standard library.  None of these attempts can
+succeed, as the code has no units.
+
+    $ python -m benchmarks.unit_attempts
+"""
+import cProfile
+import glob
+import os
+import pstats
+
+from unit_syntax.parser import parse_string
+
+FILES = 40
+RULES = ("factor_with_units", "units", "units_")
+
+
+def main():
+    stdlib = os.path.dirname(os.__file__)
+    sources = []
+    for path in sorted(glob.glob(os.path.join(stdlib, "*.py")))[:FILES]:
+        with open(path, encoding="utf-8") as f:
+            sources.append(f.read())
+    lines = sum(source.count("\n") for source in sources)
+
+    profile = cProfile.Profile()
+    profile.enable()
+    for source in sources:
+        parse_string(source, mode="file")
+    profile.disable()
+
+    stats = pstats.Stats(profile)
+    # Calls of the rule bodies, i.e. misses in the memo
+    calls = {name: 0 for name in RULES}
+    for (_, _, name), (_, ncalls, *_) in stats.stats.items():
+        if name in calls:
+            calls[name] += ncalls
+    print(f"{len(sources)} modules, {lines} lines, {stats.total_calls} calls")
+    for name, ncalls in calls.items():
+        print(f"{name:>18}: {ncalls:8} attempts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compare evaluating unit expressions against hoisted `Unit` constants with the
+previous lowering, which passed the unit string to pint on every evaluation.
+
+    $ python -m benchmarks.unit_constants
+"""
+import ast
+import timeit
+
+from unit_syntax.parser import parse_string
+from unit_syntax.transform import UnitExprTransformer, UnitSourceTransform
+
+SOURCE = """
+def accumulate(n):
+    total = 0 meters
+    for i in range(n):
+        total = total + (i meters)
+    return total
+
+def speeds(n):
+    return [x meters/second for x in range(n)]
+"""
+
+ITERATIONS = 20_000
+REPEAT = 5
+
+
+class _InlineUnitStrings(ast.NodeTransformer):
+    "Rewrite the hoisted form back to `_unit_syntax_q(x, 'meters')`"
+
+    def __init__(self, unit_constants: dict[str, str]):
+        self.names = {name: units for units, name in unit_constants.items()}
+
+    def visit_Name(self, node):
+        if node.id in self.names and isinstance(node.ctx, ast.Load):
+            return ast.Constant(value=self.names[node.id])
+        return node
+
+
+def _compile(transform: UnitSourceTransform, inline: bool):
+    transformer = UnitExprTransformer(transform.ureg)
+    tree = transformer.visit(parse_string(SOURCE, mode="file"))
+    if inline:
+        tree = _InlineUnitStrings(transformer.unit_constants).visit(tree)
+    code = compile(ast.fix_missing_locations(tree), "<bench>", "exec")
+    glo = transform.injected_globals()
+    exec(code, glo)
+    return glo
+
+
+def main():
+    transform = UnitSourceTransform(None)
+    for label, inline in (("unit strings", True), ("unit constants", False)):
+        glo = _compile(transform, inline)
+        for fn in ("accumulate", "speeds"):
+            best = min(
+                timeit.repeat(lambda: glo[fn](ITERATIONS), number=1, repeat=REPEAT)
+            )
+            print(f"{label:>15} {fn:>11}: {best * 1e6 / ITERATIONS:8.2f} us/iter")
+
+
+if __name__ == "__main__":
+    main()
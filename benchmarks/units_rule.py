@@ -0,0 +1,37 @@
+"""
+Parse time for expression-heavy source, where the parser tries to match
+units after nearly every factor, with and without actual units.
+
+    $ python -m benchmarks.units_rule
+"""
+import timeit
+
+from unit_syntax.parser import parse_string
+
+PLAIN = """\
+y{i} = a * (b + c{i}) / d - f(x, y ** 2) + g[i] * 3 - (h.k @ m) % {i} // n
+z{i} = [p * q for p, q in zip(r, s) if p > -q and not t{i}] + [u ** -v, w]
+"""
+
+UNITS = """\
+v{i} = a * (2 meters/second) + (b{i} kg m**2/s**2) / (c kg)
+w{i} = [(x{i} N m) * y * (3 m/s kg) for x{i}, y in pairs]
+"""
+
+LINES = 1000
+REPEAT = 5
+
+
+def main():
+    for label, template in (("plain", PLAIN), ("units", UNITS)):
+        source = "".join(template.format(i=i) for i in range(LINES // 2))
+        best = min(
+            timeit.repeat(
+                lambda: parse_string(source, mode="file"), number=1, repeat=REPEAT
+            )
+        )
+        print(f"{label:>6}: {best * 1e3:8.1f} ms for {LINES} lines")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import ast
 import os.path
 import sys
 from io import StringIO
@@ -146,6 +147,22 @@ result = 1 meters
 
     tst.assert_quantity("6.022e23 mol**-1", 6.022e23, "mol**-1")
 
+    # Units follow pint's precedence
+    tst.assert_quantity("1 m/s kg", 1, "kg*m/s")
+    tst.assert_quantity("1 kg (m/s)**2", 1, "kg*m**2/s**2")
+    tst.assert_quantity("1 m/s**-2 kg", 1, "kg*m*s**2")
+    tst.assert_quantity("1 m**2**3", 1, "m**8")
+    tst.assert_quantity("1 m/m", 1, "dimensionless")
+
+    # Spellings pint rewrites before looking up units
+    tst.assert_quantity("10 meter per second", 10, "m/s")
+    tst.assert_quantity("1 square meter", 1, "m**2")
+    tst.assert_quantity("2 meter squared", 2, "m**2")
+    tst.assert_quantity("1 cubic foot", 1, "ft**3")
+    tst.assert_quantity("3 sq ft", 3, "ft**2")
+    tst.assert_quantity("(4 kg per meter) kg per foot", 1.2192, "kg/ft")
+    tst.assert_syntax_error("3 meter per smoot")
+
 
 def test_loader():
     import test_pkg_standard_btu.mod_with_units
@@ -168,3 +185,757 @@ def test_standalone_scripts():
 
     out = subprocess.check_output([sys.executable, "-m", "unit_syntax", filename])
     assert out == b"15 meter\n"
+
+
+def test_unit_constants():
+    ust = UnitSourceTransform(None)
+    tst = UnitSourceTransformTester(ust)
+
+    # Each distinct unit string becomes a single module-level Unit
+    source = ust.transform_to_str("a = 1 meters\nb = [x meters for x in range(3)]")
+    assert source.count("_unit_syntax_u('meters')") == 1
+    assert "'meters'" not in source.split("\n", 1)[1]
+
+    # ... however it's spelled
+    source = ust.transform_to_str("a = 1 m/s\nb = 2 m s**-1\nc = 3 (m/s)")
+    assert source.count("_unit_syntax_u(") == 1
+
+    # ... which must come after any docstring and __future__ imports
+    tst.assert_quantity_exec(
+        """
+'''docstring'''
+from __future__ import annotations
+result = 2 meters
+""",
+        2,
+        "meters",
+    )
+
+
+def test_unit_conversions():
+    ust = UnitSourceTransform(None)
+    tst = UnitSourceTransformTester(ust)
+    Q = ust.ureg.Quantity
+
+    # A multiplicative conversion is a multiplication by a precomputed factor
+    source = ust.transform_to_str("a = (88 miles/hour) km/hour\nb = (0 degC) degF")
+    assert source.count("_unit_syntax_convert(") == 1
+    assert "1.609344" in source
+
+    # ... with the same result as having pint convert it
+    cases = [
+        ("(88 miles/hour) furlongs/fortnight", Q(88, "miles/hour")),
+        ("(0 degC) degF", Q(0, "degC")),
+        ("([1, 2] km) m", Q([1, 2], "km")),
+        ("(numpy.arange(3) km) m", Q(numpy.arange(3), "km")),
+        ("((1 m) km) mm", Q(Q(1, "m"), "km")),
+        ("(id(1 mm) m) km", Q(Q(1, "mm"), "m")),
+    ]
+    for code, quantity in cases:
+        units = code.rpartition(" ")[2]
+        expected = quantity.to(units)
+        result = tst.transform_eval(code)
+        assert result.units == expected.units
+        assert numpy.all(result.magnitude == expected.magnitude)
+
+    with pytest.raises(pint.DimensionalityError):
+        tst.transform_eval("(1 m) s")
+
+
+def test_unit_cache():
+    from unit_syntax.runtime import unit_parser
+
+    ureg = pint.UnitRegistry()
+    first = UnitSourceTransform(ureg)
+    second = UnitSourceTransform(ureg)
+
+    source = "a = 1 furlong\nb = (2 furlong) m\nc = 3 smoot\n"
+    with pytest.raises(SyntaxError):
+        first.transform(source)
+    assert (first.stats.unit_cache_hits, first.stats.unit_cache_misses) == (2, 8)
+
+    # Lookups made for another module with the same registry are reused
+    with pytest.raises(SyntaxError):
+        second.transform(source)
+    assert second.stats.unit_cache_hit_rate == 1.0
+
+    # ... until a definition changes
+    ureg.define("smoot = 67 inch")
+    env = second.injected_globals()
+    exec(compile(second.transform(source), "<test>", "exec"), env)
+    assert env["c"] == ureg.Quantity(3, "smoot")
+    assert second.stats.unit_cache_misses == 7
+
+    # Parsed units are shared too
+    assert unit_parser(ureg)("furlong") is env["_unit_syntax_u"]("furlong")
+
+
+def test_fold_constants():
+    source = """
+def f(x):
+    g = (9.81 m/s**2) * 2
+    return x * g + (x m/s**2) + (1 m) / (2 s**3) * (1 s), -(1 kg)
+def mismatched():
+    return (1 m) + (1 s)
+"""
+    folded = UnitSourceTransform(None, fold_constants=True)
+    plain = UnitSourceTransform(None)
+    code = folded.transform_to_str(source)
+    # Only the variable quantity is left to build on each call
+    assert code.count("_unit_syntax_lazy(") == 4
+    assert code.split("def f", 1)[1].count("_unit_syntax_q(") == 1
+    assert folded.cache_key(b"x") != plain.cache_key(b"x")
+
+    results = []
+    for ust in (folded, plain):
+        env = ust.injected_globals()
+        exec(compile(ust.transform(source), "<test>", "exec"), env)
+        results.append((env["f"](3), env["f"](4)))
+        # Errors still happen when the expression is used, every time
+        for _ in range(2):
+            with pytest.raises(pint.DimensionalityError):
+                env["mismatched"]()
+    assert results[0] == results[1]
+    (_, mass), (_, mass_again) = results[0]
+    assert mass is mass_again
+
+
+def test_check_dimensions():
+    source = """
+def f(d, t, k):
+    v = (d m) / (t s) + (3 km/hour)
+    w = k * ((d m) - (t cm)) ** 2
+    return v, w, 1 / (t s) * 2, (d m) / (t m), ((88 mph) km/hour) + (1 m/s)
+"""
+    checked = UnitSourceTransform(None, check_dimensions=True)
+    plain = UnitSourceTransform(None)
+    assert checked.transform_to_str(source).count("_unit_syntax_plain(") == 4
+    assert checked.cache_key(b"x") != plain.cache_key(b"x")
+
+    arguments = [
+        (3, 2, 5),
+        (numpy.array([1.0, 2.0]), 2, 5),
+        # Falls back to arithmetic on quantities
+        (plain.ureg.Quantity(3, "mm"), 2, 5),
+    ]
+    results = []
+    for ust in (checked, plain):
+        env = ust.injected_globals()
+        exec(compile(ust.transform(source), "<test>", "exec"), env)
+        results.append([env["f"](*args) for args in arguments])
+    for checked_result, plain_result in zip(*results):
+        for a, b in zip(checked_result, plain_result):
+            assert a.units == b.units
+            assert numpy.all(a.magnitude == b.magnitude)
+
+    # Sums that can never work fail at import time
+    with pytest.raises(SyntaxError) as exc:
+        checked.transform("x = 1\ny = [(x m) - (2 m/s) * 3]\n")
+    assert (exc.value.lineno, exc.value.offset) == (2, 6)
+    checked.transform("y = (x m) + z\n")
+
+
+STRIP_UNITS_SOURCE = """
+def simulate(steps, drag):
+    x = 0 m
+    v = 0 km/hour
+    dt = 0.01 s
+    for _ in range(steps):
+        a = (9.81 m/s**2) - (drag hertz) * v
+        v = v + a * dt
+        x = x + v * dt
+    return x, v
+
+def misc(d, t):
+    return [
+        (d m) / (t s) + (3 km/hour),
+        ((d ft) - (t cm)) ** 2 * 2,
+        1 / (t s),
+        (d m) / (t m),
+        ((88 mph) km/hour) + (1 m/s),
+        [1, 2] ft,
+        ((1 m) km) mm,
+    ]
+"""
+
+
+@pytest.mark.parametrize(
+    "options", [{}, {"check_dimensions": True, "fold_constants": True}]
+)
+def test_strip_units(options):
+    stripped = UnitSourceTransform(None, strip_units=True, **options)
+    full = UnitSourceTransform(None, **options)
+    assert stripped.cache_key(b"x") != full.cache_key(b"x")
+
+    envs = []
+    for ust in (stripped, full):
+        env = ust.injected_globals()
+        exec(compile(ust.transform(STRIP_UNITS_SOURCE), "<test>", "exec"), env)
+        envs.append(env)
+
+    # The same numbers, as magnitudes in base units
+    for name, args in [("simulate", (200, 0.1)), ("misc", (3, 2)), ("misc", (1.5, 4))]:
+        results = [env[name](*args) for env in envs]
+        for magnitude, quantity in zip(*results):
+            expected = quantity.to_base_units().magnitude
+            assert numpy.all(magnitude == pytest.approx(expected, rel=1e-12))
+
+    # Anything that can't be done on plain magnitudes is an error
+    with pytest.raises(SyntaxError, match="offset"):
+        stripped.transform("x = 20 degC")
+    with pytest.raises(SyntaxError, match="conversion"):
+        stripped.transform("x = (1 m) s")
+
+
+def test_strip_units_for_package(tmp_path):
+    import subprocess
+
+    pkg = tmp_path / "stripped_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text(
+        "import os\n"
+        "from unit_syntax import enable_units_for_package\n"
+        "enable_units_for_package(__name__, strip_units='STRIP' in os.environ)\n"
+    )
+    (pkg / "mod.py").write_text("def length():\n    return (3 km) + (2 m)\n")
+
+    repo_dir = os.path.dirname(TEST_DIR)
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+
+    def run(code="", path=tmp_path, **extra):
+        code += "\nimport stripped_pkg.mod\nprint(stripped_pkg.mod.length())"
+        extra["PYTHONPATH"] = os.pathsep.join([str(path), repo_dir])
+        return subprocess.check_output(
+            [sys.executable, "-c", code], env=dict(env, **extra)
+        )
+
+    assert run() == b"3.002 kilometer\n"
+    assert run(STRIP="1") == b"3002.0\n"
+
+    # Built ahead of time with the same option, a warm import doesn't transform
+    def compile_pkg(*args):
+        cmd = [sys.executable, "-m", "unit_syntax", "compile", "-q", *args, str(pkg)]
+        subprocess.check_call(cmd, env=dict(env, PYTHONPATH=repo_dir))
+
+    compile_pkg("--strip-units")
+    no_transform = (
+        "import unit_syntax.transform as t\nt.UnitSourceTransform.transform = None"
+    )
+    assert run(no_transform, STRIP="1") == b"3002.0\n"
+
+    # ... and transformed at build time the package has no units
+    out = tmp_path / "out"
+    compile_pkg("--strip-units", "--emit-source", str(out))
+    assert run(path=out, STRIP="1") == b"3002.0\n"
+    with pytest.raises(subprocess.CalledProcessError):
+        run(path=out)
+
+
+def test_package_options(tmp_path):
+    import subprocess
+
+    pkg = tmp_path / "options_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text(
+        "from unit_syntax import enable_units_for_package\n"
+        "enable_units_for_package(__name__, fold_constants=True, check_dimensions=True)\n"
+    )
+    (pkg / "folded.py").write_text("def g():\n    return (9.81 m/s**2)\n")
+    (pkg / "mismatch.py").write_text("def f(d, t):\n    return (d m) + (t s)\n")
+
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    env["PYTHONPATH"] = os.pathsep.join([str(tmp_path), os.path.dirname(TEST_DIR)])
+
+    def run(code):
+        return subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True
+        )
+
+    folded = run("from options_pkg.folded import g\nprint(g() is g())")
+    assert folded.stdout == b"True\n"
+    mismatch = run("import options_pkg.mismatch")
+    assert b"SyntaxError: Cannot add" in mismatch.stderr
+
+
+def test_plain_python_skips_unit_parser(monkeypatch):
+    import unit_syntax.transform
+
+    ust = UnitSourceTransform(None)
+    tst = UnitSourceTransformTester(ust)
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("units parser used for plain python")
+
+    with monkeypatch.context() as m:
+        m.setattr(unit_syntax.transform, "_parse_with_units", fail_parse)
+        assert tst.transform_exec("result = [x * 2 for x in range(3)]") == [0, 2, 4]
+
+    tst.assert_quantity("3 meters", 3, "meters")
+    assert ust.stats.native_parses == 1
+    assert ust.stats.unit_parses == 1
+
+
+def test_bytecode_cache(tmp_path):
+    import subprocess
+
+    pkg = tmp_path / "cached_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text(
+        "from unit_syntax import enable_units_for_package\n"
+        "enable_units_for_package(__name__)\n"
+    )
+    (pkg / "mod.py").write_text("def length():\n    return 3 meters\n")
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join([str(tmp_path), os.path.dirname(TEST_DIR)])
+
+    def run(code, *flags):
+        code += "\nimport cached_pkg.mod\nprint(cached_pkg.mod.length())"
+        return subprocess.check_output([sys.executable, *flags, "-c", code], env=env)
+
+    assert run("") == b"3 meter\n"
+    cache_tag = sys.implementation.cache_tag
+    assert (pkg / "__pycache__" / f"mod.{cache_tag}.unit-syntax.pyc").exists()
+
+    # A warm import doesn't transform anything
+    no_transform = (
+        "import unit_syntax.transform as t\nt.UnitSourceTransform.transform = None"
+    )
+    assert run(no_transform) == b"3 meter\n"
+
+    # ... until the source changes
+    (pkg / "mod.py").write_text("def length():\n    return 4 meters\n")
+    assert run("") == b"4 meter\n"
+
+    # Each optimization level has its own entry, as with pyc files
+    (pkg / "mod.py").write_text(
+        "def length():\n    assert False, 'asserts kept'\n    return 5 meters\n"
+    )
+    assert run("", "-O") == b"5 meter\n"
+    assert (pkg / "__pycache__" / f"mod.{cache_tag}.opt-1.unit-syntax.pyc").exists()
+    with pytest.raises(subprocess.CalledProcessError):
+        run("")
+    assert run("", "-O") == b"5 meter\n"
+
+    # ... and `sys.pycache_prefix` is honoured
+    prefix = tmp_path / "prefix"
+    assert run("", "-X", f"pycache_prefix={prefix}", "-O") == b"5 meter\n"
+    assert list(prefix.rglob(f"mod.{cache_tag}.opt-1.unit-syntax.pyc"))
+
+
+def test_registry_fingerprint():
+    import subprocess
+
+    fingerprint = UnitSourceTransform(pint.UnitRegistry()).registry_fingerprint()
+
+    # Same definitions, same fingerprint, even in another process
+    assert (
+        UnitSourceTransform(pint.UnitRegistry()).registry_fingerprint() == fingerprint
+    )
+    out = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import pint\n"
+            "from unit_syntax.transform import UnitSourceTransform\n"
+            "print(UnitSourceTransform(pint.UnitRegistry()).registry_fingerprint())",
+        ],
+        env=dict(os.environ, PYTHONPATH=os.path.dirname(TEST_DIR)),
+    )
+    assert out.decode().strip() == fingerprint
+
+    # Definitions added after the transform is created are picked up
+    ureg = pint.UnitRegistry()
+    ust = UnitSourceTransform(ureg)
+    key = ust.cache_key(b"x = 1 BTU")
+    assert ust.registry_fingerprint() == fingerprint
+    ureg.load_definitions(["BTU = Btu_it"])
+    assert ust.registry_fingerprint() != fingerprint
+    assert ust.cache_key(b"x = 1 BTU") != key
+
+
+def test_cache_key_covers_code(monkeypatch):
+    import unit_syntax.transform
+
+    ust = UnitSourceTransform(None)
+    key = ust.cache_key(b"x = 1 m")
+    # e.g. an unreleased change to the transform
+    monkeypatch.setattr(unit_syntax.transform, "_code_digest", lambda: "changed")
+    assert ust.cache_key(b"x = 1 m") != key
+
+
+def test_compile_command(tmp_path):
+    import subprocess
+
+    pkg = tmp_path / "precompiled_pkg"
+    (pkg / "sub").mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "mod.py").write_text("def length():\n    return 3 meters\n")
+    (pkg / "sub" / "__init__.py").write_text("")
+    (pkg / "sub" / "other.py").write_text("x = 2 seconds\n")
+    plain = '"""Docstring"""\nfrom __future__ import annotations\n\nx = 2  # comment\n'
+    (pkg / "sub" / "plain.py").write_text(plain)
+    latin1 = "# -*- coding: latin-1 -*-\nname = 'café'\n"
+    (pkg / "sub" / "latin1.py").write_bytes(latin1.encode("latin-1"))
+    (pkg / "sub" / "latin1_units.py").write_bytes(
+        (latin1 + "x = 2 seconds\n").encode("latin-1")
+    )
+
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(TEST_DIR))
+
+    def compile_pkg(*args):
+        cmd = [sys.executable, "-m", "unit_syntax", "compile", *args, str(pkg)]
+        return subprocess.check_output(cmd, env=env, cwd=tmp_path).decode()
+
+    out = compile_pkg()
+    assert "mod.py" in out and "other.py" in out and "latin1_units.py" in out
+    cache_tag = sys.implementation.cache_tag
+    assert (pkg / "__pycache__" / f"mod.{cache_tag}.unit-syntax.pyc").exists()
+    assert (pkg / "sub" / "__pycache__" / f"other.{cache_tag}.unit-syntax.pyc").exists()
+
+    # Unchanged files are skipped
+    assert compile_pkg() == ""
+
+    compile_pkg("--emit-source", str(tmp_path / "out"), "-j", "1")
+    emitted = (tmp_path / "out" / "precompiled_pkg" / "sub" / "other.py").read_text()
+    assert "_unit_syntax_q(2, " in emitted
+    # Modules without units are copied as written, plus the runtime setup
+    from unit_syntax.transform import _STANDALONE_PROLOGUE
+
+    emitted = (tmp_path / "out" / "precompiled_pkg" / "sub" / "plain.py").read_text()
+    header, emitted = emitted.split("\n", 1)
+    assert header.startswith("# Generated by unit-syntax from plain.py")
+    doc, future, body = plain.split("\n", 2)
+    assert emitted == "\n".join([doc, future, _STANDALONE_PROLOGUE.strip(), body])
+
+    # Emitted files are UTF-8, whatever the source's encoding
+    for name in ["latin1.py", "latin1_units.py"]:
+        path = tmp_path / "out" / "precompiled_pkg" / "sub" / name
+        env = {"__name__": f"precompiled_pkg.sub.{path.stem}"}
+        exec(compile(path.read_bytes(), str(path), "exec"), env)
+        assert env["name"] == "café"
+
+
+def test_compile_command_relative_path(tmp_path):
+    import subprocess
+
+    build = tmp_path / "build"
+    pkg = build / "src" / "relpkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text(
+        "from unit_syntax import enable_units_for_package\n"
+        "enable_units_for_package(__name__)\n"
+    )
+    (pkg / "mod.py").write_text("def f():\n    return 3 meters\n")
+
+    repo_dir = os.path.dirname(TEST_DIR)
+    subprocess.check_call(
+        [sys.executable, "-m", "unit_syntax", "compile", "-q", "src/relpkg"],
+        env=dict(os.environ, PYTHONPATH=repo_dir),
+        cwd=build,
+    )
+
+    # Moved elsewhere, as when the cache is built in CI, the code names the
+    # file it was loaded from
+    deployed = tmp_path / "deployed"
+    (build / "src").rename(deployed)
+    out = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import unit_syntax.transform as t\n"
+            "t.UnitSourceTransform.transform = None\n"
+            "import relpkg.mod\n"
+            "print(relpkg.mod.f.__code__.co_filename)",
+        ],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join([str(deployed), repo_dir])),
+        cwd="/",
+    )
+    assert out.decode().strip() == str(deployed / "relpkg" / "mod.py")
+
+
+def test_transpiled_package(tmp_path):
+    import subprocess
+
+    repo_dir = os.path.dirname(TEST_DIR)
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "unit_syntax",
+            "compile",
+            "--emit-source",
+            str(tmp_path),
+            "--registry",
+            "test_pkg_intl_btu:ureg",
+            os.path.join(TEST_DIR, "test_pkg_intl_btu"),
+        ],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join([TEST_DIR, repo_dir])),
+    )
+
+    # The emitted package is plain python and uses its own registry, without
+    # loading the units parser
+    out = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "import test_pkg_intl_btu.mod_with_units as m\n"
+            "assert 'unit_syntax.transform' not in sys.modules\n"
+            "print(m.btu().to('Btu_it').magnitude)",
+        ],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join([str(tmp_path), repo_dir])),
+    )
+    # The standard BTU differs from Btu_it by ~1.4e-7
+    assert float(out) == pytest.approx(1, rel=1e-9)
+
+
+def test_import_is_cheap():
+    import subprocess
+
+    # Neither the runtime nor the import hook should need the generated parser
+    # (or pegen) until there is a source to transform
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import unit_syntax, unit_syntax.transform, unit_syntax.runtime",
+        ],
+        env=dict(os.environ, PYTHONPATH=os.path.dirname(TEST_DIR)),
+        check=True,
+        capture_output=True,
+    )
+    imported = {
+        line.rsplit("|", 1)[1].strip()
+        for line in out.stderr.decode().splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+    assert "unit_syntax.transform" in imported
+    assert "unit_syntax.parser" not in imported
+    assert not any(mod.split(".")[0] == "pegen" for mod in imported)
+
+
+@pytest.fixture
+def ipython_shell():
+    from IPython.core.interactiveshell import InteractiveShell
+
+    shell = InteractiveShell.instance()
+    shell.extension_manager.load_extension("unit_syntax")
+    yield shell
+    shell.extension_manager.unload_extension("unit_syntax")
+
+
+def test_ipython_cell_cache(ipython_shell):
+    ipython_shell.run_line_magic("unit_syntax_cache", "clear")
+
+    cell = "speed = (3 meters) / (2 seconds)"
+    for _ in range(3):
+        assert ipython_shell.run_cell(cell).success
+    assert_quantity_eq(ipython_shell.user_ns["speed"], 1.5, "m/s")
+
+    info = ipython_shell.run_line_magic("unit_syntax_cache", "")
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+    # Each run gets a tree of its own, which IPython may modify
+    from unit_syntax.ipython import transform_cell
+
+    first, second = transform_cell(cell), transform_cell(cell)
+    assert first is not second
+    assert ast.dump(first, include_attributes=True) == ast.dump(
+        second, include_attributes=True
+    )
+
+
+def test_ipython_traceback_lines(ipython_shell):
+    cell = "x = 1 meters\n\n# a comment\ny = x + (1 second)\n"
+    result = ipython_shell.run_cell(cell)
+    assert isinstance(result.error_in_exec, pint.DimensionalityError)
+
+    # The failing line is reported as written in the cell
+    tb = result.error_in_exec.__traceback__
+    cell_lines = []
+    while tb is not None:
+        if "ipython-input" in tb.tb_frame.f_code.co_filename:
+            cell_lines.append(tb.tb_lineno)
+        tb = tb.tb_next
+    assert cell_lines == [4]
+
+
+def test_ipython_unload():
+    from IPython.core.interactiveshell import InteractiveShell
+
+    shell = InteractiveShell.instance()
+    shell.extension_manager.load_extension("unit_syntax")
+    shell.extension_manager.unload_extension("unit_syntax")
+    assert shell.find_line_magic("unit_syntax_cache") is None
+    assert not shell.run_cell("x = 1 meters").success
+
+
+def test_unclosed_bracket_is_syntax_error():
+    with pytest.raises(SyntaxError):
+        UnitSourceTransform(None).transform("x = (1 meter\n")
+
+
+def test_statement_level_parsing():
+    ust = UnitSourceTransform(None)
+    source = """\
+import math
+
+@staticmethod
+# a comment
+def f(x):
+    return x meters
+
+try:
+    y = f(2)
+except ValueError:
+    pass
+else:
+    z = 3 seconds
+"""
+    tree = ust.transform(source)
+    assert ust.stats.unit_statements == 2
+    fn = next(s for s in tree.body if isinstance(s, ast.FunctionDef))
+    assert (fn.lineno, fn.body[0].lineno) == (5, 6)
+    assert tree.body[-1].orelse[0].lineno == 13
+
+    with pytest.raises(SyntaxError) as exc:
+        ust.transform(source + "w = 1 meters +\n")
+    assert exc.value.lineno == 14
+
+
+def test_parallel_parsing(monkeypatch):
+    import unit_syntax.transform
+
+    monkeypatch.setattr(unit_syntax.transform, "_PARALLEL_MIN_CHARS", 0)
+    monkeypatch.setattr(unit_syntax.transform.os, "cpu_count", lambda: 2)
+
+    source = "import math\n" + "".join(
+        f"x{i} = ({i} meters/second, math.pi * 2)\ny{i} = {i} kg\n" for i in range(20)
+    )
+    serial = UnitSourceTransform(None)
+    parallel = UnitSourceTransform(None, parallel=True)
+    assert ast.dump(parallel.transform(source), include_attributes=True) == ast.dump(
+        serial.transform(source), include_attributes=True
+    )
+    assert (parallel.stats.parallel_parses, serial.stats.parallel_parses) == (1, 0)
+
+    with pytest.raises(SyntaxError) as exc:
+        parallel.transform(source + "z = 1 meters +\n")
+    assert exc.value.lineno == 42
+
+
+def test_parallel_parsing_main_script(tmp_path):
+    import subprocess
+
+    # Workers don't run the main script again
+    script = tmp_path / "script.py"
+    script.write_text(
+        "import unit_syntax.transform as t\n"
+        "print('started')\n"
+        "t._PARALLEL_MIN_CHARS = 0\n"
+        "t.os.cpu_count = lambda: 2\n"
+        "ust = t.UnitSourceTransform(None, parallel=True)\n"
+        "ust.transform('x = 1 meters\\ny = 2 kg\\n')\n"
+        "assert ust.stats.parallel_parses == 1\n"
+    )
+    out = subprocess.check_output(
+        [sys.executable, str(script)],
+        env=dict(os.environ, PYTHONPATH=os.path.dirname(TEST_DIR)),
+    )
+    assert out == b"started\n"
+
+
+def test_parser_error_after_unit_statement():
+    from unit_syntax.parser import parse_string
+
+    # The error pass restarts at the failed top-level statement, rather than
+    # tripping over the valid unit expression before it.
+    with pytest.raises(SyntaxError) as exc:
+        parse_string("x = 1 meter\ny = 2 kg *\n", mode="file")
+    assert exc.value.lineno == 2
+
+    # Likewise for statements nested in the failed one
+    with pytest.raises(SyntaxError) as exc:
+        parse_string("def f():\n    x = 1 meter\n    y = 2 kg *\n", mode="file")
+    assert exc.value.lineno == 3
+
+    # A statement that only parsed by leaving out what follows it is parsed
+    # again, to report the error in the part that was left out
+    with pytest.raises(SyntaxError, match="expected an indented block") as exc:
+        parse_string("if x:\n    y = 1 meter\nelif y:\npass\n", mode="file")
+    assert exc.value.lineno == 4
+
+
+def test_parser_defers_tokenizer_errors():
+    from unit_syntax.parser import parse_string
+
+    # The unclosed bracket is only reported if the parser gets that far
+    with pytest.raises(SyntaxError) as exc:
+        parse_string("x = 1 meter +\ny = (\n", mode="file")
+    assert exc.value.lineno == 1
+    with pytest.raises(tokenize.TokenError):
+        parse_string("x = 1 meter\ny = (\n", mode="file")
+
+
+def test_token_buffer_release():
+    from unit_syntax.parser_runtime import TokenBuffer
+
+    source = "x = 1\ny = (2,\n     3)\nz = 4\n"
+    tokens = TokenBuffer(tokenize.generate_tokens(StringIO(source).readline))
+    while tokens.getnext().string != "y":
+        pass
+    tokens.reset(tokens.mark() - 1)
+    tokens.release(tokens.mark())
+
+    # Only what the tokens from the mark on need is kept
+    assert tokens._source_lines.count(None) == 1
+    assert sorted(tokens._lines) == [2, 3, 4, 5]
+    assert tokens.get_lines([2])[0].startswith("y = (2,\n")
+    assert tokens.getnext().line.startswith("y = (2,\n")
+
+    tokens.reset(tokens.mark() + 7)
+    tokens.release(tokens.mark())
+    assert tokens.getnext().line == "z = 4\n"
+    assert sorted(tokens._lines) == [4, 5]
+    assert tokens._source_lines[:-2] == [None] * (len(tokens._source_lines) - 2)
+
+
+def test_parser_profile(tmp_path):
+    import json
+    import subprocess
+    from unit_syntax.parser import parse_string
+    from unit_syntax.parser_runtime import ParserProfile
+
+    source = "x = 1 meter\ny = [(2 kg) * x for x in z]\n"
+    profile = ParserProfile()
+    tree = parse_string(source, mode="file", profile=profile)
+    assert ast.dump(tree) == ast.dump(parse_string(source, mode="file"))
+
+    units = profile.rules["units"]
+    assert (units.calls, units.memo_misses, units.failures) == (2, 2, 0)
+    expression = profile.rules["expression"]
+    assert expression.calls == expression.memo_hits + expression.memo_misses
+    report = StringIO()
+    profile.report(report, sort="failures", limit=5)
+    assert len(report.getvalue().splitlines()) == 6
+
+    # Or for every parse in a process, written out at exit
+    out = tmp_path / "profile.json"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-c",
+            "from unit_syntax.parser import parse_string\n"
+            f"parse_string({source!r}, mode='file')",
+        ],
+        env=dict(
+            os.environ,
+            PYTHONPATH=os.path.dirname(TEST_DIR),
+            UNIT_SYNTAX_PROFILE=str(out),
+        ),
+    )
+    assert json.loads(out.read_text())["units"]["calls"] == 2
@@ -2,3 +2,19 @@ import pint
 
 from .ipython import load_ipython_extension, unload_ipython_extension
 from .import_hook import enable_units_for_package
+
+
+def __getattr__(name: str):
+    # Read from the package metadata on first use, which would otherwise cost
+    # every import of unit_syntax a scan of sys.path
+    if name == "__version__":
+        import importlib.metadata
+
+        try:
+            version = importlib.metadata.version("unit-syntax")
+        except importlib.metadata.PackageNotFoundError:
+            # e.g. run from a source checkout
+            version = "0+unknown"
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
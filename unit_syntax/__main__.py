@@ -1,9 +1,18 @@
 import sys
-import import_transforms
-from .transform import UnitSourceTransform
+
+USAGE = """usage: python -m unit_syntax <script.py>
+       python -m unit_syntax compile [options] <path>..."""
+
+if len(sys.argv) >= 2 and sys.argv[1] == "compile":
+    from .compileall import main
+
+    sys.exit(main(sys.argv[2:]))
 
 if len(sys.argv) < 2:
-    sys.exit("usage: python -m unit_syntax <script.py>")
+    sys.exit(USAGE)
+
+import import_transforms
+from .transform import UnitSourceTransform
 
 transform = UnitSourceTransform(None)
 import_transforms.run_script(sys.argv[1], transform)
@@ -0,0 +1,85 @@
+"""
+On-disk cache of transformed code objects.
+
+Entries live wherever CPython would put the source's bytecode (usually
+`__pycache__`, or under `sys.pycache_prefix`), with one file per
+optimization level as for pyc files, but under their own tag so they are
+never confused with (or clobbered by) the pyc files CPython writes for
+untransformed imports of the same source.  Each entry is
+the 16 byte cache key from `UnitSourceTransform.cache_key` followed by the
+marshalled code object; an entry whose key doesn't match is ignored.
+"""
+import importlib.util
+import marshal
+import os
+import sys
+from types import CodeType
+
+CACHE_TAG = "unit-syntax"
+
+_KEY_SIZE = 16
+
+
+def cache_from_source(path: str, optimize: int = -1) -> str | None:
+    """
+    The cache file for the source at `path`, for code compiled at the
+    `optimize` level (-1 meaning the interpreter's), or None if caching is
+    disabled
+    """
+    if optimize == -1:
+        optimize = sys.flags.optimize
+    try:
+        pyc = importlib.util.cache_from_source(
+            path, optimization="" if optimize == 0 else optimize
+        )
+    except NotImplementedError:
+        return None
+    return f"{pyc.removesuffix('.pyc')}.{CACHE_TAG}.pyc"
+
+
+def read_cache(cache_path: str | None, key: bytes) -> CodeType | None:
+    if cache_path is None:
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if data[:_KEY_SIZE] != key:
+        return None
+    try:
+        return marshal.loads(memoryview(data)[_KEY_SIZE:])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def read_cache_key(cache_path: str) -> bytes | None:
+    "The key of the cache entry at `cache_path`, if there is one"
+    try:
+        with open(cache_path, "rb") as f:
+            return f.read(_KEY_SIZE)
+    except OSError:
+        return None
+
+
+def write_cache(cache_path: str | None, key: bytes, code: CodeType, force=False):
+    """
+    Write a cache entry, silently giving up if that isn't possible.  Unless
+    `force` is set nothing is written when bytecode writing is disabled.
+    """
+    if cache_path is None or (sys.dont_write_bytecode and not force):
+        return
+    assert len(key) == _KEY_SIZE
+    data = key + marshal.dumps(code)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        # Atomic, so concurrent importers never see a partial entry
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
@@ -0,0 +1,270 @@
+"""
+Transform and compile a tree of python-with-units ahead of time, like the
+standard library's `compileall`:
+
+    $ python -m unit_syntax compile [-j N] [--registry module:attr] path...
+
+By default this fills the same `__pycache__` entries the import hook reads,
+so imports never need to run the units parser.  The registry and options
+such as `--strip-units` must match the package's `enable_units_for_package`
+call, or the entries are never used.  With `--emit-source DIR` it
+instead writes a copy of the tree to DIR with every module replaced by
+standard Python.  Those modules only need `unit_syntax.runtime`, so a wheel
+built from DIR never loads the parser.
+
+Files are spread over a process pool.  A file is skipped when its output is
+newer than the source and was produced from the same source, registry,
+options and unit-syntax code.
+"""
+import argparse
+import concurrent.futures
+import importlib
+import importlib.util
+import os
+import re
+import shutil
+import sys
+import pint
+from .cache import cache_from_source, read_cache_key, write_cache
+from .transform import UnitSourceTransform
+
+# First line of each file written by --emit-source, identifying its input
+_EMITTED_HEADER = "# Generated by unit-syntax from {source}, key {key}\n"
+
+# A PEP 263 encoding declaration, see `_declare_utf8`
+_CODING_COOKIE = re.compile(r"^([ \t\f]*#.*?coding[:=][ \t]*)[-\w.]+", re.ASCII)
+
+
+def _load_registry(spec: str | None) -> pint.UnitRegistry | None:
+    if spec is None:
+        return None
+    module, sep, attr = spec.partition(":")
+    if not sep:
+        raise ValueError(
+            f"registry should be given as 'module:attribute', was {spec!r}"
+        )
+    return getattr(importlib.import_module(module), attr)
+
+
+def _is_newer(path: str, than: str) -> bool:
+    try:
+        return os.stat(path).st_mtime >= os.stat(than).st_mtime
+    except OSError:
+        return False
+
+
+def _emitted_key(path: str) -> bytes | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            header = f.readline()
+    except OSError:
+        return None
+    _, sep, key = header.rpartition(", key ")
+    if not sep:
+        return None
+    try:
+        return bytes.fromhex(key)
+    except ValueError:
+        return None
+
+
+def _declare_utf8(text: str) -> str:
+    "Point an encoding declaration at the top of `text` at UTF-8, as it's written"
+    lines = text.split("\n", 2)
+    for i, line in enumerate(lines[:2]):
+        lines[i] = _CODING_COOKIE.sub(r"\g<1>utf-8", line)
+    return "\n".join(lines)
+
+
+def _output_path(source_path: str, root: str, emit_source: str | None) -> str | None:
+    if emit_source is None:
+        return cache_from_source(source_path)
+    return os.path.join(emit_source, os.path.relpath(source_path, root))
+
+
+def compile_file(
+    transform: UnitSourceTransform,
+    source_path: str,
+    output_path: str | None,
+    emit_source: bool = False,
+    force: bool = False,
+) -> bool:
+    """
+    Transform `source_path`, writing the result to `output_path`.  Returns
+    False if the output was already up to date.
+    """
+    if output_path is None:
+        return False
+    with open(source_path, "rb") as f:
+        data = f.read()
+    key = transform.cache_key(data)
+
+    if not force and _is_newer(output_path, source_path):
+        existing = (
+            _emitted_key(output_path) if emit_source else read_cache_key(output_path)
+        )
+        if existing == key:
+            return False
+
+    source = importlib.util.decode_source(data)
+    if emit_source:
+        header = _EMITTED_HEADER.format(
+            source=os.path.basename(source_path), key=key.hex()
+        )
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        # A module without units is copied as written, encoding declaration
+        # included
+        text = _declare_utf8(transform.transform_to_str(source, standalone=True))
+        if not text.endswith("\n"):
+            text += "\n"
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(header + text)
+    else:
+        tree = transform.transform(source)
+        # At the level `_output_path` named the cache entry for
+        code = compile(
+            tree,
+            os.path.abspath(source_path),
+            mode="exec",
+            dont_inherit=True,
+            optimize=sys.flags.optimize,
+        )
+        write_cache(output_path, key, code, force=True)
+    return True
+
+
+def _find_files(path: str):
+    "Yields (file_path, root) pairs, where `root` is the top of the tree"
+    if not os.path.isdir(path):
+        yield path, os.path.dirname(os.path.abspath(path))
+        return
+    root = os.path.dirname(os.path.abspath(path).rstrip(os.sep))
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        for filename in sorted(filenames):
+            yield os.path.join(dirpath, filename), root
+
+
+def _copy_if_newer(path: str, output_path: str):
+    if _is_newer(output_path, path):
+        return
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    shutil.copy2(path, output_path)
+
+
+_WORKER_TRANSFORM: UnitSourceTransform | None = None
+
+
+def _init_worker(registry: str | None, options: dict[str, bool]):
+    global _WORKER_TRANSFORM
+    _WORKER_TRANSFORM = UnitSourceTransform(_load_registry(registry), **options)
+
+
+def _compile_in_worker(args) -> tuple[str, bool | str]:
+    source_path = args[0]
+    try:
+        return source_path, compile_file(_WORKER_TRANSFORM, *args)
+    except (SyntaxError, UnicodeDecodeError, OSError) as e:
+        return source_path, f"{type(e).__name__}: {e}"
+
+
+def compile_paths(
+    paths: list[str],
+    registry: str | None = None,
+    emit_source: str | None = None,
+    workers: int | None = None,
+    force: bool = False,
+    quiet: bool = False,
+    **options: bool,
+) -> bool:
+    """
+    Compile every module under `paths`, returning False if any failed.
+    `registry` names the UnitRegistry the modules use, as "module:attribute",
+    and `options` are the `UnitSourceTransform` options they're enabled with.
+    """
+    jobs = []
+    for path in paths:
+        for file_path, root in _find_files(path):
+            output_path = _output_path(file_path, root, emit_source)
+            if file_path.endswith(".py"):
+                jobs.append((file_path, output_path, emit_source is not None, force))
+            elif emit_source is not None:
+                # Package data etc. is needed for the copy to be usable
+                _copy_if_newer(file_path, output_path)
+
+    if workers == 1 or len(jobs) <= 1:
+        _init_worker(registry, options)
+        results = map(_compile_in_worker, jobs)
+        pool = None
+    else:
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(registry, options)
+        )
+        results = pool.map(_compile_in_worker, jobs, chunksize=4)
+
+    success = True
+    try:
+        for source_path, result in results:
+            if isinstance(result, str):
+                print(f"*** Error compiling {source_path}: {result}", file=sys.stderr)
+                success = False
+            elif result and not quiet:
+                print(f"Compiling {source_path!r}...")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return success
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m unit_syntax compile",
+        description="Transform and compile python-with-units ahead of time",
+    )
+    parser.add_argument("paths", nargs="+", help="files or package directories")
+    parser.add_argument(
+        "--registry",
+        help="the UnitRegistry the code is enabled with, as 'module:attribute'",
+    )
+    parser.add_argument(
+        "--emit-source",
+        metavar="DIR",
+        help="write transformed python source under DIR instead of bytecode",
+    )
+    for option in ("strip_units", "fold_constants", "check_dimensions"):
+        parser.add_argument(
+            f"--{option.replace('_', '-')}",
+            action="store_true",
+            help=f"transform as with enable_units_for_package({option}=True)",
+        )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "-f", "--force", action="store_true", help="rebuild even if up to date"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    try:
+        # Fail early, rather than in every worker
+        _load_registry(args.registry)
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error(f"can't load registry {args.registry!r}: {e}")
+
+    ok = compile_paths(
+        args.paths,
+        registry=args.registry,
+        emit_source=args.emit_source,
+        workers=args.workers,
+        force=args.force,
+        quiet=args.quiet,
+        strip_units=args.strip_units,
+        fold_constants=args.fold_constants,
+        check_dimensions=args.check_dimensions,
+    )
+    return 0 if ok else 1
@@ -0,0 +1,223 @@
+"""
+Static dimensional analysis of transformed code, see `DimensionChecker`.
+"""
+import ast
+import dataclasses
+from typing import Callable
+
+import pint
+
+_ERASED_BINOPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow)
+
+
+@dataclasses.dataclass
+class _Inferred:
+    # A quantity of 1 in the units pint would give the expression, or None
+    # for a plain number
+    unit: pint.Quantity | None
+    # The expression's magnitude in those units as plain arithmetic, or None
+    # if that can't be done safely
+    magnitude: ast.expr | None
+    # Names whose values must be plain numbers for `magnitude` to be right
+    values: list[str]
+
+
+def _is_name_or_number(node: ast.expr) -> bool:
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        node = node.operand
+    if isinstance(node, ast.Constant):
+        return type(node.value) in (int, float, complex)
+    return isinstance(node, ast.Name)
+
+
+def _dimension_error(message: str, node: ast.expr) -> SyntaxError:
+    return SyntaxError(
+        message,
+        (
+            None,
+            node.lineno,
+            node.col_offset + 1,
+            None,
+            node.end_lineno,
+            node.end_col_offset + 1,
+        ),
+    )
+
+
+class DimensionChecker(ast.NodeTransformer):
+    """
+    Follows units through arithmetic on unit expressions in transformed code,
+    e.g. `(d m) / (t s) + (3 km/hour)`, and raises a `SyntaxError` for a sum
+    or difference whose dimensions can never match.  Without this, it's a
+    `pint.DimensionalityError` when the code runs.
+
+    Where every operand is a unit expression of a name or number, or a number,
+    the arithmetic is instead done on the magnitudes in the units pint would
+    give each step, and only the result is made into a quantity.  As a unit
+    expression's value could itself be a quantity, the code checks the names
+    hold plain numbers or numpy arrays first, and otherwise does the original
+    arithmetic on quantities.  The result is the same either way.
+    """
+
+    def __init__(
+        self,
+        ureg: pint.UnitRegistry,
+        unit_strings: dict[str, str],
+        unit_constant: Callable[[pint.Unit], ast.Name],
+    ):
+        self.ureg = ureg
+        # Unit constant name -> units it holds
+        self.unit_strings = unit_strings
+        self.unit_constant = unit_constant
+        # Results of `infer`, as `visit` asks again for each subexpression
+        # of one whose units aren't known
+        self._inferred: dict[ast.expr, _Inferred | None] = {}
+        # Unit string -> a quantity of 1 in those units
+        self._unit_quantities: dict[str, pint.Quantity] = {}
+
+    def visit(self, node):
+        if isinstance(node, (ast.BinOp, ast.UnaryOp)):
+            inferred = self.infer(node)
+            if (
+                inferred is not None
+                and inferred.unit is not None
+                and inferred.magnitude is not None
+            ):
+                return ast.copy_location(self.erased(node, inferred), node)
+        return super().visit(node)
+
+    def erased(self, node: ast.expr, inferred: _Inferred) -> ast.expr:
+        quantity = ast.Call(
+            ast.Name(id="_unit_syntax_q", ctx=ast.Load()),
+            args=[inferred.magnitude, self.unit_constant(inferred.unit.units)],
+            keywords=[],
+        )
+        if not inferred.values:
+            return quantity
+        return ast.IfExp(
+            test=ast.Call(
+                ast.Name(id="_unit_syntax_plain", ctx=ast.Load()),
+                args=[
+                    ast.Name(id=name, ctx=ast.Load())
+                    for name in dict.fromkeys(inferred.values)
+                ],
+                keywords=[],
+            ),
+            body=quantity,
+            orelse=node,
+        )
+
+    def infer(self, node: ast.expr) -> _Inferred | None:
+        "The units of `node`, or None if they aren't known statically"
+        try:
+            return self._inferred[node]
+        except KeyError:
+            pass
+        inferred = self._inferred[node] = self._infer(node)
+        return inferred
+
+    def _infer(self, node: ast.expr) -> _Inferred | None:
+        if isinstance(node, ast.Constant):
+            if type(node.value) in (int, float, complex):
+                return _Inferred(None, node, [])
+            return None
+        if isinstance(node, ast.Call):
+            return self.infer_unit_expr(node)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            operand = self.infer(node.operand)
+            if operand is None:
+                return None
+            return _Inferred(
+                operand.unit,
+                operand.magnitude and ast.UnaryOp(node.op, operand.magnitude),
+                operand.values,
+            )
+        if isinstance(node, ast.BinOp) and isinstance(node.op, _ERASED_BINOPS):
+            # Both sides are checked, even if one is unknown
+            left = self.infer(node.left)
+            right = self.infer(node.right)
+            if left is None or right is None:
+                return None
+            return self.infer_binop(node, left, right)
+        return None
+
+    def infer_unit_expr(self, node: ast.Call) -> _Inferred | None:
+        func = node.func
+        if not isinstance(func, ast.Name) or func.id not in (
+            "_unit_syntax_q",
+            "_unit_syntax_convert",
+        ):
+            return None
+        value, units = node.args[0], node.args[-1]
+        units = self.unit_strings.get(getattr(units, "id", None))
+        if units is None:
+            return None
+        unit = self._unit_quantities.get(units)
+        if unit is None:
+            unit = self._unit_quantities[units] = self.ureg.Quantity(1, units)
+        if not unit._is_multiplicative:
+            return None
+
+        magnitude = None
+        if _is_name_or_number(value):
+            magnitude = value
+            if func.id == "_unit_syntax_convert":
+                magnitude = ast.BinOp(value, ast.Mult(), node.args[2])
+        values = [value.id] if isinstance(value, ast.Name) else []
+        return _Inferred(unit, magnitude, values)
+
+    def infer_binop(
+        self, node: ast.BinOp, left: _Inferred, right: _Inferred
+    ) -> _Inferred | None:
+        values = left.values + right.values
+        magnitude = None
+        if left.magnitude is not None and right.magnitude is not None:
+            magnitude = ast.BinOp(left.magnitude, node.op, right.magnitude)
+
+        if isinstance(node.op, (ast.Add, ast.Sub)):
+            if left.unit is None or right.unit is None:
+                # pint allows e.g. adding zero, or a number to a dimensionless
+                # quantity
+                return None
+            if left.unit.dimensionality != right.unit.dimensionality:
+                verb = "add" if isinstance(node.op, ast.Add) else "subtract"
+                raise _dimension_error(
+                    f"Cannot {verb} '{right.unit.units}' ({right.unit.dimensionality})"
+                    f" and '{left.unit.units}' ({left.unit.dimensionality})",
+                    node,
+                )
+            # pint converts the right side to the left's units
+            if magnitude is not None and left.unit.units != right.unit.units:
+                factor = right.unit.to(left.unit.units).magnitude
+                if type(factor) not in (int, float):
+                    return None
+                magnitude.right = ast.BinOp(
+                    right.magnitude, ast.Mult(), ast.Constant(value=factor)
+                )
+            return _Inferred(left.unit, magnitude, values)
+
+        if isinstance(node.op, ast.Pow):
+            # Only a constant exponent gives units known statically
+            if left.unit is None or right.unit is not None:
+                return None
+            if not isinstance(right.magnitude, ast.Constant):
+                return None
+            unit = left.unit**right.magnitude.value
+        else:
+            unit = _apply(node.op, left.unit, right.unit)
+            if unit is None:
+                return _Inferred(None, magnitude, values)
+        # e.g. a registry that simplifies units after each multiplication,
+        # which scales the magnitude too
+        if unit.magnitude != 1:
+            magnitude = None
+        return _Inferred(unit, magnitude, values)
+
+
+def _apply(op: ast.operator, left, right):
+    "Multiply or divide units, with None for a plain number"
+    if left is None and right is None:
+        return None
+    left = 1 if left is None else left
+    right = 1 if right is None else right
+    return left * right if isinstance(op, ast.Mult) else left / right
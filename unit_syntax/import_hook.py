@@ -1,21 +1,166 @@
+import _imp
+import fnmatch
+import importlib.abc
+import importlib.util
+import logging
+import re
+import sys
+import types
+import typing
 import pint
-from .transform import UnitSourceTransform
+from . import runtime
+from .cache import cache_from_source, read_cache, write_cache
 
+if typing.TYPE_CHECKING:
+    from .transform import UnitSourceTransform
 
-def _enable(module_glob: str, ureg: pint.UnitRegistry | None, check_loaded: bool):
-    from import_transforms import register_module_source_transform
 
-    transform = UnitSourceTransform(ureg)
+class _UnitSourceLoader(importlib.abc.SourceLoader):
+    """
+    Wraps the loader that would normally handle a module, transforming its
+    source and caching the resulting code object.
 
-    register_module_source_transform(
-        module_glob,
-        transform,
-        check_loaded=check_loaded,
-    )
+    This plays the same role as `import_transforms`' loader, but looks up
+    and stores code objects with `unit_syntax.cache` so that warm imports
+    skip parsing and transforming entirely.
+    """
+
+    def __init__(
+        self,
+        base_loader: importlib.abc.SourceLoader,
+        transform: "UnitSourceTransform",
+    ):
+        self.base_loader = base_loader
+        self.transform = transform
+
+    def get_filename(self, fullname: str) -> str:
+        return self.base_loader.get_filename(fullname)
+
+    def get_data(self, path: str) -> bytes:
+        return self.base_loader.get_data(path)
+
+    def source_to_code(self, data, path, *, _optimize=-1):
+        tree = self.transform.transform(importlib.util.decode_source(data))
+        return compile(tree, path, mode="exec", dont_inherit=True, optimize=_optimize)
+
+    def get_code(self, fullname: str) -> types.CodeType:
+        source_path = self.get_filename(fullname)
+        data = self.get_data(source_path)
+
+        # Code compiled with e.g. `-O` is cached separately, as for pyc files
+        optimize = sys.flags.optimize
+        cache_path = cache_from_source(source_path, optimize)
+        key = self.transform.cache_key(data)
+        code = read_cache(cache_path, key)
+        if code is None:
+            code = self.source_to_code(data, source_path, _optimize=optimize)
+            write_cache(cache_path, key, code)
+        else:
+            # The entry may have been built from another path, e.g. ahead of
+            # time on a build machine.  CPython does the same for pyc files.
+            _imp._fix_co_filename(code, source_path)
+        return code
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        module.__dict__.update(self.transform.injected_globals())
+        super().exec_module(module)
+
+
+class _UnitMetaPathFinder(importlib.abc.MetaPathFinder):
+    @staticmethod
+    def find_spec(fullname, path, target=None):
+        transform = _get_module_transform(fullname)
+        if transform is None:
+            return None
+
+        # Find the finder that would be responsible for this module if we
+        # weren't installed, so we work with whatever loading mechanism is in
+        # use.
+        for finder in sys.meta_path:
+            if finder is _UnitMetaPathFinder:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if isinstance(spec.loader, importlib.abc.SourceLoader):
+                spec.loader = _UnitSourceLoader(spec.loader, transform)
+                if spec.origin is not None:
+                    spec.cached = cache_from_source(spec.origin)
+            else:
+                logging.debug(
+                    f"Loader for {fullname} is not a SourceLoader, was {type(spec.loader)}"
+                )
+            return spec
+        return None
 
 
-def enable_units_for_package(package_name: str, ureg: pint.UnitRegistry | None = None):
-    _enable(f"{package_name}.*", ureg, True)
+_MODULE_TRANSFORMS: list[tuple[re.Pattern, "UnitSourceTransform"]] = []
+
+
+def _get_module_transform(fullname: str) -> "UnitSourceTransform | None":
+    for regex, transform in _MODULE_TRANSFORMS:
+        if regex.match(fullname):
+            return transform
+    return None
+
+
+def _enable(
+    module_glob: str,
+    ureg: pint.UnitRegistry | None,
+    check_loaded: bool,
+    **options: bool,
+):
+    from .transform import UnitSourceTransform
+
+    if _UnitMetaPathFinder not in sys.meta_path:
+        sys.meta_path.insert(0, _UnitMetaPathFinder)
+
+    regex = re.compile(fnmatch.translate(module_glob))
+    if check_loaded:
+        for mod in sys.modules:
+            if regex.match(mod):
+                raise Exception(
+                    f"Already loaded matching module: {mod} for {module_glob}"
+                )
+
+    _MODULE_TRANSFORMS.append((regex, UnitSourceTransform(ureg, **options)))
+
+
+def enable_units_for_package(
+    package_name: str,
+    ureg: pint.UnitRegistry | None = None,
+    strip_units: bool = False,
+    fold_constants: bool = False,
+    check_dimensions: bool = False,
+):
+    runtime.set_package_registry(package_name, ureg)
+    package = sys.modules.get(package_name)
+    if getattr(package, "__unit_syntax_transpiled__", False):
+        stripped = getattr(package, "__unit_syntax_strip_units__", False)
+        if strip_units and not stripped:
+            raise ValueError(
+                f"{package_name} was transformed at build time with units, so they"
+                " can't be stripped"
+            )
+        if stripped and not strip_units:
+            raise ValueError(
+                f"{package_name} was transformed at build time with"
+                " --strip-units, so it has no units"
+            )
+        # Transformed at build time, so only the runtime is needed, and the
+        # other options are those given to `python -m unit_syntax compile`
+        return
+    _enable(
+        f"{package_name}.*",
+        ureg,
+        True,
+        strip_units=strip_units,
+        fold_constants=fold_constants,
+        check_dimensions=check_dimensions,
+    )
 
 
 def enable_units_everywhere():
@@ -1,6 +1,9 @@
+import ast
+import collections
+import hashlib
+import pickle
 import pint
 import logging
-from .transform import UnitSourceTransform
 
 
 def _add_formatters(ipython):
@@ -28,30 +31,147 @@ def enable_debug():
     logging.basicConfig(level=logging.DEBUG, force=True)
 
 
-_UNIT_TRANSFORM = UnitSourceTransform(None)
-
-
-def transform_lines(lines: list[str]) -> list[str]:
-    """IPython transforms provide a list of strings in the current cell, but to parse correctly we
-    need to parse them as a single string"""
-    ret = _UNIT_TRANSFORM.transform_to_str("".join(lines)).splitlines(keepends=True)
-    logging.debug("unit_syntax: %s -> %s", lines, ret)
-    return ret
+_UNIT_TRANSFORM = None
+
+
+def _get_transform():
+    # Created on first use so that importing unit_syntax doesn't load the parser
+    global _UNIT_TRANSFORM
+    if _UNIT_TRANSFORM is None:
+        from .transform import UnitSourceTransform
+
+        _UNIT_TRANSFORM = UnitSourceTransform(None)
+    return _UNIT_TRANSFORM
+
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class CellCache:
+    """
+    LRU cache of transformed cells, so that re-running an unchanged cell
+    doesn't parse it again.  Entries are keyed by a hash of the cell and the
+    fingerprint of the registry it was checked against.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+
+    def get(self, key):
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+_CELL_CACHE = CellCache(maxsize=256)
+
+
+def transform_cell(source: str) -> ast.Module:
+    "Parse and transform a cell of python-with-units into a standard python AST"
+    transform = _get_transform()
+    key = (
+        hashlib.blake2b(source.encode("utf-8"), digest_size=16).digest(),
+        transform.registry_fingerprint(),
+    )
+    # IPython's AST transformers are allowed to modify the tree in place, so
+    # each run gets its own.  Unpickling one is several times faster than
+    # `copy.deepcopy`, and about as fast as CPython parsing the cell.
+    pickled = _CELL_CACHE.get(key)
+    if pickled is None:
+        tree = transform.transform(source)
+        _CELL_CACHE.put(key, pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL))
+    else:
+        tree = pickle.loads(pickled)
+    logging.debug("unit_syntax: %s -> %s", source, ast.dump(tree))
+    return tree
+
+
+def _install_ast_parse(ipython):
+    """
+    Hook the shell's compiler so cells are parsed by unit-syntax, and the
+    resulting AST is compiled directly.  Unlike a string input transformer
+    this avoids unparsing and re-parsing the transformed cell, and line
+    numbers in tracebacks refer to the cell as written.
+    """
+    compiler = ipython.compile
+    native_ast_parse = compiler.ast_parse
+
+    def ast_parse(source, filename="<unknown>", symbol="exec"):
+        try:
+            # Respects `from __future__` imports in earlier cells, and is
+            # much faster for cells without units
+            return native_ast_parse(source, filename, symbol)
+        except SyntaxError:
+            if symbol != "exec":
+                raise
+        try:
+            return transform_cell(source)
+        except SyntaxError as e:
+            e.filename = filename
+            raise
+
+    compiler.ast_parse = ast_parse
+
+
+def _uninstall_ast_parse(ipython):
+    # Drop the instance attribute, exposing the class's method again
+    ipython.compile.__dict__.pop("ast_parse", None)
+
+
+def unit_syntax_cache(line: str):
+    """
+    Show hit and miss counts for unit-syntax's cache of transformed cells.
+    `%unit_syntax_cache clear` empties the cache and resets the counts.
+    """
+    if line.strip() == "clear":
+        _CELL_CACHE.clear()
+    else:
+        return _CELL_CACHE.info()
 
 
 def load_ipython_extension(ipython):
     logging.debug("unit_syntax: loading extension")
 
-    if not hasattr(ipython, "input_transformers_post"):
+    if not hasattr(ipython.compile, "ast_parse"):
         raise ImportError("Unsupported IPython version, version >=7 is required")
 
-    ipython.input_transformers_post.append(transform_lines)
+    _install_ast_parse(ipython)
+    ipython.register_magic_function(unit_syntax_cache)
 
     _add_formatters(ipython)
 
-    ipython.push(_UNIT_TRANSFORM.injected_globals())
+    ipython.push(_get_transform().injected_globals())
+
+
+def _unregister_magic(ipython, name: str):
+    # Undoes `register_magic_function`, which IPython has no method for
+    magics = ipython.magics_manager
+    magics.magics["line"].pop(name, None)
+    magics.user_magics.__dict__.pop(name, None)
 
 
 def unload_ipython_extension(ipython):
     logging.debug("unit_syntax: unload extension")
-    ipython.input_transformers_post.remove(transform_lines)
+    _uninstall_ast_parse(ipython)
+    _unregister_magic(ipython, "unit_syntax_cache")
@@ -7,7 +7,7 @@ import tokenize
 
 from typing import Any, Optional
 
-from pegen.parser import memoize, memoize_left_rec, logger, Parser
+from .parser_runtime import memoize, memoize_left_rec, logger, Parser
 
 import enum
 import io
@@ -16,10 +16,10 @@ import os
 import sys
 import token
 from typing import (
-    Any, Callable, Iterator, List, Literal, Tuple, TypeVar, Union, NoReturn
+    Any, Callable, Iterator, List, Literal, Set, Tuple, TypeVar, Union, NoReturn
 )
 
-from pegen.tokenizer import Tokenizer
+from .parser_runtime import ParserProfile, TokenBuffer, profile_from_env
 
 # Singleton ast nodes, created once for efficiency
 Load = ast.Load()
@@ -65,6 +65,7 @@ def parse_file(
         Callable[[Callable[[], str]], Iterator[tokenize.TokenInfo]]
     ] = None,
     verbose:bool = False,
+    profile: Optional[ParserProfile] = None,
 ) -> ast.Module:
     """Parse a file."""
     with open(path) as f:
@@ -73,8 +74,8 @@ def parse_file(
             if token_stream_factory else
             tokenize.generate_tokens(f.readline)
         )
-        tokenizer = Tokenizer(tok_stream, verbose=verbose, path=path)
-        parser = PythonParser(
+        tokenizer = TokenBuffer(tok_stream, verbose=verbose, path=path)
+        parser = _parser_class(profile)(
             tokenizer,
             verbose=verbose,
             filename=os.path.basename(path),
@@ -91,6 +92,7 @@ def parse_string(
         Callable[[Callable[[], str]], Iterator[tokenize.TokenInfo]]
     ] = None,
     verbose:bool = False,
+    profile: Optional[ParserProfile] = None,
 ) -> Any:
     """Parse a string."""
     tok_stream = (
@@ -98,11 +100,20 @@ def parse_string(
         if token_stream_factory else
         tokenize.generate_tokens(io.StringIO(source).readline)
     )
-    tokenizer = Tokenizer(tok_stream, verbose=verbose)
-    parser = PythonParser(tokenizer, verbose=verbose, py_version=py_version)
+    tokenizer = TokenBuffer(tok_stream, verbose=verbose)
+    parser = _parser_class(profile)(tokenizer, verbose=verbose, py_version=py_version)
     return parser.parse(mode if mode == "eval" else "file")
 
 
+def _parser_class(profile: Optional[ParserProfile]) -> type:
+    # Rules are only wrapped to record statistics when profiling, either
+    # into `profile` or as set up by the UNIT_SYNTAX_PROFILE variable
+    profile = profile or profile_from_env()
+    if profile is None:
+        return PythonParser
+    return profile.parser_class(PythonParser)
+
+
 class Target(enum.Enum):
     FOR_TARGETS = enum.auto()
     STAR_TARGETS = enum.auto()
@@ -115,7 +126,7 @@ class Parser(Parser):
     filename : str
 
     def __init__(self,
-        tokenizer: Tokenizer, *,
+        tokenizer: TokenBuffer, *,
         verbose: bool = False,
         filename: str = "<unknown>",
         py_version: Optional[tuple] = None,
@@ -123,6 +134,11 @@ class Parser(Parser):
         super().__init__(tokenizer, verbose=verbose)
         self.filename = filename
         self.py_version = min(py_version, sys.version_info) if py_version else sys.version_info
+        # Start of the first top-level statement that hasn't been parsed
+        self._restart_mark = 0
+        # Ends of statements matched after looking past their end, see
+        # `parsed_statement`
+        self._lookahead_ends: Set[int] = set()
 
     def parse(self, rule: str, call_invalid_rules: bool = False) -> Optional[ast.AST]:
         old = self.call_invalid_rules
@@ -138,10 +154,13 @@ class Parser(Parser):
             if not call_invalid_rules:
                 self.call_invalid_rules = True
 
-                # Reset the parser cache to be able to restart parsing from the
-                # beginning.
-                self._reset(0)  # type: ignore
-                self._cache.clear()
+                # Reset the parser cache to be able to restart parsing from
+                # the failed top-level statement, everything before it having
+                # parsed.  Statements nested in it that parsed are kept, so
+                # that only the failed one is parsed again with the invalid
+                # rules, which can also match valid unit expressions.
+                self._reset(self._restart_mark)  # type: ignore
+                self._memo_clear_except(self.statement, self._lookahead_ends)
 
                 res = getattr(self, rule)()
 
@@ -149,6 +168,105 @@ class Parser(Parser):
 
         return res
 
+    def units_and_text(self) -> Optional[tuple]:
+        "`unit_sequence()`, and the source it was parsed from"
+        start = self._mark()
+        factors = self.unit_sequence()
+        if factors is None:
+            return None
+        return factors, self._tokenizer.text(start, self._mark())
+
+    def unit_sequence(self) -> Optional[list]:
+        """
+        Parse units as `(name, exponent)` factors, or return None and consume
+        nothing.
+
+        Follows pint's precedence: '**' binds to a unit name or parenthesized
+        group (right-associative), and '*', '/' and juxtaposition are equal
+        and left-associative, so "m/s kg" is kg*m/s.  Written as a loop
+        rather than as left-recursive rules as it's tried after nearly every
+        factor.
+        """
+        factors = self._unit_power()
+        if factors is None:
+            return None
+        while True:
+            mark = self._mark()
+            tok = self._tokenizer.peek()
+            if tok.string == "/" or tok.string == "*":
+                self._tokenizer.getnext()
+            rhs = self._unit_power()
+            if rhs is None:
+                self._reset(mark)
+                return factors
+            if tok.string == "/":
+                rhs = _unit_factors_power(rhs, -1)
+            factors += rhs
+
+    def _unit_power(self) -> Optional[list]:
+        mark = self._mark()
+        tok = self._tokenizer.peek()
+        if tok.string == "(":
+            self._tokenizer.getnext()
+            factors = self.unit_sequence()
+            if factors is None or self._tokenizer.peek().string != ")":
+                self._reset(mark)
+                return None
+            self._tokenizer.getnext()
+        elif tok.type == token.NAME and tok.string not in self.KEYWORDS:
+            self._tokenizer.getnext()
+            factors = [(tok.string, 1)]
+        else:
+            return None
+        exponent_mark = self._mark()
+        if self._tokenizer.peek().string == "**":
+            self._tokenizer.getnext()
+            exponent = self._unit_exponent()
+            if exponent is not None:
+                return _unit_factors_power(factors, exponent)
+            self._reset(exponent_mark)
+        return factors
+
+    def _unit_exponent(self) -> Optional[float]:
+        # A possibly negative number, with any further exponents applied
+        # right-associatively as in pint and Python
+        mark = self._mark()
+        sign = 1
+        if self._tokenizer.peek().string == "-":
+            self._tokenizer.getnext()
+            sign = -1
+        tok = self._tokenizer.peek()
+        if tok.type != token.NUMBER:
+            self._reset(mark)
+            return None
+        self._tokenizer.getnext()
+        value = sign * ast.literal_eval(tok.string)
+        power_mark = self._mark()
+        if self._tokenizer.peek().string == "**":
+            self._tokenizer.getnext()
+            exponent = self._unit_exponent()
+            if exponent is not None:
+                return value ** exponent
+            self._reset(power_mark)
+        return value
+
+    def parsed_statement(self, statements: list) -> list:
+        # A statement can match after failing to parse what follows it, e.g.
+        # an `if` followed by an `elif` without a block.  The error pass has
+        # to parse it again to find that error.
+        if self._tokenizer.seen() > self._mark() + 1:
+            self._lookahead_ends.add(self._mark())
+        return statements
+
+    def complete_top_level_statement(self, statements: list) -> list:
+        # `file` never backtracks into a finished top-level statement, so the
+        # tokens and memo entries behind it are only kept to restart from the
+        # beginning for the error pass, which can start here instead.
+        if self._mark() not in self._lookahead_ends:
+            self._restart_mark = self._mark()
+            self._release_before(self._restart_mark)
+        return statements
+
     def check_version(self, min_version: Tuple[int, ...], error_msg: str, node: Node) -> Node:
         """Check that the python version is high enough for a rule to apply.
 
@@ -472,6 +590,16 @@ class Parser(Parser):
 class UnitsExpr(ast.AST):
     _fields = ("value", "units")
 
+class Units(ast.AST):
+    """
+    A product of units, as a tuple of `(name, exponent)` factors in source
+    order, and the source `text` they were parsed from
+    """
+    _fields = ("factors", "text")
+
+def _unit_factors_power(factors, exponent):
+    return [(name, power * exponent) for name, power in factors]
+
 # Keywords and soft keywords are listed at the end of the parser definition.
 class PythonParser(Parser):
 
@@ -488,10 +616,10 @@ class PythonParser(Parser):
 
     @memoize
     def file(self) -> Optional[ast . Module]:
-        # file: statements? $
+        # file: top_level_statements? $
         mark = self._mark()
         if (
-            (a := self.statements(),)
+            (a := self.top_level_statements(),)
             and
             (self.expect('ENDMARKER'))
         ):
@@ -570,6 +698,28 @@ class PythonParser(Parser):
         self._reset(mark)
         return None;
 
+    @memoize
+    def top_level_statements(self) -> Optional[list]:
+        # top_level_statements: top_level_statement+
+        mark = self._mark()
+        if (
+            (a := self._loop1_4())
+        ):
+            return list ( itertools . chain . from_iterable ( a ) );
+        self._reset(mark)
+        return None;
+
+    @memoize
+    def top_level_statement(self) -> Optional[list]:
+        # top_level_statement: statement
+        mark = self._mark()
+        if (
+            (a := self.statement())
+        ):
+            return self . complete_top_level_statement ( a );
+        self._reset(mark)
+        return None;
+
     @memoize
     def statement(self) -> Optional[list]:
         # statement: compound_stmt | simple_stmts
@@ -577,12 +727,12 @@ class PythonParser(Parser):
         if (
             (a := self.compound_stmt())
         ):
-            return [a];
+            return self . parsed_statement ( [a] );
         self._reset(mark)
         if (
             (a := self.simple_stmts())
         ):
-            return a;
+            return self . parsed_statement ( a );
         self._reset(mark)
         return None;
 
@@ -632,7 +782,7 @@ class PythonParser(Parser):
             return [a];
         self._reset(mark)
         if (
-            (a := self._gather_4())
+            (a := self._gather_5())
             and
             (self.expect(';'),)
             and
@@ -668,7 +818,7 @@ class PythonParser(Parser):
             return return_stmt;
         self._reset(mark)
         if (
-            (self.positive_lookahead(self._tmp_6, ))
+            (self.positive_lookahead(self._tmp_7, ))
             and
             (import_stmt := self.import_stmt())
         ):
@@ -744,7 +894,7 @@ class PythonParser(Parser):
         # compound_stmt: &('def' | '@' | 'async') function_def | &'if' if_stmt | &('class' | '@') class_def | &('with' | 'async') with_stmt | &('for' | 'async') for_stmt | &'try' try_stmt | &'while' while_stmt | match_stmt
         mark = self._mark()
         if (
-            (self.positive_lookahead(self._tmp_7, ))
+            (self.positive_lookahead(self._tmp_8, ))
             and
             (function_def := self.function_def())
         ):
@@ -758,21 +908,21 @@ class PythonParser(Parser):
             return if_stmt;
         self._reset(mark)
         if (
-            (self.positive_lookahead(self._tmp_8, ))
+            (self.positive_lookahead(self._tmp_9, ))
             and
             (class_def := self.class_def())
         ):
             return class_def;
         self._reset(mark)
         if (
-            (self.positive_lookahead(self._tmp_9, ))
+            (self.positive_lookahead(self._tmp_10, ))
             and
             (with_stmt := self.with_stmt())
         ):
             return with_stmt;
         self._reset(mark)
         if (
-            (self.positive_lookahead(self._tmp_10, ))
+            (self.positive_lookahead(self._tmp_11, ))
             and
             (for_stmt := self.for_stmt())
         ):
@@ -812,29 +962,29 @@ class PythonParser(Parser):
             and
             (b := self.expression())
             and
-            (c := self._tmp_11(),)
+            (c := self._tmp_12(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return self . check_version ( ( 3 , 6 ) , "Variable annotation syntax is" , ast . AnnAssign ( target = ast . Name ( id = a . string , ctx = Store , lineno = a . start [0] , col_offset = a . start [1] , end_lineno = a . end [0] , end_col_offset = a . end [1] , ) , annotation = b , value = c , simple = 1 , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset , ) );
         self._reset(mark)
         if (
-            (a := self._tmp_12())
+            (a := self._tmp_13())
             and
             (self.expect(':'))
             and
             (b := self.expression())
             and
-            (c := self._tmp_13(),)
+            (c := self._tmp_14(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
             return self . check_version ( ( 3 , 6 ) , "Variable annotation syntax is" , ast . AnnAssign ( target = a , annotation = b , value = c , simple = 0 , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset , ) );
         self._reset(mark)
         if (
-            (a := self._loop1_14())
+            (a := self._loop1_15())
             and
-            (b := self._tmp_15())
+            (b := self._tmp_16())
             and
             (self.negative_lookahead(self.expect, '='))
             and
@@ -852,7 +1002,7 @@ class PythonParser(Parser):
             and
             (cut := True)
             and
-            (c := self._tmp_16())
+            (c := self._tmp_17())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -984,7 +1134,7 @@ class PythonParser(Parser):
             and
             (a := self.expression())
             and
-            (b := self._tmp_17(),)
+            (b := self._tmp_18(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -1008,7 +1158,7 @@ class PythonParser(Parser):
         if (
             (self.expect('global'))
             and
-            (a := self._gather_18())
+            (a := self._gather_19())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -1025,7 +1175,7 @@ class PythonParser(Parser):
         if (
             (self.expect('nonlocal'))
             and
-            (a := self._gather_20())
+            (a := self._gather_21())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -1044,7 +1194,7 @@ class PythonParser(Parser):
             and
             (a := self.del_targets())
             and
-            (self.positive_lookahead(self._tmp_22, ))
+            (self.positive_lookahead(self._tmp_23, ))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -1085,7 +1235,7 @@ class PythonParser(Parser):
             and
             (a := self.expression())
             and
-            (b := self._tmp_23(),)
+            (b := self._tmp_24(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -1135,7 +1285,7 @@ class PythonParser(Parser):
         if (
             (self.expect('from'))
             and
-            (a := self._loop0_24(),)
+            (a := self._loop0_25(),)
             and
             (b := self.dotted_name())
             and
@@ -1150,7 +1300,7 @@ class PythonParser(Parser):
         if (
             (self.expect('from'))
             and
-            (a := self._loop1_25())
+            (a := self._loop1_26())
             and
             (self.expect('import'))
             and
@@ -1207,7 +1357,7 @@ class PythonParser(Parser):
         # import_from_as_names: ','.import_from_as_name+
         mark = self._mark()
         if (
-            (a := self._gather_26())
+            (a := self._gather_27())
         ):
             return a;
         self._reset(mark)
@@ -1222,7 +1372,7 @@ class PythonParser(Parser):
         if (
             (a := self.name())
             and
-            (b := self._tmp_28(),)
+            (b := self._tmp_29(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -1235,7 +1385,7 @@ class PythonParser(Parser):
         # dotted_as_names: ','.dotted_as_name+
         mark = self._mark()
         if (
-            (a := self._gather_29())
+            (a := self._gather_30())
         ):
             return a;
         self._reset(mark)
@@ -1250,7 +1400,7 @@ class PythonParser(Parser):
         if (
             (a := self.dotted_name())
             and
-            (b := self._tmp_31(),)
+            (b := self._tmp_32(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -1312,9 +1462,9 @@ class PythonParser(Parser):
         # decorators: decorator+
         mark = self._mark()
         if (
-            (_loop1_32 := self._loop1_32())
+            (_loop1_33 := self._loop1_33())
         ):
-            return _loop1_32;
+            return _loop1_33;
         self._reset(mark)
         return None;
 
@@ -1323,12 +1473,12 @@ class PythonParser(Parser):
         # decorator: ('@' dec_maybe_call NEWLINE) | ('@' named_expression NEWLINE)
         mark = self._mark()
         if (
-            (a := self._tmp_33())
+            (a := self._tmp_34())
         ):
             return a;
         self._reset(mark)
         if (
-            (a := self._tmp_34())
+            (a := self._tmp_35())
         ):
             return self . check_version ( ( 3 , 9 ) , "Generic decorator are" , a );
         self._reset(mark)
@@ -1422,7 +1572,7 @@ class PythonParser(Parser):
             and
             (a := self.name())
             and
-            (b := self._tmp_35(),)
+            (b := self._tmp_36(),)
             and
             (self.expect_forced(self.expect(':'), "':'"))
             and
@@ -1476,7 +1626,7 @@ class PythonParser(Parser):
             and
             (self.expect(')'))
             and
-            (a := self._tmp_36(),)
+            (a := self._tmp_37(),)
             and
             (self.expect_forced(self.expect(':'), "':'"))
             and
@@ -1501,7 +1651,7 @@ class PythonParser(Parser):
             and
             (self.expect(')'))
             and
-            (a := self._tmp_37(),)
+            (a := self._tmp_38(),)
             and
             (self.expect_forced(self.expect(':'), "':'"))
             and
@@ -1540,9 +1690,9 @@ class PythonParser(Parser):
         if (
             (a := self.slash_no_default())
             and
-            (b := self._loop0_38(),)
+            (b := self._loop0_39(),)
             and
-            (c := self._loop0_39(),)
+            (c := self._loop0_40(),)
             and
             (d := self.star_etc(),)
         ):
@@ -1551,23 +1701,23 @@ class PythonParser(Parser):
         if (
             (a := self.slash_with_default())
             and
-            (b := self._loop0_40(),)
+            (b := self._loop0_41(),)
             and
             (c := self.star_etc(),)
         ):
             return self . check_version ( ( 3 , 8 ) , "Positional only arguments are" , self . make_arguments ( None , a , None , b , c ) , );
         self._reset(mark)
         if (
-            (a := self._loop1_41())
+            (a := self._loop1_42())
             and
-            (b := self._loop0_42(),)
+            (b := self._loop0_43(),)
             and
             (c := self.star_etc(),)
         ):
             return self . make_arguments ( None , [] , a , b , c );
         self._reset(mark)
         if (
-            (a := self._loop1_43())
+            (a := self._loop1_44())
             and
             (b := self.star_etc(),)
         ):
@@ -1585,7 +1735,7 @@ class PythonParser(Parser):
         # slash_no_default: param_no_default+ '/' ',' | param_no_default+ '/' &')'
         mark = self._mark()
         if (
-            (a := self._loop1_44())
+            (a := self._loop1_45())
             and
             (self.expect('/'))
             and
@@ -1594,7 +1744,7 @@ class PythonParser(Parser):
             return [( p , None ) for p in a];
         self._reset(mark)
         if (
-            (a := self._loop1_45())
+            (a := self._loop1_46())
             and
             (self.expect('/'))
             and
@@ -1609,9 +1759,9 @@ class PythonParser(Parser):
         # slash_with_default: param_no_default* param_with_default+ '/' ',' | param_no_default* param_with_default+ '/' &')'
         mark = self._mark()
         if (
-            (a := self._loop0_46(),)
+            (a := self._loop0_47(),)
             and
-            (b := self._loop1_47())
+            (b := self._loop1_48())
             and
             (self.expect('/'))
             and
@@ -1620,9 +1770,9 @@ class PythonParser(Parser):
             return ( [( p , None ) for p in a] if a else [] ) + b;
         self._reset(mark)
         if (
-            (a := self._loop0_48(),)
+            (a := self._loop0_49(),)
             and
-            (b := self._loop1_49())
+            (b := self._loop1_50())
             and
             (self.expect('/'))
             and
@@ -1648,7 +1798,7 @@ class PythonParser(Parser):
             and
             (a := self.param_no_default())
             and
-            (b := self._loop0_50(),)
+            (b := self._loop0_51(),)
             and
             (c := self.kwds(),)
         ):
@@ -1659,7 +1809,7 @@ class PythonParser(Parser):
             and
             (self.expect(','))
             and
-            (b := self._loop1_51())
+            (b := self._loop1_52())
             and
             (c := self.kwds(),)
         ):
@@ -2058,7 +2208,7 @@ class PythonParser(Parser):
             and
             (self.expect('('))
             and
-            (a := self._gather_52())
+            (a := self._gather_53())
             and
             (self.expect(','),)
             and
@@ -2075,7 +2225,7 @@ class PythonParser(Parser):
         if (
             (self.expect('with'))
             and
-            (a := self._gather_54())
+            (a := self._gather_55())
             and
             (self.expect(':'))
             and
@@ -2094,7 +2244,7 @@ class PythonParser(Parser):
             and
             (self.expect('('))
             and
-            (a := self._gather_56())
+            (a := self._gather_57())
             and
             (self.expect(','),)
             and
@@ -2113,7 +2263,7 @@ class PythonParser(Parser):
             and
             (self.expect('with'))
             and
-            (a := self._gather_58())
+            (a := self._gather_59())
             and
             (self.expect(':'))
             and
@@ -2145,7 +2295,7 @@ class PythonParser(Parser):
             and
             (t := self.star_target())
             and
-            (self.positive_lookahead(self._tmp_60, ))
+            (self.positive_lookahead(self._tmp_61, ))
         ):
             return ast . withitem ( context_expr = e , optional_vars = t );
         self._reset(mark)
@@ -2196,7 +2346,7 @@ class PythonParser(Parser):
             and
             (b := self.block())
             and
-            (ex := self._loop1_61())
+            (ex := self._loop1_62())
             and
             (el := self.else_block(),)
             and
@@ -2226,7 +2376,7 @@ class PythonParser(Parser):
             and
             (e := self.expression())
             and
-            (t := self._tmp_62(),)
+            (t := self._tmp_63(),)
             and
             (self.expect(':'))
             and
@@ -2295,7 +2445,7 @@ class PythonParser(Parser):
             and
             (self.expect('INDENT'))
             and
-            (cases := self._loop1_63())
+            (cases := self._loop1_64())
             and
             (self.expect('DEDENT'))
         ):
@@ -2444,7 +2594,7 @@ class PythonParser(Parser):
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
-            (patterns := self._gather_64())
+            (patterns := self._gather_65())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2507,7 +2657,7 @@ class PythonParser(Parser):
         if (
             (value := self.signed_number())
             and
-            (self.negative_lookahead(self._tmp_66, ))
+            (self.negative_lookahead(self._tmp_67, ))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2559,7 +2709,7 @@ class PythonParser(Parser):
         if (
             (signed_number := self.signed_number())
             and
-            (self.negative_lookahead(self._tmp_67, ))
+            (self.negative_lookahead(self._tmp_68, ))
         ):
             return signed_number;
         self._reset(mark)
@@ -2726,7 +2876,7 @@ class PythonParser(Parser):
             and
             (name := self.name())
             and
-            (self.negative_lookahead(self._tmp_68, ))
+            (self.negative_lookahead(self._tmp_69, ))
         ):
             return name . string;
         self._reset(mark)
@@ -2756,7 +2906,7 @@ class PythonParser(Parser):
         if (
             (attr := self.attr())
             and
-            (self.negative_lookahead(self._tmp_69, ))
+            (self.negative_lookahead(self._tmp_70, ))
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -2868,7 +3018,7 @@ class PythonParser(Parser):
         # maybe_sequence_pattern: ','.maybe_star_pattern+ ','?
         mark = self._mark()
         if (
-            (patterns := self._gather_70())
+            (patterns := self._gather_71())
             and
             (self.expect(','),)
         ):
@@ -2983,9 +3133,9 @@ class PythonParser(Parser):
         # items_pattern: ','.key_value_pattern+
         mark = self._mark()
         if (
-            (_gather_72 := self._gather_72())
+            (_gather_73 := self._gather_73())
         ):
-            return _gather_72;
+            return _gather_73;
         self._reset(mark)
         return None;
 
@@ -2994,7 +3144,7 @@ class PythonParser(Parser):
         # key_value_pattern: (literal_expr | attr) ':' pattern
         mark = self._mark()
         if (
-            (key := self._tmp_74())
+            (key := self._tmp_75())
             and
             (self.expect(':'))
             and
@@ -3097,7 +3247,7 @@ class PythonParser(Parser):
         # positional_patterns: ','.pattern+
         mark = self._mark()
         if (
-            (args := self._gather_75())
+            (args := self._gather_76())
         ):
             return args;
         self._reset(mark)
@@ -3108,9 +3258,9 @@ class PythonParser(Parser):
         # keyword_patterns: ','.keyword_pattern+
         mark = self._mark()
         if (
-            (_gather_77 := self._gather_77())
+            (_gather_78 := self._gather_78())
         ):
-            return _gather_77;
+            return _gather_78;
         self._reset(mark)
         return None;
 
@@ -3131,13 +3281,15 @@ class PythonParser(Parser):
 
     @memoize
     def factor_with_units(self) -> Optional[UnitsExpr]:
-        # factor_with_units: factor units
+        # factor_with_units: factor &NAME units
         mark = self._mark()
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
         if (
             (f := self.factor())
             and
+            (self.positive_lookahead(self.name, ))
+            and
             (u := self.units())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
@@ -3147,8 +3299,9 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def units(self) -> Optional[ast . Constant]:
+    def units(self) -> Optional[Units]:
         # units: units_
+        # nullable=True
         mark = self._mark()
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
@@ -3157,74 +3310,19 @@ class PythonParser(Parser):
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
-            return ast . Constant ( value = u , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset );
-        self._reset(mark)
-        return None;
-
-    @memoize_left_rec
-    def units_(self) -> Optional[str]:
-        # units_: units_ '/' units_group_ | units_ '*' units_group_ | units_ units_group_ | units_ '**' '-'? NUMBER | NAME
-        mark = self._mark()
-        if (
-            (a := self.units_())
-            and
-            (self.expect('/'))
-            and
-            (c := self.units_group_())
-        ):
-            return a + '/' + c;
-        self._reset(mark)
-        if (
-            (a := self.units_())
-            and
-            (self.expect('*'))
-            and
-            (c := self.units_group_())
-        ):
-            return a + '*' + c;
-        self._reset(mark)
-        if (
-            (a := self.units_())
-            and
-            (b := self.units_group_())
-        ):
-            return a + ' ' + b;
-        self._reset(mark)
-        if (
-            (a := self.units_())
-            and
-            (self.expect('**'))
-            and
-            (sign := self.expect('-'),)
-            and
-            (c := self.number())
-        ):
-            return a + '**' + ( sign . string if sign is not None else "" ) + c . string;
-        self._reset(mark)
-        if (
-            (a := self.name())
-        ):
-            return a . string;
+            return Units ( factors = tuple ( u [0] ) , text = u [1] , lineno=start_lineno, col_offset=start_col_offset, end_lineno=end_lineno, end_col_offset=end_col_offset );
         self._reset(mark)
         return None;
 
     @memoize
-    def units_group_(self) -> Optional[str]:
-        # units_group_: '(' units_ ')' | units_
+    def units_(self) -> Optional[tuple]:
+        # units_: &NAME
+        # nullable=True
         mark = self._mark()
         if (
-            (self.expect('('))
-            and
-            (a := self.units_())
-            and
-            (self.expect(')'))
-        ):
-            return '(' + a + ')';
-        self._reset(mark)
-        if (
-            (units_ := self.units_())
+            (self.positive_lookahead(self.name, ))
         ):
-            return units_;
+            return self . units_and_text ( );
         self._reset(mark)
         return None;
 
@@ -3237,7 +3335,7 @@ class PythonParser(Parser):
         if (
             (a := self.expression())
             and
-            (b := self._loop1_79())
+            (b := self._loop1_80())
             and
             (self.expect(','),)
         ):
@@ -3350,7 +3448,7 @@ class PythonParser(Parser):
         if (
             (a := self.star_expression())
             and
-            (b := self._loop1_80())
+            (b := self._loop1_81())
             and
             (self.expect(','),)
         ):
@@ -3401,7 +3499,7 @@ class PythonParser(Parser):
         # star_named_expressions: ','.star_named_expression+ ','?
         mark = self._mark()
         if (
-            (a := self._gather_81())
+            (a := self._gather_82())
             and
             (self.expect(','),)
         ):
@@ -3489,7 +3587,7 @@ class PythonParser(Parser):
         if (
             (a := self.conjunction())
             and
-            (b := self._loop1_83())
+            (b := self._loop1_84())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3511,7 +3609,7 @@ class PythonParser(Parser):
         if (
             (a := self.inversion())
             and
-            (b := self._loop1_84())
+            (b := self._loop1_85())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3555,7 +3653,7 @@ class PythonParser(Parser):
         if (
             (a := self.bitwise_or())
             and
-            (b := self._loop1_85())
+            (b := self._loop1_86())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -3902,7 +4000,7 @@ class PythonParser(Parser):
 
     @memoize_left_rec
     def term(self) -> Optional[Any]:
-        # term: term '*' factor | term '/' factor | term '//' factor | term '%' factor | term '@' factor | factor units | factor
+        # term: term '*' factor | term '/' factor | term '//' factor | term '%' factor | term '@' factor | factor &NAME units | factor
         mark = self._mark()
         tok = self._tokenizer.peek()
         start_lineno, start_col_offset = tok.start
@@ -3964,6 +4062,8 @@ class PythonParser(Parser):
         if (
             (f := self.factor())
             and
+            (self.positive_lookahead(self.name, ))
+            and
             (u := self.units())
         ):
             return self . raise_syntax_error_known_range ( "Units must be parenthesized when mixed with operators, see https://github.com/ahupp/unit-syntax/#why-only-allow-units-on-simple-expressions" , f , u );
@@ -4134,7 +4234,7 @@ class PythonParser(Parser):
             return a;
         self._reset(mark)
         if (
-            (a := self._gather_86())
+            (a := self._gather_87())
             and
             (self.expect(','),)
         ):
@@ -4157,7 +4257,7 @@ class PythonParser(Parser):
             and
             (b := self.expression(),)
             and
-            (c := self._tmp_88(),)
+            (c := self._tmp_89(),)
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -4221,23 +4321,23 @@ class PythonParser(Parser):
         if (
             (self.positive_lookahead(self.expect, '('))
             and
-            (_tmp_89 := self._tmp_89())
+            (_tmp_90 := self._tmp_90())
         ):
-            return _tmp_89;
+            return _tmp_90;
         self._reset(mark)
         if (
             (self.positive_lookahead(self.expect, '['))
             and
-            (_tmp_90 := self._tmp_90())
+            (_tmp_91 := self._tmp_91())
         ):
-            return _tmp_90;
+            return _tmp_91;
         self._reset(mark)
         if (
             (self.positive_lookahead(self.expect, '{'))
             and
-            (_tmp_91 := self._tmp_91())
+            (_tmp_92 := self._tmp_92())
         ):
-            return _tmp_91;
+            return _tmp_92;
         self._reset(mark)
         if (
             (self.expect('...'))
@@ -4255,7 +4355,7 @@ class PythonParser(Parser):
         if (
             (self.expect('('))
             and
-            (a := self._tmp_92())
+            (a := self._tmp_93())
             and
             (self.expect(')'))
         ):
@@ -4316,9 +4416,9 @@ class PythonParser(Parser):
         if (
             (a := self.lambda_slash_no_default())
             and
-            (b := self._loop0_93(),)
+            (b := self._loop0_94(),)
             and
-            (c := self._loop0_94(),)
+            (c := self._loop0_95(),)
             and
             (d := self.lambda_star_etc(),)
         ):
@@ -4327,23 +4427,23 @@ class PythonParser(Parser):
         if (
             (a := self.lambda_slash_with_default())
             and
-            (b := self._loop0_95(),)
+            (b := self._loop0_96(),)
             and
             (c := self.lambda_star_etc(),)
         ):
             return self . make_arguments ( None , a , None , b , c );
         self._reset(mark)
         if (
-            (a := self._loop1_96())
+            (a := self._loop1_97())
             and
-            (b := self._loop0_97(),)
+            (b := self._loop0_98(),)
             and
             (c := self.lambda_star_etc(),)
         ):
             return self . make_arguments ( None , [] , a , b , c );
         self._reset(mark)
         if (
-            (a := self._loop1_98())
+            (a := self._loop1_99())
             and
             (b := self.lambda_star_etc(),)
         ):
@@ -4361,7 +4461,7 @@ class PythonParser(Parser):
         # lambda_slash_no_default: lambda_param_no_default+ '/' ',' | lambda_param_no_default+ '/' &':'
         mark = self._mark()
         if (
-            (a := self._loop1_99())
+            (a := self._loop1_100())
             and
             (self.expect('/'))
             and
@@ -4370,7 +4470,7 @@ class PythonParser(Parser):
             return [( p , None ) for p in a];
         self._reset(mark)
         if (
-            (a := self._loop1_100())
+            (a := self._loop1_101())
             and
             (self.expect('/'))
             and
@@ -4385,9 +4485,9 @@ class PythonParser(Parser):
         # lambda_slash_with_default: lambda_param_no_default* lambda_param_with_default+ '/' ',' | lambda_param_no_default* lambda_param_with_default+ '/' &':'
         mark = self._mark()
         if (
-            (a := self._loop0_101(),)
+            (a := self._loop0_102(),)
             and
-            (b := self._loop1_102())
+            (b := self._loop1_103())
             and
             (self.expect('/'))
             and
@@ -4396,9 +4496,9 @@ class PythonParser(Parser):
             return ( [( p , None ) for p in a] if a else [] ) + b;
         self._reset(mark)
         if (
-            (a := self._loop0_103(),)
+            (a := self._loop0_104(),)
             and
-            (b := self._loop1_104())
+            (b := self._loop1_105())
             and
             (self.expect('/'))
             and
@@ -4424,7 +4524,7 @@ class PythonParser(Parser):
             and
             (a := self.lambda_param_no_default())
             and
-            (b := self._loop0_105(),)
+            (b := self._loop0_106(),)
             and
             (c := self.lambda_kwds(),)
         ):
@@ -4435,7 +4535,7 @@ class PythonParser(Parser):
             and
             (self.expect(','))
             and
-            (b := self._loop1_106())
+            (b := self._loop1_107())
             and
             (c := self.lambda_kwds(),)
         ):
@@ -4556,7 +4656,7 @@ class PythonParser(Parser):
         # strings: STRING+
         mark = self._mark()
         if (
-            (a := self._loop1_107())
+            (a := self._loop1_108())
         ):
             return self . generate_ast_for_string ( a );
         self._reset(mark)
@@ -4590,7 +4690,7 @@ class PythonParser(Parser):
         if (
             (self.expect('('))
             and
-            (a := self._tmp_108(),)
+            (a := self._tmp_109(),)
             and
             (self.expect(')'))
         ):
@@ -4654,7 +4754,7 @@ class PythonParser(Parser):
         # double_starred_kvpairs: ','.double_starred_kvpair+ ','?
         mark = self._mark()
         if (
-            (a := self._gather_109())
+            (a := self._gather_110())
             and
             (self.expect(','),)
         ):
@@ -4700,7 +4800,7 @@ class PythonParser(Parser):
         # for_if_clauses: for_if_clause+
         mark = self._mark()
         if (
-            (a := self._loop1_111())
+            (a := self._loop1_112())
         ):
             return a;
         self._reset(mark)
@@ -4724,7 +4824,7 @@ class PythonParser(Parser):
             and
             (b := self.disjunction())
             and
-            (c := self._loop0_112(),)
+            (c := self._loop0_113(),)
         ):
             return self . check_version ( ( 3 , 6 ) , "Async comprehensions are" , ast . comprehension ( target = a , iter = b , ifs = c , is_async = 1 ) );
         self._reset(mark)
@@ -4742,7 +4842,7 @@ class PythonParser(Parser):
             and
             (b := self.disjunction())
             and
-            (c := self._loop0_113(),)
+            (c := self._loop0_114(),)
         ):
             return ast . comprehension ( target = a , iter = b , ifs = c , is_async = 0 );
         self._reset(mark)
@@ -4822,7 +4922,7 @@ class PythonParser(Parser):
         if (
             (self.expect('('))
             and
-            (a := self._tmp_114())
+            (a := self._tmp_115())
             and
             (b := self.for_if_clauses())
             and
@@ -4896,9 +4996,9 @@ class PythonParser(Parser):
         # args: ','.(starred_expression | (assignment_expression | expression !':=') !'=')+ [',' kwargs] | kwargs
         mark = self._mark()
         if (
-            (a := self._gather_115())
+            (a := self._gather_116())
             and
-            (b := self._tmp_117(),)
+            (b := self._tmp_118(),)
         ):
             return ( a + ( [e for e in b if isinstance ( e , ast . Starred )] if b else [] ) , ( [e for e in b if not isinstance ( e , ast . Starred )] if b else [] ) );
         self._reset(mark)
@@ -4914,23 +5014,23 @@ class PythonParser(Parser):
         # kwargs: ','.kwarg_or_starred+ ',' ','.kwarg_or_double_starred+ | ','.kwarg_or_starred+ | ','.kwarg_or_double_starred+
         mark = self._mark()
         if (
-            (a := self._gather_118())
+            (a := self._gather_119())
             and
             (self.expect(','))
             and
-            (b := self._gather_120())
+            (b := self._gather_121())
         ):
             return a + b;
         self._reset(mark)
         if (
-            (_gather_122 := self._gather_122())
+            (_gather_123 := self._gather_123())
         ):
-            return _gather_122;
+            return _gather_123;
         self._reset(mark)
         if (
-            (_gather_124 := self._gather_124())
+            (_gather_125 := self._gather_125())
         ):
-            return _gather_124;
+            return _gather_125;
         self._reset(mark)
         return None;
 
@@ -5033,7 +5133,7 @@ class PythonParser(Parser):
         if (
             (a := self.star_target())
             and
-            (b := self._loop0_126(),)
+            (b := self._loop0_127(),)
             and
             (self.expect(','),)
         ):
@@ -5048,7 +5148,7 @@ class PythonParser(Parser):
         # star_targets_list_seq: ','.star_target+ ','?
         mark = self._mark()
         if (
-            (a := self._gather_127())
+            (a := self._gather_128())
             and
             (self.expect(','),)
         ):
@@ -5063,7 +5163,7 @@ class PythonParser(Parser):
         if (
             (a := self.star_target())
             and
-            (b := self._loop1_129())
+            (b := self._loop1_130())
             and
             (self.expect(','),)
         ):
@@ -5087,7 +5187,7 @@ class PythonParser(Parser):
         if (
             (self.expect('*'))
             and
-            (a := self._tmp_130())
+            (a := self._tmp_131())
         ):
             tok = self._tokenizer.get_last_non_whitespace_token()
             end_lineno, end_col_offset = tok.end
@@ -5347,7 +5447,7 @@ class PythonParser(Parser):
         # del_targets: ','.del_target+ ','?
         mark = self._mark()
         if (
-            (a := self._gather_131())
+            (a := self._gather_132())
             and
             (self.expect(','),)
         ):
@@ -5447,7 +5547,7 @@ class PythonParser(Parser):
         # type_expressions: ','.expression+ ',' '*' expression ',' '**' expression | ','.expression+ ',' '*' expression | ','.expression+ ',' '**' expression | '*' expression ',' '**' expression | '*' expression | '**' expression | ','.expression+
         mark = self._mark()
         if (
-            (a := self._gather_133())
+            (a := self._gather_134())
             and
             (self.expect(','))
             and
@@ -5464,7 +5564,7 @@ class PythonParser(Parser):
             return a + [b , c];
         self._reset(mark)
         if (
-            (a := self._gather_135())
+            (a := self._gather_136())
             and
             (self.expect(','))
             and
@@ -5475,7 +5575,7 @@ class PythonParser(Parser):
             return a + [b];
         self._reset(mark)
         if (
-            (a := self._gather_137())
+            (a := self._gather_138())
             and
             (self.expect(','))
             and
@@ -5513,7 +5613,7 @@ class PythonParser(Parser):
             return [a];
         self._reset(mark)
         if (
-            (a := self._gather_139())
+            (a := self._gather_140())
         ):
             return a;
         self._reset(mark)
@@ -5528,7 +5628,7 @@ class PythonParser(Parser):
             and
             (t := self.type_comment())
             and
-            (self.positive_lookahead(self._tmp_141, ))
+            (self.positive_lookahead(self._tmp_142, ))
         ):
             return t . string;
         self._reset(mark)
@@ -5566,7 +5666,7 @@ class PythonParser(Parser):
             and
             (self.expect(','))
             and
-            (self._tmp_142(),)
+            (self._tmp_143(),)
         ):
             return self . raise_syntax_error_known_range ( "Generator expression must be parenthesized" , a , ( b [- 1] . ifs [- 1] if b [- 1] . ifs else b [- 1] . iter ) );
         self._reset(mark)
@@ -5615,7 +5715,7 @@ class PythonParser(Parser):
         # invalid_kwarg: ('True' | 'False' | 'None') '=' | NAME '=' expression for_if_clauses | !(NAME '=') expression '='
         mark = self._mark()
         if (
-            (a := self._tmp_143())
+            (a := self._tmp_144())
             and
             (b := self.expect('='))
         ):
@@ -5633,7 +5733,7 @@ class PythonParser(Parser):
             return self . raise_syntax_error_known_range ( "invalid syntax. Maybe you meant '==' or ':=' instead of '='?" , a , b );
         self._reset(mark)
         if (
-            (self.negative_lookahead(self._tmp_144, ))
+            (self.negative_lookahead(self._tmp_145, ))
             and
             (a := self.expression())
             and
@@ -5702,7 +5802,7 @@ class PythonParser(Parser):
         # invalid_expression: !(NAME STRING | SOFT_KEYWORD) disjunction expression_without_invalid | disjunction 'if' disjunction !('else' | ':')
         mark = self._mark()
         if (
-            (self.negative_lookahead(self._tmp_145, ))
+            (self.negative_lookahead(self._tmp_146, ))
             and
             (a := self.disjunction())
             and
@@ -5717,7 +5817,7 @@ class PythonParser(Parser):
             and
             (b := self.disjunction())
             and
-            (self.negative_lookahead(self._tmp_146, ))
+            (self.negative_lookahead(self._tmp_147, ))
         ):
             return self . raise_syntax_error_known_range ( "expected 'else' after 'if' expression" , a , b );
         self._reset(mark)
@@ -5743,12 +5843,12 @@ class PythonParser(Parser):
             and
             (b := self.bitwise_or())
             and
-            (self.negative_lookahead(self._tmp_147, ))
+            (self.negative_lookahead(self._tmp_148, ))
         ):
             return ( None if self . in_recursive_rule else self . raise_syntax_error_known_range ( "invalid syntax. Maybe you meant '==' or ':=' instead of '='?" , a , b ) );
         self._reset(mark)
         if (
-            (self.negative_lookahead(self._tmp_148, ))
+            (self.negative_lookahead(self._tmp_149, ))
             and
             (a := self.bitwise_or())
             and
@@ -5756,7 +5856,7 @@ class PythonParser(Parser):
             and
             (self.bitwise_or())
             and
-            (self.negative_lookahead(self._tmp_149, ))
+            (self.negative_lookahead(self._tmp_150, ))
         ):
             return ( None if self . in_recursive_rule else self . raise_syntax_error_known_location ( f"cannot assign to {self.get_expr_name(a)} here. Maybe you meant '==' instead of '='?" , a ) );
         self._reset(mark)
@@ -5782,7 +5882,7 @@ class PythonParser(Parser):
             and
             (self.expect(','))
             and
-            (self._loop0_150(),)
+            (self._loop0_151(),)
             and
             (self.expect(':'))
             and
@@ -5800,7 +5900,7 @@ class PythonParser(Parser):
             return self . raise_syntax_error_known_location ( "illegal target for annotation" , a );
         self._reset(mark)
         if (
-            (self._loop0_151(),)
+            (self._loop0_152(),)
             and
             (a := self.star_expressions())
             and
@@ -5809,7 +5909,7 @@ class PythonParser(Parser):
             return self . raise_syntax_error_invalid_target ( Target . STAR_TARGETS , a );
         self._reset(mark)
         if (
-            (self._loop0_152(),)
+            (self._loop0_153(),)
             and
             (a := self.yield_expr())
             and
@@ -5822,7 +5922,7 @@ class PythonParser(Parser):
             and
             (self.augassign())
             and
-            (self._tmp_153())
+            (self._tmp_154())
         ):
             return self . raise_syntax_error_known_location ( f"'{self.get_expr_name(a)}' is an illegal expression for augmented assignment" , a );
         self._reset(mark)
@@ -5886,7 +5986,7 @@ class PythonParser(Parser):
         # invalid_comprehension: ('[' | '(' | '{') starred_expression for_if_clauses | ('[' | '{') star_named_expression ',' star_named_expressions for_if_clauses | ('[' | '{') star_named_expression ',' for_if_clauses
         mark = self._mark()
         if (
-            (self._tmp_154())
+            (self._tmp_155())
             and
             (a := self.starred_expression())
             and
@@ -5895,7 +5995,7 @@ class PythonParser(Parser):
             return self . raise_syntax_error_known_location ( "iterable unpacking cannot be used in comprehension" , a );
         self._reset(mark)
         if (
-            (self._tmp_155())
+            (self._tmp_156())
             and
             (a := self.star_named_expression())
             and
@@ -5908,7 +6008,7 @@ class PythonParser(Parser):
             return self . raise_syntax_error_known_range ( "did you forget parentheses around the comprehension target?" , a , b [- 1] );
         self._reset(mark)
         if (
-            (self._tmp_156())
+            (self._tmp_157())
             and
             (a := self.star_named_expression())
             and
@@ -5946,7 +6046,7 @@ class PythonParser(Parser):
         if (
             self.call_invalid_rules
             and
-            (self._loop0_157(),)
+            (self._loop0_158(),)
             and
             (self.invalid_parameters_helper())
             and
@@ -5955,11 +6055,11 @@ class PythonParser(Parser):
             return self . raise_syntax_error_known_location ( "non-default argument follows default argument" , a );
         self._reset(mark)
         if (
-            (self._loop0_158(),)
+            (self._loop0_159(),)
             and
             (a := self.expect('('))
             and
-            (self._loop1_159())
+            (self._loop1_160())
             and
             (self.expect(','),)
             and
@@ -5975,31 +6075,31 @@ class PythonParser(Parser):
             return self . raise_syntax_error_known_location ( "at least one argument must precede /" , a );
         self._reset(mark)
         if (
-            (self._tmp_160())
+            (self._tmp_161())
             and
-            (self._loop0_161(),)
+            (self._loop0_162(),)
             and
             (a := self.expect('/'))
         ):
             return self . raise_syntax_error_known_location ( "/ may appear only once" , a );
         self._reset(mark)
         if (
-            (self._tmp_162(),)
+            (self._tmp_163(),)
             and
-            (self._loop0_163(),)
+            (self._loop0_164(),)
             and
             (self.expect('*'))
             and
-            (self._tmp_164())
+            (self._tmp_165())
             and
-            (self._loop0_165(),)
+            (self._loop0_166(),)
             and
             (a := self.expect('/'))
         ):
             return self . raise_syntax_error_known_location ( "/ must be ahead of *" , a );
         self._reset(mark)
         if (
-            (self._loop1_166())
+            (self._loop1_167())
             and
             (self.expect('/'))
             and
@@ -6016,7 +6116,7 @@ class PythonParser(Parser):
         if (
             (a := self.expect('='))
             and
-            (self.positive_lookahead(self._tmp_167, ))
+            (self.positive_lookahead(self._tmp_168, ))
         ):
             return self . raise_syntax_error_known_location ( "expected default value expression" , a );
         self._reset(mark)
@@ -6029,7 +6129,7 @@ class PythonParser(Parser):
         if (
             (a := self.expect('*'))
             and
-            (self._tmp_168())
+            (self._tmp_169())
         ):
             return self . raise_syntax_error_known_location ( "named arguments must follow bare *" , a );
         self._reset(mark)
@@ -6054,13 +6154,13 @@ class PythonParser(Parser):
         if (
             (self.expect('*'))
             and
-            (self._tmp_169())
+            (self._tmp_170())
             and
-            (self._loop0_170(),)
+            (self._loop0_171(),)
             and
             (a := self.expect('*'))
             and
-            (self._tmp_171())
+            (self._tmp_172())
         ):
             return self . raise_syntax_error_known_location ( "* argument may appear only once" , a );
         self._reset(mark)
@@ -6097,7 +6197,7 @@ class PythonParser(Parser):
             and
             (self.expect(','))
             and
-            (a := self._tmp_172())
+            (a := self._tmp_173())
         ):
             return self . raise_syntax_error_known_location ( "arguments cannot follow var-keyword argument" , a );
         self._reset(mark)
@@ -6113,7 +6213,7 @@ class PythonParser(Parser):
             return [a];
         self._reset(mark)
         if (
-            (a := self._loop1_173())
+            (a := self._loop1_174())
         ):
             return a;
         self._reset(mark)
@@ -6126,7 +6226,7 @@ class PythonParser(Parser):
         if (
             self.call_invalid_rules
             and
-            (self._loop0_174(),)
+            (self._loop0_175(),)
             and
             (self.invalid_lambda_parameters_helper())
             and
@@ -6135,11 +6235,11 @@ class PythonParser(Parser):
             return self . raise_syntax_error_known_location ( "non-default argument follows default argument" , a );
         self._reset(mark)
         if (
-            (self._loop0_175(),)
+            (self._loop0_176(),)
             and
             (a := self.expect('('))
             and
-            (self._gather_176())
+            (self._gather_177())
             and
             (self.expect(','),)
             and
@@ -6155,31 +6255,31 @@ class PythonParser(Parser):
             return self . raise_syntax_error_known_location ( "at least one argument must precede /" , a );
         self._reset(mark)
         if (
-            (self._tmp_178())
+            (self._tmp_179())
             and
-            (self._loop0_179(),)
+            (self._loop0_180(),)
             and
             (a := self.expect('/'))
         ):
             return self . raise_syntax_error_known_location ( "/ may appear only once" , a );
         self._reset(mark)
         if (
-            (self._tmp_180(),)
+            (self._tmp_181(),)
             and
-            (self._loop0_181(),)
+            (self._loop0_182(),)
             and
             (self.expect('*'))
             and
-            (self._tmp_182())
+            (self._tmp_183())
             and
-            (self._loop0_183(),)
+            (self._loop0_184(),)
             and
             (a := self.expect('/'))
         ):
             return self . raise_syntax_error_known_location ( "/ must be ahead of *" , a );
         self._reset(mark)
         if (
-            (self._loop1_184())
+            (self._loop1_185())
             and
             (self.expect('/'))
             and
@@ -6199,7 +6299,7 @@ class PythonParser(Parser):
             return [a];
         self._reset(mark)
         if (
-            (a := self._loop1_185())
+            (a := self._loop1_186())
         ):
             return a;
         self._reset(mark)
@@ -6212,7 +6312,7 @@ class PythonParser(Parser):
         if (
             (self.expect('*'))
             and
-            (self._tmp_186())
+            (self._tmp_187())
         ):
             return self . raise_syntax_error ( "named arguments must follow bare *" );
         self._reset(mark)
@@ -6228,13 +6328,13 @@ class PythonParser(Parser):
         if (
             (self.expect('*'))
             and
-            (self._tmp_187())
+            (self._tmp_188())
             and
-            (self._loop0_188(),)
+            (self._loop0_189(),)
             and
             (a := self.expect('*'))
             and
-            (self._tmp_189())
+            (self._tmp_190())
         ):
             return self . raise_syntax_error_known_location ( "* argument may appear only once" , a );
         self._reset(mark)
@@ -6271,7 +6371,7 @@ class PythonParser(Parser):
             and
             (self.expect(','))
             and
-            (a := self._tmp_190())
+            (a := self._tmp_191())
         ):
             return self . raise_syntax_error_known_location ( "arguments cannot follow var-keyword argument" , a );
         self._reset(mark)
@@ -6307,7 +6407,7 @@ class PythonParser(Parser):
             and
             (a := self.expression())
             and
-            (self.positive_lookahead(self._tmp_191, ))
+            (self.positive_lookahead(self._tmp_192, ))
         ):
             return self . raise_syntax_error_invalid_target ( Target . STAR_TARGETS , a );
         self._reset(mark)
@@ -6378,7 +6478,7 @@ class PythonParser(Parser):
             and
             (self.expect('with'))
             and
-            (self._gather_192())
+            (self._gather_193())
             and
             (self.expect_forced(self.expect(':'), "':'"))
         ):
@@ -6391,7 +6491,7 @@ class PythonParser(Parser):
             and
             (self.expect('('))
             and
-            (self._gather_194())
+            (self._gather_195())
             and
             (self.expect(','),)
             and
@@ -6412,7 +6512,7 @@ class PythonParser(Parser):
             and
             (a := self.expect('with'))
             and
-            (self._gather_196())
+            (self._gather_197())
             and
             (self.expect(':'))
             and
@@ -6429,7 +6529,7 @@ class PythonParser(Parser):
             and
             (self.expect('('))
             and
-            (self._gather_198())
+            (self._gather_199())
             and
             (self.expect(','),)
             and
@@ -6467,7 +6567,7 @@ class PythonParser(Parser):
             and
             (self.block())
             and
-            (self.negative_lookahead(self._tmp_200, ))
+            (self.negative_lookahead(self._tmp_201, ))
         ):
             return self . raise_syntax_error ( "expected 'except' or 'finally' block" );
         self._reset(mark)
@@ -6486,7 +6586,7 @@ class PythonParser(Parser):
             and
             (self.expressions())
             and
-            (self._tmp_201(),)
+            (self._tmp_202(),)
             and
             (self.expect(':'))
         ):
@@ -6497,7 +6597,7 @@ class PythonParser(Parser):
             and
             (self.expression())
             and
-            (self._tmp_202(),)
+            (self._tmp_203(),)
             and
             (self.expect('NEWLINE'))
         ):
@@ -6538,7 +6638,7 @@ class PythonParser(Parser):
             and
             (self.expression())
             and
-            (self._tmp_203(),)
+            (self._tmp_204(),)
             and
             (self.expect(':'))
             and
@@ -6669,7 +6769,7 @@ class PythonParser(Parser):
         # invalid_class_argument_pattern: [positional_patterns ','] keyword_patterns ',' positional_patterns
         mark = self._mark()
         if (
-            (self._tmp_204(),)
+            (self._tmp_205(),)
             and
             (self.keyword_patterns())
             and
@@ -6824,7 +6924,7 @@ class PythonParser(Parser):
             and
             (self.expect(')'))
             and
-            (self._tmp_205(),)
+            (self._tmp_206(),)
             and
             (self.expect(':'))
             and
@@ -6845,7 +6945,7 @@ class PythonParser(Parser):
             and
             (self.name())
             and
-            (self._tmp_206(),)
+            (self._tmp_207(),)
             and
             (self.expect(':'))
             and
@@ -6864,7 +6964,7 @@ class PythonParser(Parser):
         if (
             self.call_invalid_rules
             and
-            (self._gather_207())
+            (self._gather_208())
             and
             (self.expect(','))
             and
@@ -6888,7 +6988,7 @@ class PythonParser(Parser):
             and
             (a := self.expect(':'))
             and
-            (self.positive_lookahead(self._tmp_209, ))
+            (self.positive_lookahead(self._tmp_210, ))
         ):
             return self . raise_syntax_error_known_location ( "expression expected after dictionary key and ':'" , a );
         self._reset(mark)
@@ -6965,8 +7065,21 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_5(self) -> Optional[Any]:
-        # _loop0_5: ';' simple_stmt
+    def _loop1_4(self) -> Optional[Any]:
+        # _loop1_4: top_level_statement
+        mark = self._mark()
+        children = []
+        while (
+            (top_level_statement := self.top_level_statement())
+        ):
+            children.append(top_level_statement)
+            mark = self._mark()
+        self._reset(mark)
+        return children;
+
+    @memoize
+    def _loop0_6(self) -> Optional[Any]:
+        # _loop0_6: ';' simple_stmt
         mark = self._mark()
         children = []
         while (
@@ -6980,14 +7093,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_4(self) -> Optional[Any]:
-        # _gather_4: simple_stmt _loop0_5
+    def _gather_5(self) -> Optional[Any]:
+        # _gather_5: simple_stmt _loop0_6
         mark = self._mark()
         if (
             (elem := self.simple_stmt())
             is not None
             and
-            (seq := self._loop0_5())
+            (seq := self._loop0_6())
             is not None
         ):
             return [elem] + seq;
@@ -6995,8 +7108,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_6(self) -> Optional[Any]:
-        # _tmp_6: 'import' | 'from'
+    def _tmp_7(self) -> Optional[Any]:
+        # _tmp_7: 'import' | 'from'
         mark = self._mark()
         if (
             (literal := self.expect('import'))
@@ -7011,8 +7124,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_7(self) -> Optional[Any]:
-        # _tmp_7: 'def' | '@' | 'async'
+    def _tmp_8(self) -> Optional[Any]:
+        # _tmp_8: 'def' | '@' | 'async'
         mark = self._mark()
         if (
             (literal := self.expect('def'))
@@ -7032,8 +7145,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_8(self) -> Optional[Any]:
-        # _tmp_8: 'class' | '@'
+    def _tmp_9(self) -> Optional[Any]:
+        # _tmp_9: 'class' | '@'
         mark = self._mark()
         if (
             (literal := self.expect('class'))
@@ -7048,8 +7161,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_9(self) -> Optional[Any]:
-        # _tmp_9: 'with' | 'async'
+    def _tmp_10(self) -> Optional[Any]:
+        # _tmp_10: 'with' | 'async'
         mark = self._mark()
         if (
             (literal := self.expect('with'))
@@ -7064,8 +7177,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_10(self) -> Optional[Any]:
-        # _tmp_10: 'for' | 'async'
+    def _tmp_11(self) -> Optional[Any]:
+        # _tmp_11: 'for' | 'async'
         mark = self._mark()
         if (
             (literal := self.expect('for'))
@@ -7080,8 +7193,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_11(self) -> Optional[Any]:
-        # _tmp_11: '=' annotated_rhs
+    def _tmp_12(self) -> Optional[Any]:
+        # _tmp_12: '=' annotated_rhs
         mark = self._mark()
         if (
             (self.expect('='))
@@ -7093,8 +7206,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_12(self) -> Optional[Any]:
-        # _tmp_12: '(' single_target ')' | single_subscript_attribute_target
+    def _tmp_13(self) -> Optional[Any]:
+        # _tmp_13: '(' single_target ')' | single_subscript_attribute_target
         mark = self._mark()
         if (
             (self.expect('('))
@@ -7113,8 +7226,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_13(self) -> Optional[Any]:
-        # _tmp_13: '=' annotated_rhs
+    def _tmp_14(self) -> Optional[Any]:
+        # _tmp_14: '=' annotated_rhs
         mark = self._mark()
         if (
             (self.expect('='))
@@ -7126,21 +7239,21 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop1_14(self) -> Optional[Any]:
-        # _loop1_14: (star_targets '=')
+    def _loop1_15(self) -> Optional[Any]:
+        # _loop1_15: (star_targets '=')
         mark = self._mark()
         children = []
         while (
-            (_tmp_210 := self._tmp_210())
+            (_tmp_211 := self._tmp_211())
         ):
-            children.append(_tmp_210)
+            children.append(_tmp_211)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _tmp_15(self) -> Optional[Any]:
-        # _tmp_15: yield_expr | star_expressions
+    def _tmp_16(self) -> Optional[Any]:
+        # _tmp_16: yield_expr | star_expressions
         mark = self._mark()
         if (
             (yield_expr := self.yield_expr())
@@ -7155,8 +7268,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_16(self) -> Optional[Any]:
-        # _tmp_16: yield_expr | star_expressions
+    def _tmp_17(self) -> Optional[Any]:
+        # _tmp_17: yield_expr | star_expressions
         mark = self._mark()
         if (
             (yield_expr := self.yield_expr())
@@ -7171,8 +7284,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_17(self) -> Optional[Any]:
-        # _tmp_17: 'from' expression
+    def _tmp_18(self) -> Optional[Any]:
+        # _tmp_18: 'from' expression
         mark = self._mark()
         if (
             (self.expect('from'))
@@ -7184,8 +7297,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_19(self) -> Optional[Any]:
-        # _loop0_19: ',' NAME
+    def _loop0_20(self) -> Optional[Any]:
+        # _loop0_20: ',' NAME
         mark = self._mark()
         children = []
         while (
@@ -7199,14 +7312,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_18(self) -> Optional[Any]:
-        # _gather_18: NAME _loop0_19
+    def _gather_19(self) -> Optional[Any]:
+        # _gather_19: NAME _loop0_20
         mark = self._mark()
         if (
             (elem := self.name())
             is not None
             and
-            (seq := self._loop0_19())
+            (seq := self._loop0_20())
             is not None
         ):
             return [elem] + seq;
@@ -7214,8 +7327,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_21(self) -> Optional[Any]:
-        # _loop0_21: ',' NAME
+    def _loop0_22(self) -> Optional[Any]:
+        # _loop0_22: ',' NAME
         mark = self._mark()
         children = []
         while (
@@ -7229,14 +7342,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_20(self) -> Optional[Any]:
-        # _gather_20: NAME _loop0_21
+    def _gather_21(self) -> Optional[Any]:
+        # _gather_21: NAME _loop0_22
         mark = self._mark()
         if (
             (elem := self.name())
             is not None
             and
-            (seq := self._loop0_21())
+            (seq := self._loop0_22())
             is not None
         ):
             return [elem] + seq;
@@ -7244,8 +7357,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_22(self) -> Optional[Any]:
-        # _tmp_22: ';' | NEWLINE
+    def _tmp_23(self) -> Optional[Any]:
+        # _tmp_23: ';' | NEWLINE
         mark = self._mark()
         if (
             (literal := self.expect(';'))
@@ -7260,8 +7373,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_23(self) -> Optional[Any]:
-        # _tmp_23: ',' expression
+    def _tmp_24(self) -> Optional[Any]:
+        # _tmp_24: ',' expression
         mark = self._mark()
         if (
             (self.expect(','))
@@ -7273,34 +7386,34 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_24(self) -> Optional[Any]:
-        # _loop0_24: ('.' | '...')
+    def _loop0_25(self) -> Optional[Any]:
+        # _loop0_25: ('.' | '...')
         mark = self._mark()
         children = []
         while (
-            (_tmp_211 := self._tmp_211())
+            (_tmp_212 := self._tmp_212())
         ):
-            children.append(_tmp_211)
+            children.append(_tmp_212)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _loop1_25(self) -> Optional[Any]:
-        # _loop1_25: ('.' | '...')
+    def _loop1_26(self) -> Optional[Any]:
+        # _loop1_26: ('.' | '...')
         mark = self._mark()
         children = []
         while (
-            (_tmp_212 := self._tmp_212())
+            (_tmp_213 := self._tmp_213())
         ):
-            children.append(_tmp_212)
+            children.append(_tmp_213)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _loop0_27(self) -> Optional[Any]:
-        # _loop0_27: ',' import_from_as_name
+    def _loop0_28(self) -> Optional[Any]:
+        # _loop0_28: ',' import_from_as_name
         mark = self._mark()
         children = []
         while (
@@ -7314,14 +7427,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_26(self) -> Optional[Any]:
-        # _gather_26: import_from_as_name _loop0_27
+    def _gather_27(self) -> Optional[Any]:
+        # _gather_27: import_from_as_name _loop0_28
         mark = self._mark()
         if (
             (elem := self.import_from_as_name())
             is not None
             and
-            (seq := self._loop0_27())
+            (seq := self._loop0_28())
             is not None
         ):
             return [elem] + seq;
@@ -7329,8 +7442,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_28(self) -> Optional[Any]:
-        # _tmp_28: 'as' NAME
+    def _tmp_29(self) -> Optional[Any]:
+        # _tmp_29: 'as' NAME
         mark = self._mark()
         if (
             (self.expect('as'))
@@ -7342,8 +7455,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_30(self) -> Optional[Any]:
-        # _loop0_30: ',' dotted_as_name
+    def _loop0_31(self) -> Optional[Any]:
+        # _loop0_31: ',' dotted_as_name
         mark = self._mark()
         children = []
         while (
@@ -7357,14 +7470,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_29(self) -> Optional[Any]:
-        # _gather_29: dotted_as_name _loop0_30
+    def _gather_30(self) -> Optional[Any]:
+        # _gather_30: dotted_as_name _loop0_31
         mark = self._mark()
         if (
             (elem := self.dotted_as_name())
             is not None
             and
-            (seq := self._loop0_30())
+            (seq := self._loop0_31())
             is not None
         ):
             return [elem] + seq;
@@ -7372,8 +7485,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_31(self) -> Optional[Any]:
-        # _tmp_31: 'as' NAME
+    def _tmp_32(self) -> Optional[Any]:
+        # _tmp_32: 'as' NAME
         mark = self._mark()
         if (
             (self.expect('as'))
@@ -7385,8 +7498,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop1_32(self) -> Optional[Any]:
-        # _loop1_32: decorator
+    def _loop1_33(self) -> Optional[Any]:
+        # _loop1_33: decorator
         mark = self._mark()
         children = []
         while (
@@ -7398,8 +7511,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_33(self) -> Optional[Any]:
-        # _tmp_33: '@' dec_maybe_call NEWLINE
+    def _tmp_34(self) -> Optional[Any]:
+        # _tmp_34: '@' dec_maybe_call NEWLINE
         mark = self._mark()
         if (
             (self.expect('@'))
@@ -7413,8 +7526,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_34(self) -> Optional[Any]:
-        # _tmp_34: '@' named_expression NEWLINE
+    def _tmp_35(self) -> Optional[Any]:
+        # _tmp_35: '@' named_expression NEWLINE
         mark = self._mark()
         if (
             (self.expect('@'))
@@ -7428,8 +7541,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_35(self) -> Optional[Any]:
-        # _tmp_35: '(' arguments? ')'
+    def _tmp_36(self) -> Optional[Any]:
+        # _tmp_36: '(' arguments? ')'
         mark = self._mark()
         if (
             (self.expect('('))
@@ -7443,8 +7556,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_36(self) -> Optional[Any]:
-        # _tmp_36: '->' expression
+    def _tmp_37(self) -> Optional[Any]:
+        # _tmp_37: '->' expression
         mark = self._mark()
         if (
             (self.expect('->'))
@@ -7456,8 +7569,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_37(self) -> Optional[Any]:
-        # _tmp_37: '->' expression
+    def _tmp_38(self) -> Optional[Any]:
+        # _tmp_38: '->' expression
         mark = self._mark()
         if (
             (self.expect('->'))
@@ -7469,8 +7582,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_38(self) -> Optional[Any]:
-        # _loop0_38: param_no_default
+    def _loop0_39(self) -> Optional[Any]:
+        # _loop0_39: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7482,8 +7595,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_39(self) -> Optional[Any]:
-        # _loop0_39: param_with_default
+    def _loop0_40(self) -> Optional[Any]:
+        # _loop0_40: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7495,8 +7608,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_40(self) -> Optional[Any]:
-        # _loop0_40: param_with_default
+    def _loop0_41(self) -> Optional[Any]:
+        # _loop0_41: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7508,8 +7621,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_41(self) -> Optional[Any]:
-        # _loop1_41: param_no_default
+    def _loop1_42(self) -> Optional[Any]:
+        # _loop1_42: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7521,8 +7634,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_42(self) -> Optional[Any]:
-        # _loop0_42: param_with_default
+    def _loop0_43(self) -> Optional[Any]:
+        # _loop0_43: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7534,8 +7647,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_43(self) -> Optional[Any]:
-        # _loop1_43: param_with_default
+    def _loop1_44(self) -> Optional[Any]:
+        # _loop1_44: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7547,8 +7660,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_44(self) -> Optional[Any]:
-        # _loop1_44: param_no_default
+    def _loop1_45(self) -> Optional[Any]:
+        # _loop1_45: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7560,8 +7673,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_45(self) -> Optional[Any]:
-        # _loop1_45: param_no_default
+    def _loop1_46(self) -> Optional[Any]:
+        # _loop1_46: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7573,8 +7686,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_46(self) -> Optional[Any]:
-        # _loop0_46: param_no_default
+    def _loop0_47(self) -> Optional[Any]:
+        # _loop0_47: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7586,8 +7699,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_47(self) -> Optional[Any]:
-        # _loop1_47: param_with_default
+    def _loop1_48(self) -> Optional[Any]:
+        # _loop1_48: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7599,8 +7712,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_48(self) -> Optional[Any]:
-        # _loop0_48: param_no_default
+    def _loop0_49(self) -> Optional[Any]:
+        # _loop0_49: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -7612,8 +7725,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_49(self) -> Optional[Any]:
-        # _loop1_49: param_with_default
+    def _loop1_50(self) -> Optional[Any]:
+        # _loop1_50: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -7625,8 +7738,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_50(self) -> Optional[Any]:
-        # _loop0_50: param_maybe_default
+    def _loop0_51(self) -> Optional[Any]:
+        # _loop0_51: param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -7638,8 +7751,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_51(self) -> Optional[Any]:
-        # _loop1_51: param_maybe_default
+    def _loop1_52(self) -> Optional[Any]:
+        # _loop1_52: param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -7651,8 +7764,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_53(self) -> Optional[Any]:
-        # _loop0_53: ',' with_item
+    def _loop0_54(self) -> Optional[Any]:
+        # _loop0_54: ',' with_item
         mark = self._mark()
         children = []
         while (
@@ -7666,14 +7779,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_52(self) -> Optional[Any]:
-        # _gather_52: with_item _loop0_53
+    def _gather_53(self) -> Optional[Any]:
+        # _gather_53: with_item _loop0_54
         mark = self._mark()
         if (
             (elem := self.with_item())
             is not None
             and
-            (seq := self._loop0_53())
+            (seq := self._loop0_54())
             is not None
         ):
             return [elem] + seq;
@@ -7681,8 +7794,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_55(self) -> Optional[Any]:
-        # _loop0_55: ',' with_item
+    def _loop0_56(self) -> Optional[Any]:
+        # _loop0_56: ',' with_item
         mark = self._mark()
         children = []
         while (
@@ -7696,14 +7809,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_54(self) -> Optional[Any]:
-        # _gather_54: with_item _loop0_55
+    def _gather_55(self) -> Optional[Any]:
+        # _gather_55: with_item _loop0_56
         mark = self._mark()
         if (
             (elem := self.with_item())
             is not None
             and
-            (seq := self._loop0_55())
+            (seq := self._loop0_56())
             is not None
         ):
             return [elem] + seq;
@@ -7711,8 +7824,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_57(self) -> Optional[Any]:
-        # _loop0_57: ',' with_item
+    def _loop0_58(self) -> Optional[Any]:
+        # _loop0_58: ',' with_item
         mark = self._mark()
         children = []
         while (
@@ -7726,14 +7839,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_56(self) -> Optional[Any]:
-        # _gather_56: with_item _loop0_57
+    def _gather_57(self) -> Optional[Any]:
+        # _gather_57: with_item _loop0_58
         mark = self._mark()
         if (
             (elem := self.with_item())
             is not None
             and
-            (seq := self._loop0_57())
+            (seq := self._loop0_58())
             is not None
         ):
             return [elem] + seq;
@@ -7741,8 +7854,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_59(self) -> Optional[Any]:
-        # _loop0_59: ',' with_item
+    def _loop0_60(self) -> Optional[Any]:
+        # _loop0_60: ',' with_item
         mark = self._mark()
         children = []
         while (
@@ -7756,14 +7869,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_58(self) -> Optional[Any]:
-        # _gather_58: with_item _loop0_59
+    def _gather_59(self) -> Optional[Any]:
+        # _gather_59: with_item _loop0_60
         mark = self._mark()
         if (
             (elem := self.with_item())
             is not None
             and
-            (seq := self._loop0_59())
+            (seq := self._loop0_60())
             is not None
         ):
             return [elem] + seq;
@@ -7771,8 +7884,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_60(self) -> Optional[Any]:
-        # _tmp_60: ',' | ')' | ':'
+    def _tmp_61(self) -> Optional[Any]:
+        # _tmp_61: ',' | ')' | ':'
         mark = self._mark()
         if (
             (literal := self.expect(','))
@@ -7792,8 +7905,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop1_61(self) -> Optional[Any]:
-        # _loop1_61: except_block
+    def _loop1_62(self) -> Optional[Any]:
+        # _loop1_62: except_block
         mark = self._mark()
         children = []
         while (
@@ -7805,8 +7918,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_62(self) -> Optional[Any]:
-        # _tmp_62: 'as' NAME
+    def _tmp_63(self) -> Optional[Any]:
+        # _tmp_63: 'as' NAME
         mark = self._mark()
         if (
             (self.expect('as'))
@@ -7818,8 +7931,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop1_63(self) -> Optional[Any]:
-        # _loop1_63: case_block
+    def _loop1_64(self) -> Optional[Any]:
+        # _loop1_64: case_block
         mark = self._mark()
         children = []
         while (
@@ -7831,8 +7944,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_65(self) -> Optional[Any]:
-        # _loop0_65: '|' closed_pattern
+    def _loop0_66(self) -> Optional[Any]:
+        # _loop0_66: '|' closed_pattern
         mark = self._mark()
         children = []
         while (
@@ -7846,14 +7959,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_64(self) -> Optional[Any]:
-        # _gather_64: closed_pattern _loop0_65
+    def _gather_65(self) -> Optional[Any]:
+        # _gather_65: closed_pattern _loop0_66
         mark = self._mark()
         if (
             (elem := self.closed_pattern())
             is not None
             and
-            (seq := self._loop0_65())
+            (seq := self._loop0_66())
             is not None
         ):
             return [elem] + seq;
@@ -7861,8 +7974,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_66(self) -> Optional[Any]:
-        # _tmp_66: '+' | '-'
+    def _tmp_67(self) -> Optional[Any]:
+        # _tmp_67: '+' | '-'
         mark = self._mark()
         if (
             (literal := self.expect('+'))
@@ -7877,8 +7990,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_67(self) -> Optional[Any]:
-        # _tmp_67: '+' | '-'
+    def _tmp_68(self) -> Optional[Any]:
+        # _tmp_68: '+' | '-'
         mark = self._mark()
         if (
             (literal := self.expect('+'))
@@ -7893,8 +8006,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_68(self) -> Optional[Any]:
-        # _tmp_68: '.' | '(' | '='
+    def _tmp_69(self) -> Optional[Any]:
+        # _tmp_69: '.' | '(' | '='
         mark = self._mark()
         if (
             (literal := self.expect('.'))
@@ -7914,8 +8027,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_69(self) -> Optional[Any]:
-        # _tmp_69: '.' | '(' | '='
+    def _tmp_70(self) -> Optional[Any]:
+        # _tmp_70: '.' | '(' | '='
         mark = self._mark()
         if (
             (literal := self.expect('.'))
@@ -7935,8 +8048,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_71(self) -> Optional[Any]:
-        # _loop0_71: ',' maybe_star_pattern
+    def _loop0_72(self) -> Optional[Any]:
+        # _loop0_72: ',' maybe_star_pattern
         mark = self._mark()
         children = []
         while (
@@ -7950,14 +8063,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_70(self) -> Optional[Any]:
-        # _gather_70: maybe_star_pattern _loop0_71
+    def _gather_71(self) -> Optional[Any]:
+        # _gather_71: maybe_star_pattern _loop0_72
         mark = self._mark()
         if (
             (elem := self.maybe_star_pattern())
             is not None
             and
-            (seq := self._loop0_71())
+            (seq := self._loop0_72())
             is not None
         ):
             return [elem] + seq;
@@ -7965,8 +8078,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_73(self) -> Optional[Any]:
-        # _loop0_73: ',' key_value_pattern
+    def _loop0_74(self) -> Optional[Any]:
+        # _loop0_74: ',' key_value_pattern
         mark = self._mark()
         children = []
         while (
@@ -7980,14 +8093,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_72(self) -> Optional[Any]:
-        # _gather_72: key_value_pattern _loop0_73
+    def _gather_73(self) -> Optional[Any]:
+        # _gather_73: key_value_pattern _loop0_74
         mark = self._mark()
         if (
             (elem := self.key_value_pattern())
             is not None
             and
-            (seq := self._loop0_73())
+            (seq := self._loop0_74())
             is not None
         ):
             return [elem] + seq;
@@ -7995,8 +8108,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_74(self) -> Optional[Any]:
-        # _tmp_74: literal_expr | attr
+    def _tmp_75(self) -> Optional[Any]:
+        # _tmp_75: literal_expr | attr
         mark = self._mark()
         if (
             (literal_expr := self.literal_expr())
@@ -8011,8 +8124,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_76(self) -> Optional[Any]:
-        # _loop0_76: ',' pattern
+    def _loop0_77(self) -> Optional[Any]:
+        # _loop0_77: ',' pattern
         mark = self._mark()
         children = []
         while (
@@ -8026,14 +8139,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_75(self) -> Optional[Any]:
-        # _gather_75: pattern _loop0_76
+    def _gather_76(self) -> Optional[Any]:
+        # _gather_76: pattern _loop0_77
         mark = self._mark()
         if (
             (elem := self.pattern())
             is not None
             and
-            (seq := self._loop0_76())
+            (seq := self._loop0_77())
             is not None
         ):
             return [elem] + seq;
@@ -8041,8 +8154,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_78(self) -> Optional[Any]:
-        # _loop0_78: ',' keyword_pattern
+    def _loop0_79(self) -> Optional[Any]:
+        # _loop0_79: ',' keyword_pattern
         mark = self._mark()
         children = []
         while (
@@ -8056,14 +8169,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_77(self) -> Optional[Any]:
-        # _gather_77: keyword_pattern _loop0_78
+    def _gather_78(self) -> Optional[Any]:
+        # _gather_78: keyword_pattern _loop0_79
         mark = self._mark()
         if (
             (elem := self.keyword_pattern())
             is not None
             and
-            (seq := self._loop0_78())
+            (seq := self._loop0_79())
             is not None
         ):
             return [elem] + seq;
@@ -8071,34 +8184,34 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop1_79(self) -> Optional[Any]:
-        # _loop1_79: (',' expression)
+    def _loop1_80(self) -> Optional[Any]:
+        # _loop1_80: (',' expression)
         mark = self._mark()
         children = []
         while (
-            (_tmp_213 := self._tmp_213())
+            (_tmp_214 := self._tmp_214())
         ):
-            children.append(_tmp_213)
+            children.append(_tmp_214)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _loop1_80(self) -> Optional[Any]:
-        # _loop1_80: (',' star_expression)
+    def _loop1_81(self) -> Optional[Any]:
+        # _loop1_81: (',' star_expression)
         mark = self._mark()
         children = []
         while (
-            (_tmp_214 := self._tmp_214())
+            (_tmp_215 := self._tmp_215())
         ):
-            children.append(_tmp_214)
+            children.append(_tmp_215)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _loop0_82(self) -> Optional[Any]:
-        # _loop0_82: ',' star_named_expression
+    def _loop0_83(self) -> Optional[Any]:
+        # _loop0_83: ',' star_named_expression
         mark = self._mark()
         children = []
         while (
@@ -8112,14 +8225,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_81(self) -> Optional[Any]:
-        # _gather_81: star_named_expression _loop0_82
+    def _gather_82(self) -> Optional[Any]:
+        # _gather_82: star_named_expression _loop0_83
         mark = self._mark()
         if (
             (elem := self.star_named_expression())
             is not None
             and
-            (seq := self._loop0_82())
+            (seq := self._loop0_83())
             is not None
         ):
             return [elem] + seq;
@@ -8127,34 +8240,34 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop1_83(self) -> Optional[Any]:
-        # _loop1_83: ('or' conjunction)
+    def _loop1_84(self) -> Optional[Any]:
+        # _loop1_84: ('or' conjunction)
         mark = self._mark()
         children = []
         while (
-            (_tmp_215 := self._tmp_215())
+            (_tmp_216 := self._tmp_216())
         ):
-            children.append(_tmp_215)
+            children.append(_tmp_216)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _loop1_84(self) -> Optional[Any]:
-        # _loop1_84: ('and' inversion)
+    def _loop1_85(self) -> Optional[Any]:
+        # _loop1_85: ('and' inversion)
         mark = self._mark()
         children = []
         while (
-            (_tmp_216 := self._tmp_216())
+            (_tmp_217 := self._tmp_217())
         ):
-            children.append(_tmp_216)
+            children.append(_tmp_217)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _loop1_85(self) -> Optional[Any]:
-        # _loop1_85: compare_op_bitwise_or_pair
+    def _loop1_86(self) -> Optional[Any]:
+        # _loop1_86: compare_op_bitwise_or_pair
         mark = self._mark()
         children = []
         while (
@@ -8166,8 +8279,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_87(self) -> Optional[Any]:
-        # _loop0_87: ',' slice
+    def _loop0_88(self) -> Optional[Any]:
+        # _loop0_88: ',' slice
         mark = self._mark()
         children = []
         while (
@@ -8181,14 +8294,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_86(self) -> Optional[Any]:
-        # _gather_86: slice _loop0_87
+    def _gather_87(self) -> Optional[Any]:
+        # _gather_87: slice _loop0_88
         mark = self._mark()
         if (
             (elem := self.slice())
             is not None
             and
-            (seq := self._loop0_87())
+            (seq := self._loop0_88())
             is not None
         ):
             return [elem] + seq;
@@ -8196,8 +8309,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_88(self) -> Optional[Any]:
-        # _tmp_88: ':' expression?
+    def _tmp_89(self) -> Optional[Any]:
+        # _tmp_89: ':' expression?
         mark = self._mark()
         if (
             (self.expect(':'))
@@ -8209,8 +8322,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_89(self) -> Optional[Any]:
-        # _tmp_89: tuple | group | genexp
+    def _tmp_90(self) -> Optional[Any]:
+        # _tmp_90: tuple | group | genexp
         mark = self._mark()
         if (
             (tuple := self.tuple())
@@ -8230,8 +8343,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_90(self) -> Optional[Any]:
-        # _tmp_90: list | listcomp
+    def _tmp_91(self) -> Optional[Any]:
+        # _tmp_91: list | listcomp
         mark = self._mark()
         if (
             (list := self.list())
@@ -8246,8 +8359,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_91(self) -> Optional[Any]:
-        # _tmp_91: dict | set | dictcomp | setcomp
+    def _tmp_92(self) -> Optional[Any]:
+        # _tmp_92: dict | set | dictcomp | setcomp
         mark = self._mark()
         if (
             (dict := self.dict())
@@ -8272,8 +8385,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_92(self) -> Optional[Any]:
-        # _tmp_92: yield_expr | named_expression
+    def _tmp_93(self) -> Optional[Any]:
+        # _tmp_93: yield_expr | named_expression
         mark = self._mark()
         if (
             (yield_expr := self.yield_expr())
@@ -8288,8 +8401,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_93(self) -> Optional[Any]:
-        # _loop0_93: lambda_param_no_default
+    def _loop0_94(self) -> Optional[Any]:
+        # _loop0_94: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8301,8 +8414,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_94(self) -> Optional[Any]:
-        # _loop0_94: lambda_param_with_default
+    def _loop0_95(self) -> Optional[Any]:
+        # _loop0_95: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8314,8 +8427,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_95(self) -> Optional[Any]:
-        # _loop0_95: lambda_param_with_default
+    def _loop0_96(self) -> Optional[Any]:
+        # _loop0_96: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8327,8 +8440,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_96(self) -> Optional[Any]:
-        # _loop1_96: lambda_param_no_default
+    def _loop1_97(self) -> Optional[Any]:
+        # _loop1_97: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8340,8 +8453,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_97(self) -> Optional[Any]:
-        # _loop0_97: lambda_param_with_default
+    def _loop0_98(self) -> Optional[Any]:
+        # _loop0_98: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8353,8 +8466,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_98(self) -> Optional[Any]:
-        # _loop1_98: lambda_param_with_default
+    def _loop1_99(self) -> Optional[Any]:
+        # _loop1_99: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8366,8 +8479,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_99(self) -> Optional[Any]:
-        # _loop1_99: lambda_param_no_default
+    def _loop1_100(self) -> Optional[Any]:
+        # _loop1_100: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8379,8 +8492,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_100(self) -> Optional[Any]:
-        # _loop1_100: lambda_param_no_default
+    def _loop1_101(self) -> Optional[Any]:
+        # _loop1_101: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8392,8 +8505,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_101(self) -> Optional[Any]:
-        # _loop0_101: lambda_param_no_default
+    def _loop0_102(self) -> Optional[Any]:
+        # _loop0_102: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8405,8 +8518,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_102(self) -> Optional[Any]:
-        # _loop1_102: lambda_param_with_default
+    def _loop1_103(self) -> Optional[Any]:
+        # _loop1_103: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8418,8 +8531,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_103(self) -> Optional[Any]:
-        # _loop0_103: lambda_param_no_default
+    def _loop0_104(self) -> Optional[Any]:
+        # _loop0_104: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -8431,8 +8544,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_104(self) -> Optional[Any]:
-        # _loop1_104: lambda_param_with_default
+    def _loop1_105(self) -> Optional[Any]:
+        # _loop1_105: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -8444,8 +8557,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_105(self) -> Optional[Any]:
-        # _loop0_105: lambda_param_maybe_default
+    def _loop0_106(self) -> Optional[Any]:
+        # _loop0_106: lambda_param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -8457,8 +8570,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_106(self) -> Optional[Any]:
-        # _loop1_106: lambda_param_maybe_default
+    def _loop1_107(self) -> Optional[Any]:
+        # _loop1_107: lambda_param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -8470,8 +8583,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_107(self) -> Optional[Any]:
-        # _loop1_107: STRING
+    def _loop1_108(self) -> Optional[Any]:
+        # _loop1_108: STRING
         mark = self._mark()
         children = []
         while (
@@ -8483,8 +8596,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_108(self) -> Optional[Any]:
-        # _tmp_108: star_named_expression ',' star_named_expressions?
+    def _tmp_109(self) -> Optional[Any]:
+        # _tmp_109: star_named_expression ',' star_named_expressions?
         mark = self._mark()
         if (
             (y := self.star_named_expression())
@@ -8498,8 +8611,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_110(self) -> Optional[Any]:
-        # _loop0_110: ',' double_starred_kvpair
+    def _loop0_111(self) -> Optional[Any]:
+        # _loop0_111: ',' double_starred_kvpair
         mark = self._mark()
         children = []
         while (
@@ -8513,14 +8626,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_109(self) -> Optional[Any]:
-        # _gather_109: double_starred_kvpair _loop0_110
+    def _gather_110(self) -> Optional[Any]:
+        # _gather_110: double_starred_kvpair _loop0_111
         mark = self._mark()
         if (
             (elem := self.double_starred_kvpair())
             is not None
             and
-            (seq := self._loop0_110())
+            (seq := self._loop0_111())
             is not None
         ):
             return [elem] + seq;
@@ -8528,8 +8641,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop1_111(self) -> Optional[Any]:
-        # _loop1_111: for_if_clause
+    def _loop1_112(self) -> Optional[Any]:
+        # _loop1_112: for_if_clause
         mark = self._mark()
         children = []
         while (
@@ -8541,34 +8654,34 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_112(self) -> Optional[Any]:
-        # _loop0_112: ('if' disjunction)
+    def _loop0_113(self) -> Optional[Any]:
+        # _loop0_113: ('if' disjunction)
         mark = self._mark()
         children = []
         while (
-            (_tmp_217 := self._tmp_217())
+            (_tmp_218 := self._tmp_218())
         ):
-            children.append(_tmp_217)
+            children.append(_tmp_218)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _loop0_113(self) -> Optional[Any]:
-        # _loop0_113: ('if' disjunction)
+    def _loop0_114(self) -> Optional[Any]:
+        # _loop0_114: ('if' disjunction)
         mark = self._mark()
         children = []
         while (
-            (_tmp_218 := self._tmp_218())
+            (_tmp_219 := self._tmp_219())
         ):
-            children.append(_tmp_218)
+            children.append(_tmp_219)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _tmp_114(self) -> Optional[Any]:
-        # _tmp_114: assignment_expression | expression !':='
+    def _tmp_115(self) -> Optional[Any]:
+        # _tmp_115: assignment_expression | expression !':='
         mark = self._mark()
         if (
             (assignment_expression := self.assignment_expression())
@@ -8585,14 +8698,14 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_116(self) -> Optional[Any]:
-        # _loop0_116: ',' (starred_expression | (assignment_expression | expression !':=') !'=')
+    def _loop0_117(self) -> Optional[Any]:
+        # _loop0_117: ',' (starred_expression | (assignment_expression | expression !':=') !'=')
         mark = self._mark()
         children = []
         while (
             (self.expect(','))
             and
-            (elem := self._tmp_219())
+            (elem := self._tmp_220())
         ):
             children.append(elem)
             mark = self._mark()
@@ -8600,14 +8713,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_115(self) -> Optional[Any]:
-        # _gather_115: (starred_expression | (assignment_expression | expression !':=') !'=') _loop0_116
+    def _gather_116(self) -> Optional[Any]:
+        # _gather_116: (starred_expression | (assignment_expression | expression !':=') !'=') _loop0_117
         mark = self._mark()
         if (
-            (elem := self._tmp_219())
+            (elem := self._tmp_220())
             is not None
             and
-            (seq := self._loop0_116())
+            (seq := self._loop0_117())
             is not None
         ):
             return [elem] + seq;
@@ -8615,8 +8728,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_117(self) -> Optional[Any]:
-        # _tmp_117: ',' kwargs
+    def _tmp_118(self) -> Optional[Any]:
+        # _tmp_118: ',' kwargs
         mark = self._mark()
         if (
             (self.expect(','))
@@ -8628,8 +8741,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_119(self) -> Optional[Any]:
-        # _loop0_119: ',' kwarg_or_starred
+    def _loop0_120(self) -> Optional[Any]:
+        # _loop0_120: ',' kwarg_or_starred
         mark = self._mark()
         children = []
         while (
@@ -8643,14 +8756,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_118(self) -> Optional[Any]:
-        # _gather_118: kwarg_or_starred _loop0_119
+    def _gather_119(self) -> Optional[Any]:
+        # _gather_119: kwarg_or_starred _loop0_120
         mark = self._mark()
         if (
             (elem := self.kwarg_or_starred())
             is not None
             and
-            (seq := self._loop0_119())
+            (seq := self._loop0_120())
             is not None
         ):
             return [elem] + seq;
@@ -8658,8 +8771,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_121(self) -> Optional[Any]:
-        # _loop0_121: ',' kwarg_or_double_starred
+    def _loop0_122(self) -> Optional[Any]:
+        # _loop0_122: ',' kwarg_or_double_starred
         mark = self._mark()
         children = []
         while (
@@ -8673,14 +8786,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_120(self) -> Optional[Any]:
-        # _gather_120: kwarg_or_double_starred _loop0_121
+    def _gather_121(self) -> Optional[Any]:
+        # _gather_121: kwarg_or_double_starred _loop0_122
         mark = self._mark()
         if (
             (elem := self.kwarg_or_double_starred())
             is not None
             and
-            (seq := self._loop0_121())
+            (seq := self._loop0_122())
             is not None
         ):
             return [elem] + seq;
@@ -8688,8 +8801,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_123(self) -> Optional[Any]:
-        # _loop0_123: ',' kwarg_or_starred
+    def _loop0_124(self) -> Optional[Any]:
+        # _loop0_124: ',' kwarg_or_starred
         mark = self._mark()
         children = []
         while (
@@ -8703,14 +8816,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_122(self) -> Optional[Any]:
-        # _gather_122: kwarg_or_starred _loop0_123
+    def _gather_123(self) -> Optional[Any]:
+        # _gather_123: kwarg_or_starred _loop0_124
         mark = self._mark()
         if (
             (elem := self.kwarg_or_starred())
             is not None
             and
-            (seq := self._loop0_123())
+            (seq := self._loop0_124())
             is not None
         ):
             return [elem] + seq;
@@ -8718,8 +8831,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_125(self) -> Optional[Any]:
-        # _loop0_125: ',' kwarg_or_double_starred
+    def _loop0_126(self) -> Optional[Any]:
+        # _loop0_126: ',' kwarg_or_double_starred
         mark = self._mark()
         children = []
         while (
@@ -8733,14 +8846,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_124(self) -> Optional[Any]:
-        # _gather_124: kwarg_or_double_starred _loop0_125
+    def _gather_125(self) -> Optional[Any]:
+        # _gather_125: kwarg_or_double_starred _loop0_126
         mark = self._mark()
         if (
             (elem := self.kwarg_or_double_starred())
             is not None
             and
-            (seq := self._loop0_125())
+            (seq := self._loop0_126())
             is not None
         ):
             return [elem] + seq;
@@ -8748,21 +8861,21 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_126(self) -> Optional[Any]:
-        # _loop0_126: (',' star_target)
+    def _loop0_127(self) -> Optional[Any]:
+        # _loop0_127: (',' star_target)
         mark = self._mark()
         children = []
         while (
-            (_tmp_220 := self._tmp_220())
+            (_tmp_221 := self._tmp_221())
         ):
-            children.append(_tmp_220)
+            children.append(_tmp_221)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _loop0_128(self) -> Optional[Any]:
-        # _loop0_128: ',' star_target
+    def _loop0_129(self) -> Optional[Any]:
+        # _loop0_129: ',' star_target
         mark = self._mark()
         children = []
         while (
@@ -8776,14 +8889,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_127(self) -> Optional[Any]:
-        # _gather_127: star_target _loop0_128
+    def _gather_128(self) -> Optional[Any]:
+        # _gather_128: star_target _loop0_129
         mark = self._mark()
         if (
             (elem := self.star_target())
             is not None
             and
-            (seq := self._loop0_128())
+            (seq := self._loop0_129())
             is not None
         ):
             return [elem] + seq;
@@ -8791,21 +8904,21 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop1_129(self) -> Optional[Any]:
-        # _loop1_129: (',' star_target)
+    def _loop1_130(self) -> Optional[Any]:
+        # _loop1_130: (',' star_target)
         mark = self._mark()
         children = []
         while (
-            (_tmp_221 := self._tmp_221())
+            (_tmp_222 := self._tmp_222())
         ):
-            children.append(_tmp_221)
+            children.append(_tmp_222)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _tmp_130(self) -> Optional[Any]:
-        # _tmp_130: !'*' star_target
+    def _tmp_131(self) -> Optional[Any]:
+        # _tmp_131: !'*' star_target
         mark = self._mark()
         if (
             (self.negative_lookahead(self.expect, '*'))
@@ -8817,8 +8930,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_132(self) -> Optional[Any]:
-        # _loop0_132: ',' del_target
+    def _loop0_133(self) -> Optional[Any]:
+        # _loop0_133: ',' del_target
         mark = self._mark()
         children = []
         while (
@@ -8832,14 +8945,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_131(self) -> Optional[Any]:
-        # _gather_131: del_target _loop0_132
+    def _gather_132(self) -> Optional[Any]:
+        # _gather_132: del_target _loop0_133
         mark = self._mark()
         if (
             (elem := self.del_target())
             is not None
             and
-            (seq := self._loop0_132())
+            (seq := self._loop0_133())
             is not None
         ):
             return [elem] + seq;
@@ -8847,8 +8960,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_134(self) -> Optional[Any]:
-        # _loop0_134: ',' expression
+    def _loop0_135(self) -> Optional[Any]:
+        # _loop0_135: ',' expression
         mark = self._mark()
         children = []
         while (
@@ -8862,14 +8975,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_133(self) -> Optional[Any]:
-        # _gather_133: expression _loop0_134
+    def _gather_134(self) -> Optional[Any]:
+        # _gather_134: expression _loop0_135
         mark = self._mark()
         if (
             (elem := self.expression())
             is not None
             and
-            (seq := self._loop0_134())
+            (seq := self._loop0_135())
             is not None
         ):
             return [elem] + seq;
@@ -8877,8 +8990,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_136(self) -> Optional[Any]:
-        # _loop0_136: ',' expression
+    def _loop0_137(self) -> Optional[Any]:
+        # _loop0_137: ',' expression
         mark = self._mark()
         children = []
         while (
@@ -8892,14 +9005,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_135(self) -> Optional[Any]:
-        # _gather_135: expression _loop0_136
+    def _gather_136(self) -> Optional[Any]:
+        # _gather_136: expression _loop0_137
         mark = self._mark()
         if (
             (elem := self.expression())
             is not None
             and
-            (seq := self._loop0_136())
+            (seq := self._loop0_137())
             is not None
         ):
             return [elem] + seq;
@@ -8907,8 +9020,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_138(self) -> Optional[Any]:
-        # _loop0_138: ',' expression
+    def _loop0_139(self) -> Optional[Any]:
+        # _loop0_139: ',' expression
         mark = self._mark()
         children = []
         while (
@@ -8922,14 +9035,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_137(self) -> Optional[Any]:
-        # _gather_137: expression _loop0_138
+    def _gather_138(self) -> Optional[Any]:
+        # _gather_138: expression _loop0_139
         mark = self._mark()
         if (
             (elem := self.expression())
             is not None
             and
-            (seq := self._loop0_138())
+            (seq := self._loop0_139())
             is not None
         ):
             return [elem] + seq;
@@ -8937,8 +9050,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_140(self) -> Optional[Any]:
-        # _loop0_140: ',' expression
+    def _loop0_141(self) -> Optional[Any]:
+        # _loop0_141: ',' expression
         mark = self._mark()
         children = []
         while (
@@ -8952,14 +9065,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_139(self) -> Optional[Any]:
-        # _gather_139: expression _loop0_140
+    def _gather_140(self) -> Optional[Any]:
+        # _gather_140: expression _loop0_141
         mark = self._mark()
         if (
             (elem := self.expression())
             is not None
             and
-            (seq := self._loop0_140())
+            (seq := self._loop0_141())
             is not None
         ):
             return [elem] + seq;
@@ -8967,8 +9080,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_141(self) -> Optional[Any]:
-        # _tmp_141: NEWLINE INDENT
+    def _tmp_142(self) -> Optional[Any]:
+        # _tmp_142: NEWLINE INDENT
         mark = self._mark()
         if (
             (_newline := self.expect('NEWLINE'))
@@ -8980,8 +9093,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_142(self) -> Optional[Any]:
-        # _tmp_142: args | expression for_if_clauses
+    def _tmp_143(self) -> Optional[Any]:
+        # _tmp_143: args | expression for_if_clauses
         mark = self._mark()
         if (
             (args := self.args())
@@ -8998,8 +9111,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_143(self) -> Optional[Any]:
-        # _tmp_143: 'True' | 'False' | 'None'
+    def _tmp_144(self) -> Optional[Any]:
+        # _tmp_144: 'True' | 'False' | 'None'
         mark = self._mark()
         if (
             (literal := self.expect('True'))
@@ -9019,8 +9132,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_144(self) -> Optional[Any]:
-        # _tmp_144: NAME '='
+    def _tmp_145(self) -> Optional[Any]:
+        # _tmp_145: NAME '='
         mark = self._mark()
         if (
             (name := self.name())
@@ -9032,8 +9145,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_145(self) -> Optional[Any]:
-        # _tmp_145: NAME STRING | SOFT_KEYWORD
+    def _tmp_146(self) -> Optional[Any]:
+        # _tmp_146: NAME STRING | SOFT_KEYWORD
         mark = self._mark()
         if (
             (name := self.name())
@@ -9050,8 +9163,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_146(self) -> Optional[Any]:
-        # _tmp_146: 'else' | ':'
+    def _tmp_147(self) -> Optional[Any]:
+        # _tmp_147: 'else' | ':'
         mark = self._mark()
         if (
             (literal := self.expect('else'))
@@ -9066,8 +9179,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_147(self) -> Optional[Any]:
-        # _tmp_147: '=' | ':='
+    def _tmp_148(self) -> Optional[Any]:
+        # _tmp_148: '=' | ':='
         mark = self._mark()
         if (
             (literal := self.expect('='))
@@ -9082,8 +9195,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_148(self) -> Optional[Any]:
-        # _tmp_148: list | tuple | genexp | 'True' | 'None' | 'False'
+    def _tmp_149(self) -> Optional[Any]:
+        # _tmp_149: list | tuple | genexp | 'True' | 'None' | 'False'
         mark = self._mark()
         if (
             (list := self.list())
@@ -9118,8 +9231,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_149(self) -> Optional[Any]:
-        # _tmp_149: '=' | ':='
+    def _tmp_150(self) -> Optional[Any]:
+        # _tmp_150: '=' | ':='
         mark = self._mark()
         if (
             (literal := self.expect('='))
@@ -9134,8 +9247,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_150(self) -> Optional[Any]:
-        # _loop0_150: star_named_expressions
+    def _loop0_151(self) -> Optional[Any]:
+        # _loop0_151: star_named_expressions
         mark = self._mark()
         children = []
         while (
@@ -9147,34 +9260,34 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_151(self) -> Optional[Any]:
-        # _loop0_151: (star_targets '=')
+    def _loop0_152(self) -> Optional[Any]:
+        # _loop0_152: (star_targets '=')
         mark = self._mark()
         children = []
         while (
-            (_tmp_222 := self._tmp_222())
+            (_tmp_223 := self._tmp_223())
         ):
-            children.append(_tmp_222)
+            children.append(_tmp_223)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _loop0_152(self) -> Optional[Any]:
-        # _loop0_152: (star_targets '=')
+    def _loop0_153(self) -> Optional[Any]:
+        # _loop0_153: (star_targets '=')
         mark = self._mark()
         children = []
         while (
-            (_tmp_223 := self._tmp_223())
+            (_tmp_224 := self._tmp_224())
         ):
-            children.append(_tmp_223)
+            children.append(_tmp_224)
             mark = self._mark()
         self._reset(mark)
         return children;
 
     @memoize
-    def _tmp_153(self) -> Optional[Any]:
-        # _tmp_153: yield_expr | star_expressions
+    def _tmp_154(self) -> Optional[Any]:
+        # _tmp_154: yield_expr | star_expressions
         mark = self._mark()
         if (
             (yield_expr := self.yield_expr())
@@ -9189,8 +9302,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_154(self) -> Optional[Any]:
-        # _tmp_154: '[' | '(' | '{'
+    def _tmp_155(self) -> Optional[Any]:
+        # _tmp_155: '[' | '(' | '{'
         mark = self._mark()
         if (
             (literal := self.expect('['))
@@ -9210,8 +9323,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_155(self) -> Optional[Any]:
-        # _tmp_155: '[' | '{'
+    def _tmp_156(self) -> Optional[Any]:
+        # _tmp_156: '[' | '{'
         mark = self._mark()
         if (
             (literal := self.expect('['))
@@ -9226,8 +9339,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_156(self) -> Optional[Any]:
-        # _tmp_156: '[' | '{'
+    def _tmp_157(self) -> Optional[Any]:
+        # _tmp_157: '[' | '{'
         mark = self._mark()
         if (
             (literal := self.expect('['))
@@ -9242,8 +9355,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_157(self) -> Optional[Any]:
-        # _loop0_157: param_no_default
+    def _loop0_158(self) -> Optional[Any]:
+        # _loop0_158: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -9255,8 +9368,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_158(self) -> Optional[Any]:
-        # _loop0_158: param_no_default
+    def _loop0_159(self) -> Optional[Any]:
+        # _loop0_159: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -9268,8 +9381,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_159(self) -> Optional[Any]:
-        # _loop1_159: param_no_default
+    def _loop1_160(self) -> Optional[Any]:
+        # _loop1_160: param_no_default
         mark = self._mark()
         children = []
         while (
@@ -9281,8 +9394,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_160(self) -> Optional[Any]:
-        # _tmp_160: slash_no_default | slash_with_default
+    def _tmp_161(self) -> Optional[Any]:
+        # _tmp_161: slash_no_default | slash_with_default
         mark = self._mark()
         if (
             (slash_no_default := self.slash_no_default())
@@ -9297,8 +9410,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_161(self) -> Optional[Any]:
-        # _loop0_161: param_maybe_default
+    def _loop0_162(self) -> Optional[Any]:
+        # _loop0_162: param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -9310,8 +9423,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_162(self) -> Optional[Any]:
-        # _tmp_162: slash_no_default | slash_with_default
+    def _tmp_163(self) -> Optional[Any]:
+        # _tmp_163: slash_no_default | slash_with_default
         mark = self._mark()
         if (
             (slash_no_default := self.slash_no_default())
@@ -9326,8 +9439,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_163(self) -> Optional[Any]:
-        # _loop0_163: param_maybe_default
+    def _loop0_164(self) -> Optional[Any]:
+        # _loop0_164: param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -9339,8 +9452,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_164(self) -> Optional[Any]:
-        # _tmp_164: ',' | param_no_default
+    def _tmp_165(self) -> Optional[Any]:
+        # _tmp_165: ',' | param_no_default
         mark = self._mark()
         if (
             (literal := self.expect(','))
@@ -9355,8 +9468,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_165(self) -> Optional[Any]:
-        # _loop0_165: param_maybe_default
+    def _loop0_166(self) -> Optional[Any]:
+        # _loop0_166: param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -9368,8 +9481,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_166(self) -> Optional[Any]:
-        # _loop1_166: param_maybe_default
+    def _loop1_167(self) -> Optional[Any]:
+        # _loop1_167: param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -9381,8 +9494,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_167(self) -> Optional[Any]:
-        # _tmp_167: ')' | ','
+    def _tmp_168(self) -> Optional[Any]:
+        # _tmp_168: ')' | ','
         mark = self._mark()
         if (
             (literal := self.expect(')'))
@@ -9397,8 +9510,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_168(self) -> Optional[Any]:
-        # _tmp_168: ')' | ',' (')' | '**')
+    def _tmp_169(self) -> Optional[Any]:
+        # _tmp_169: ')' | ',' (')' | '**')
         mark = self._mark()
         if (
             (literal := self.expect(')'))
@@ -9408,15 +9521,15 @@ class PythonParser(Parser):
         if (
             (literal := self.expect(','))
             and
-            (_tmp_224 := self._tmp_224())
+            (_tmp_225 := self._tmp_225())
         ):
-            return [literal, _tmp_224];
+            return [literal, _tmp_225];
         self._reset(mark)
         return None;
 
     @memoize
-    def _tmp_169(self) -> Optional[Any]:
-        # _tmp_169: param_no_default | ','
+    def _tmp_170(self) -> Optional[Any]:
+        # _tmp_170: param_no_default | ','
         mark = self._mark()
         if (
             (param_no_default := self.param_no_default())
@@ -9431,8 +9544,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_170(self) -> Optional[Any]:
-        # _loop0_170: param_maybe_default
+    def _loop0_171(self) -> Optional[Any]:
+        # _loop0_171: param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -9444,8 +9557,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_171(self) -> Optional[Any]:
-        # _tmp_171: param_no_default | ','
+    def _tmp_172(self) -> Optional[Any]:
+        # _tmp_172: param_no_default | ','
         mark = self._mark()
         if (
             (param_no_default := self.param_no_default())
@@ -9460,8 +9573,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_172(self) -> Optional[Any]:
-        # _tmp_172: '*' | '**' | '/'
+    def _tmp_173(self) -> Optional[Any]:
+        # _tmp_173: '*' | '**' | '/'
         mark = self._mark()
         if (
             (literal := self.expect('*'))
@@ -9481,8 +9594,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop1_173(self) -> Optional[Any]:
-        # _loop1_173: param_with_default
+    def _loop1_174(self) -> Optional[Any]:
+        # _loop1_174: param_with_default
         mark = self._mark()
         children = []
         while (
@@ -9494,8 +9607,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_174(self) -> Optional[Any]:
-        # _loop0_174: lambda_param_no_default
+    def _loop0_175(self) -> Optional[Any]:
+        # _loop0_175: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -9507,8 +9620,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_175(self) -> Optional[Any]:
-        # _loop0_175: lambda_param_no_default
+    def _loop0_176(self) -> Optional[Any]:
+        # _loop0_176: lambda_param_no_default
         mark = self._mark()
         children = []
         while (
@@ -9520,8 +9633,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop0_177(self) -> Optional[Any]:
-        # _loop0_177: ',' lambda_param
+    def _loop0_178(self) -> Optional[Any]:
+        # _loop0_178: ',' lambda_param
         mark = self._mark()
         children = []
         while (
@@ -9535,14 +9648,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_176(self) -> Optional[Any]:
-        # _gather_176: lambda_param _loop0_177
+    def _gather_177(self) -> Optional[Any]:
+        # _gather_177: lambda_param _loop0_178
         mark = self._mark()
         if (
             (elem := self.lambda_param())
             is not None
             and
-            (seq := self._loop0_177())
+            (seq := self._loop0_178())
             is not None
         ):
             return [elem] + seq;
@@ -9550,8 +9663,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_178(self) -> Optional[Any]:
-        # _tmp_178: lambda_slash_no_default | lambda_slash_with_default
+    def _tmp_179(self) -> Optional[Any]:
+        # _tmp_179: lambda_slash_no_default | lambda_slash_with_default
         mark = self._mark()
         if (
             (lambda_slash_no_default := self.lambda_slash_no_default())
@@ -9566,8 +9679,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_179(self) -> Optional[Any]:
-        # _loop0_179: lambda_param_maybe_default
+    def _loop0_180(self) -> Optional[Any]:
+        # _loop0_180: lambda_param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -9579,8 +9692,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_180(self) -> Optional[Any]:
-        # _tmp_180: lambda_slash_no_default | lambda_slash_with_default
+    def _tmp_181(self) -> Optional[Any]:
+        # _tmp_181: lambda_slash_no_default | lambda_slash_with_default
         mark = self._mark()
         if (
             (lambda_slash_no_default := self.lambda_slash_no_default())
@@ -9595,8 +9708,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_181(self) -> Optional[Any]:
-        # _loop0_181: lambda_param_maybe_default
+    def _loop0_182(self) -> Optional[Any]:
+        # _loop0_182: lambda_param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -9608,8 +9721,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_182(self) -> Optional[Any]:
-        # _tmp_182: ',' | lambda_param_no_default
+    def _tmp_183(self) -> Optional[Any]:
+        # _tmp_183: ',' | lambda_param_no_default
         mark = self._mark()
         if (
             (literal := self.expect(','))
@@ -9624,8 +9737,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_183(self) -> Optional[Any]:
-        # _loop0_183: lambda_param_maybe_default
+    def _loop0_184(self) -> Optional[Any]:
+        # _loop0_184: lambda_param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -9637,8 +9750,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_184(self) -> Optional[Any]:
-        # _loop1_184: lambda_param_maybe_default
+    def _loop1_185(self) -> Optional[Any]:
+        # _loop1_185: lambda_param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -9650,8 +9763,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _loop1_185(self) -> Optional[Any]:
-        # _loop1_185: lambda_param_with_default
+    def _loop1_186(self) -> Optional[Any]:
+        # _loop1_186: lambda_param_with_default
         mark = self._mark()
         children = []
         while (
@@ -9663,8 +9776,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_186(self) -> Optional[Any]:
-        # _tmp_186: ':' | ',' (':' | '**')
+    def _tmp_187(self) -> Optional[Any]:
+        # _tmp_187: ':' | ',' (':' | '**')
         mark = self._mark()
         if (
             (literal := self.expect(':'))
@@ -9674,15 +9787,15 @@ class PythonParser(Parser):
         if (
             (literal := self.expect(','))
             and
-            (_tmp_225 := self._tmp_225())
+            (_tmp_226 := self._tmp_226())
         ):
-            return [literal, _tmp_225];
+            return [literal, _tmp_226];
         self._reset(mark)
         return None;
 
     @memoize
-    def _tmp_187(self) -> Optional[Any]:
-        # _tmp_187: lambda_param_no_default | ','
+    def _tmp_188(self) -> Optional[Any]:
+        # _tmp_188: lambda_param_no_default | ','
         mark = self._mark()
         if (
             (lambda_param_no_default := self.lambda_param_no_default())
@@ -9697,8 +9810,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_188(self) -> Optional[Any]:
-        # _loop0_188: lambda_param_maybe_default
+    def _loop0_189(self) -> Optional[Any]:
+        # _loop0_189: lambda_param_maybe_default
         mark = self._mark()
         children = []
         while (
@@ -9710,8 +9823,8 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _tmp_189(self) -> Optional[Any]:
-        # _tmp_189: lambda_param_no_default | ','
+    def _tmp_190(self) -> Optional[Any]:
+        # _tmp_190: lambda_param_no_default | ','
         mark = self._mark()
         if (
             (lambda_param_no_default := self.lambda_param_no_default())
@@ -9726,8 +9839,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_190(self) -> Optional[Any]:
-        # _tmp_190: '*' | '**' | '/'
+    def _tmp_191(self) -> Optional[Any]:
+        # _tmp_191: '*' | '**' | '/'
         mark = self._mark()
         if (
             (literal := self.expect('*'))
@@ -9747,8 +9860,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_191(self) -> Optional[Any]:
-        # _tmp_191: ',' | ')' | ':'
+    def _tmp_192(self) -> Optional[Any]:
+        # _tmp_192: ',' | ')' | ':'
         mark = self._mark()
         if (
             (literal := self.expect(','))
@@ -9768,14 +9881,14 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_193(self) -> Optional[Any]:
-        # _loop0_193: ',' (expression ['as' star_target])
+    def _loop0_194(self) -> Optional[Any]:
+        # _loop0_194: ',' (expression ['as' star_target])
         mark = self._mark()
         children = []
         while (
             (self.expect(','))
             and
-            (elem := self._tmp_226())
+            (elem := self._tmp_227())
         ):
             children.append(elem)
             mark = self._mark()
@@ -9783,14 +9896,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_192(self) -> Optional[Any]:
-        # _gather_192: (expression ['as' star_target]) _loop0_193
+    def _gather_193(self) -> Optional[Any]:
+        # _gather_193: (expression ['as' star_target]) _loop0_194
         mark = self._mark()
         if (
-            (elem := self._tmp_226())
+            (elem := self._tmp_227())
             is not None
             and
-            (seq := self._loop0_193())
+            (seq := self._loop0_194())
             is not None
         ):
             return [elem] + seq;
@@ -9798,14 +9911,14 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_195(self) -> Optional[Any]:
-        # _loop0_195: ',' (expressions ['as' star_target])
+    def _loop0_196(self) -> Optional[Any]:
+        # _loop0_196: ',' (expressions ['as' star_target])
         mark = self._mark()
         children = []
         while (
             (self.expect(','))
             and
-            (elem := self._tmp_227())
+            (elem := self._tmp_228())
         ):
             children.append(elem)
             mark = self._mark()
@@ -9813,14 +9926,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_194(self) -> Optional[Any]:
-        # _gather_194: (expressions ['as' star_target]) _loop0_195
+    def _gather_195(self) -> Optional[Any]:
+        # _gather_195: (expressions ['as' star_target]) _loop0_196
         mark = self._mark()
         if (
-            (elem := self._tmp_227())
+            (elem := self._tmp_228())
             is not None
             and
-            (seq := self._loop0_195())
+            (seq := self._loop0_196())
             is not None
         ):
             return [elem] + seq;
@@ -9828,14 +9941,14 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_197(self) -> Optional[Any]:
-        # _loop0_197: ',' (expression ['as' star_target])
+    def _loop0_198(self) -> Optional[Any]:
+        # _loop0_198: ',' (expression ['as' star_target])
         mark = self._mark()
         children = []
         while (
             (self.expect(','))
             and
-            (elem := self._tmp_228())
+            (elem := self._tmp_229())
         ):
             children.append(elem)
             mark = self._mark()
@@ -9843,14 +9956,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_196(self) -> Optional[Any]:
-        # _gather_196: (expression ['as' star_target]) _loop0_197
+    def _gather_197(self) -> Optional[Any]:
+        # _gather_197: (expression ['as' star_target]) _loop0_198
         mark = self._mark()
         if (
-            (elem := self._tmp_228())
+            (elem := self._tmp_229())
             is not None
             and
-            (seq := self._loop0_197())
+            (seq := self._loop0_198())
             is not None
         ):
             return [elem] + seq;
@@ -9858,14 +9971,14 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_199(self) -> Optional[Any]:
-        # _loop0_199: ',' (expressions ['as' star_target])
+    def _loop0_200(self) -> Optional[Any]:
+        # _loop0_200: ',' (expressions ['as' star_target])
         mark = self._mark()
         children = []
         while (
             (self.expect(','))
             and
-            (elem := self._tmp_229())
+            (elem := self._tmp_230())
         ):
             children.append(elem)
             mark = self._mark()
@@ -9873,14 +9986,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_198(self) -> Optional[Any]:
-        # _gather_198: (expressions ['as' star_target]) _loop0_199
+    def _gather_199(self) -> Optional[Any]:
+        # _gather_199: (expressions ['as' star_target]) _loop0_200
         mark = self._mark()
         if (
-            (elem := self._tmp_229())
+            (elem := self._tmp_230())
             is not None
             and
-            (seq := self._loop0_199())
+            (seq := self._loop0_200())
             is not None
         ):
             return [elem] + seq;
@@ -9888,8 +10001,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_200(self) -> Optional[Any]:
-        # _tmp_200: 'except' | 'finally'
+    def _tmp_201(self) -> Optional[Any]:
+        # _tmp_201: 'except' | 'finally'
         mark = self._mark()
         if (
             (literal := self.expect('except'))
@@ -9904,8 +10017,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_201(self) -> Optional[Any]:
-        # _tmp_201: 'as' NAME
+    def _tmp_202(self) -> Optional[Any]:
+        # _tmp_202: 'as' NAME
         mark = self._mark()
         if (
             (literal := self.expect('as'))
@@ -9917,8 +10030,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_202(self) -> Optional[Any]:
-        # _tmp_202: 'as' NAME
+    def _tmp_203(self) -> Optional[Any]:
+        # _tmp_203: 'as' NAME
         mark = self._mark()
         if (
             (literal := self.expect('as'))
@@ -9930,8 +10043,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_203(self) -> Optional[Any]:
-        # _tmp_203: 'as' NAME
+    def _tmp_204(self) -> Optional[Any]:
+        # _tmp_204: 'as' NAME
         mark = self._mark()
         if (
             (literal := self.expect('as'))
@@ -9943,8 +10056,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_204(self) -> Optional[Any]:
-        # _tmp_204: positional_patterns ','
+    def _tmp_205(self) -> Optional[Any]:
+        # _tmp_205: positional_patterns ','
         mark = self._mark()
         if (
             (positional_patterns := self.positional_patterns())
@@ -9956,8 +10069,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_205(self) -> Optional[Any]:
-        # _tmp_205: '->' expression
+    def _tmp_206(self) -> Optional[Any]:
+        # _tmp_206: '->' expression
         mark = self._mark()
         if (
             (literal := self.expect('->'))
@@ -9969,8 +10082,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_206(self) -> Optional[Any]:
-        # _tmp_206: '(' arguments? ')'
+    def _tmp_207(self) -> Optional[Any]:
+        # _tmp_207: '(' arguments? ')'
         mark = self._mark()
         if (
             (literal := self.expect('('))
@@ -9984,8 +10097,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _loop0_208(self) -> Optional[Any]:
-        # _loop0_208: ',' double_starred_kvpair
+    def _loop0_209(self) -> Optional[Any]:
+        # _loop0_209: ',' double_starred_kvpair
         mark = self._mark()
         children = []
         while (
@@ -9999,14 +10112,14 @@ class PythonParser(Parser):
         return children;
 
     @memoize
-    def _gather_207(self) -> Optional[Any]:
-        # _gather_207: double_starred_kvpair _loop0_208
+    def _gather_208(self) -> Optional[Any]:
+        # _gather_208: double_starred_kvpair _loop0_209
         mark = self._mark()
         if (
             (elem := self.double_starred_kvpair())
             is not None
             and
-            (seq := self._loop0_208())
+            (seq := self._loop0_209())
             is not None
         ):
             return [elem] + seq;
@@ -10014,8 +10127,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_209(self) -> Optional[Any]:
-        # _tmp_209: '}' | ','
+    def _tmp_210(self) -> Optional[Any]:
+        # _tmp_210: '}' | ','
         mark = self._mark()
         if (
             (literal := self.expect('}'))
@@ -10030,8 +10143,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_210(self) -> Optional[Any]:
-        # _tmp_210: star_targets '='
+    def _tmp_211(self) -> Optional[Any]:
+        # _tmp_211: star_targets '='
         mark = self._mark()
         if (
             (z := self.star_targets())
@@ -10043,8 +10156,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_211(self) -> Optional[Any]:
-        # _tmp_211: '.' | '...'
+    def _tmp_212(self) -> Optional[Any]:
+        # _tmp_212: '.' | '...'
         mark = self._mark()
         if (
             (literal := self.expect('.'))
@@ -10059,8 +10172,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_212(self) -> Optional[Any]:
-        # _tmp_212: '.' | '...'
+    def _tmp_213(self) -> Optional[Any]:
+        # _tmp_213: '.' | '...'
         mark = self._mark()
         if (
             (literal := self.expect('.'))
@@ -10075,8 +10188,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_213(self) -> Optional[Any]:
-        # _tmp_213: ',' expression
+    def _tmp_214(self) -> Optional[Any]:
+        # _tmp_214: ',' expression
         mark = self._mark()
         if (
             (self.expect(','))
@@ -10088,8 +10201,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_214(self) -> Optional[Any]:
-        # _tmp_214: ',' star_expression
+    def _tmp_215(self) -> Optional[Any]:
+        # _tmp_215: ',' star_expression
         mark = self._mark()
         if (
             (self.expect(','))
@@ -10101,8 +10214,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_215(self) -> Optional[Any]:
-        # _tmp_215: 'or' conjunction
+    def _tmp_216(self) -> Optional[Any]:
+        # _tmp_216: 'or' conjunction
         mark = self._mark()
         if (
             (self.expect('or'))
@@ -10114,8 +10227,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_216(self) -> Optional[Any]:
-        # _tmp_216: 'and' inversion
+    def _tmp_217(self) -> Optional[Any]:
+        # _tmp_217: 'and' inversion
         mark = self._mark()
         if (
             (self.expect('and'))
@@ -10127,8 +10240,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_217(self) -> Optional[Any]:
-        # _tmp_217: 'if' disjunction
+    def _tmp_218(self) -> Optional[Any]:
+        # _tmp_218: 'if' disjunction
         mark = self._mark()
         if (
             (self.expect('if'))
@@ -10140,8 +10253,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_218(self) -> Optional[Any]:
-        # _tmp_218: 'if' disjunction
+    def _tmp_219(self) -> Optional[Any]:
+        # _tmp_219: 'if' disjunction
         mark = self._mark()
         if (
             (self.expect('if'))
@@ -10153,8 +10266,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_219(self) -> Optional[Any]:
-        # _tmp_219: starred_expression | (assignment_expression | expression !':=') !'='
+    def _tmp_220(self) -> Optional[Any]:
+        # _tmp_220: starred_expression | (assignment_expression | expression !':=') !'='
         mark = self._mark()
         if (
             (starred_expression := self.starred_expression())
@@ -10162,17 +10275,17 @@ class PythonParser(Parser):
             return starred_expression;
         self._reset(mark)
         if (
-            (_tmp_230 := self._tmp_230())
+            (_tmp_231 := self._tmp_231())
             and
             (self.negative_lookahead(self.expect, '='))
         ):
-            return _tmp_230;
+            return _tmp_231;
         self._reset(mark)
         return None;
 
     @memoize
-    def _tmp_220(self) -> Optional[Any]:
-        # _tmp_220: ',' star_target
+    def _tmp_221(self) -> Optional[Any]:
+        # _tmp_221: ',' star_target
         mark = self._mark()
         if (
             (self.expect(','))
@@ -10184,8 +10297,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_221(self) -> Optional[Any]:
-        # _tmp_221: ',' star_target
+    def _tmp_222(self) -> Optional[Any]:
+        # _tmp_222: ',' star_target
         mark = self._mark()
         if (
             (self.expect(','))
@@ -10197,8 +10310,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_222(self) -> Optional[Any]:
-        # _tmp_222: star_targets '='
+    def _tmp_223(self) -> Optional[Any]:
+        # _tmp_223: star_targets '='
         mark = self._mark()
         if (
             (star_targets := self.star_targets())
@@ -10210,8 +10323,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_223(self) -> Optional[Any]:
-        # _tmp_223: star_targets '='
+    def _tmp_224(self) -> Optional[Any]:
+        # _tmp_224: star_targets '='
         mark = self._mark()
         if (
             (star_targets := self.star_targets())
@@ -10223,8 +10336,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_224(self) -> Optional[Any]:
-        # _tmp_224: ')' | '**'
+    def _tmp_225(self) -> Optional[Any]:
+        # _tmp_225: ')' | '**'
         mark = self._mark()
         if (
             (literal := self.expect(')'))
@@ -10239,8 +10352,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_225(self) -> Optional[Any]:
-        # _tmp_225: ':' | '**'
+    def _tmp_226(self) -> Optional[Any]:
+        # _tmp_226: ':' | '**'
         mark = self._mark()
         if (
             (literal := self.expect(':'))
@@ -10255,60 +10368,60 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_226(self) -> Optional[Any]:
-        # _tmp_226: expression ['as' star_target]
+    def _tmp_227(self) -> Optional[Any]:
+        # _tmp_227: expression ['as' star_target]
         mark = self._mark()
         if (
             (expression := self.expression())
             and
-            (opt := self._tmp_231(),)
+            (opt := self._tmp_232(),)
         ):
             return [expression, opt];
         self._reset(mark)
         return None;
 
     @memoize
-    def _tmp_227(self) -> Optional[Any]:
-        # _tmp_227: expressions ['as' star_target]
+    def _tmp_228(self) -> Optional[Any]:
+        # _tmp_228: expressions ['as' star_target]
         mark = self._mark()
         if (
             (expressions := self.expressions())
             and
-            (opt := self._tmp_232(),)
+            (opt := self._tmp_233(),)
         ):
             return [expressions, opt];
         self._reset(mark)
         return None;
 
     @memoize
-    def _tmp_228(self) -> Optional[Any]:
-        # _tmp_228: expression ['as' star_target]
+    def _tmp_229(self) -> Optional[Any]:
+        # _tmp_229: expression ['as' star_target]
         mark = self._mark()
         if (
             (expression := self.expression())
             and
-            (opt := self._tmp_233(),)
+            (opt := self._tmp_234(),)
         ):
             return [expression, opt];
         self._reset(mark)
         return None;
 
     @memoize
-    def _tmp_229(self) -> Optional[Any]:
-        # _tmp_229: expressions ['as' star_target]
+    def _tmp_230(self) -> Optional[Any]:
+        # _tmp_230: expressions ['as' star_target]
         mark = self._mark()
         if (
             (expressions := self.expressions())
             and
-            (opt := self._tmp_234(),)
+            (opt := self._tmp_235(),)
         ):
             return [expressions, opt];
         self._reset(mark)
         return None;
 
     @memoize
-    def _tmp_230(self) -> Optional[Any]:
-        # _tmp_230: assignment_expression | expression !':='
+    def _tmp_231(self) -> Optional[Any]:
+        # _tmp_231: assignment_expression | expression !':='
         mark = self._mark()
         if (
             (assignment_expression := self.assignment_expression())
@@ -10325,8 +10438,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_231(self) -> Optional[Any]:
-        # _tmp_231: 'as' star_target
+    def _tmp_232(self) -> Optional[Any]:
+        # _tmp_232: 'as' star_target
         mark = self._mark()
         if (
             (literal := self.expect('as'))
@@ -10338,8 +10451,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_232(self) -> Optional[Any]:
-        # _tmp_232: 'as' star_target
+    def _tmp_233(self) -> Optional[Any]:
+        # _tmp_233: 'as' star_target
         mark = self._mark()
         if (
             (literal := self.expect('as'))
@@ -10351,8 +10464,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_233(self) -> Optional[Any]:
-        # _tmp_233: 'as' star_target
+    def _tmp_234(self) -> Optional[Any]:
+        # _tmp_234: 'as' star_target
         mark = self._mark()
         if (
             (literal := self.expect('as'))
@@ -10364,8 +10477,8 @@ class PythonParser(Parser):
         return None;
 
     @memoize
-    def _tmp_234(self) -> Optional[Any]:
-        # _tmp_234: 'as' star_target
+    def _tmp_235(self) -> Optional[Any]:
+        # _tmp_235: 'as' star_target
         mark = self._mark()
         if (
             (literal := self.expect('as'))
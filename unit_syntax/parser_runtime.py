@@ -0,0 +1,658 @@
+"""
+Runtime support for the generated parser, replacing `pegen.parser`'s memo.
+
+pegen memoizes every rule in one dict keyed by `(mark, rule, args)`.  That
+dict holds hundreds of thousands of entries for a large module, and creating
+a key tuple and result tuple for each lookup dominates parse time.  Here each
+memoized rule gets a slot number when it's decorated, and a parser keeps, per
+rule, an array of end marks and a list of results indexed by token position.
+These are split into fixed-size pages that are only allocated once the rule
+is tried somewhere in their range: most rules are only ever tried at a small
+fraction of positions, mostly near each other.
+
+Single-token helpers like `expect()` are not memoized at all: peeking at a
+token is cheaper than any memo lookup.
+
+Once the grammar knows it can't backtrack past a point, e.g. the end of a
+top-level statement, `Parser._release_before` drops the memo pages and
+tokens before it.
+
+`ParserProfile` collects per-rule statistics from a parser subclass whose
+rules are wrapped to record them, so parsing without it costs nothing extra.
+"""
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+import token
+import tokenize
+from array import array
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Container,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+from pegen.parser import Parser as _PegenParser
+from pegen.parser import logger
+from pegen.tokenizer import Mark, exact_token_types, shorttok
+
+__all__ = [
+    "memoize",
+    "memoize_left_rec",
+    "logger",
+    "Parser",
+    "ParserProfile",
+    "TokenBuffer",
+    "profile_from_env",
+]
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Names of the memoized rules, indexed by slot
+_RULE_NAMES: List[str] = []
+
+# End mark of a position with no memo entry
+_MISSING = -1
+
+# Memo tables are allocated in pages of 256 token positions
+_PAGE_BITS = 8
+_PAGE_SIZE = 1 << _PAGE_BITS
+_PAGE_MASK = _PAGE_SIZE - 1
+_EMPTY_ENDS = array("i", [_MISSING]) * _PAGE_SIZE
+
+
+def _new_slot(method_name: str) -> int:
+    _RULE_NAMES.append(method_name)
+    return len(_RULE_NAMES) - 1
+
+
+def _verbose_call(parser: "Parser", method: Callable, method_name: str) -> Any:
+    fill = "  " * parser._level
+    print(f"{fill}{method_name}() ... (looking at {parser.showpeek()})")
+    parser._level += 1
+    tree = method(parser)
+    parser._level -= 1
+    print(f"{fill}... {method_name}() -> {tree!s:.200}")
+    return tree
+
+
+def memoize(method: F) -> F:
+    """Memoize a rule method."""
+    method_name = method.__name__
+    slot = _new_slot(method_name)
+
+    def memoize_wrapper(self: "Parser") -> Any:
+        mark = self._mark()
+        page = mark >> _PAGE_BITS
+        pages = self._memo_ends[slot]
+        if page < len(pages):
+            ends = pages[page]
+            if ends is not None:
+                end = ends[mark & _PAGE_MASK]
+                if end != _MISSING:
+                    self._reset(end)
+                    return self._memo_trees[slot][page][mark & _PAGE_MASK]
+        if self._verbose:
+            tree = _verbose_call(self, method, method_name)
+        else:
+            tree = method(self)
+        self._memo_store(slot, mark, tree, self._mark())
+        return tree
+
+    memoize_wrapper.__wrapped__ = method  # type: ignore
+    memoize_wrapper.memo_slot = slot  # type: ignore
+    return cast(F, memoize_wrapper)
+
+
+def memoize_left_rec(
+    method: Callable[["Parser"], Optional[T]]
+) -> Callable[["Parser"], Optional[T]]:
+    """Memoize a left-recursive rule method, see `pegen.parser.memoize_left_rec`."""
+    method_name = method.__name__
+    slot = _new_slot(method_name)
+
+    def memoize_left_rec_wrapper(self: "Parser") -> Optional[T]:
+        mark = self._mark()
+        page = mark >> _PAGE_BITS
+        pages = self._memo_ends[slot]
+        if page < len(pages):
+            ends = pages[page]
+            if ends is not None:
+                end = ends[mark & _PAGE_MASK]
+                if end != _MISSING:
+                    self._reset(end)
+                    return self._memo_trees[slot][page][mark & _PAGE_MASK]
+
+        if self._verbose:
+            print(
+                f"{'  ' * self._level}{method_name} ... (looking at {self.showpeek()})"
+            )
+        self._level += 1
+
+        # Grow the match by re-running the rule with the previous result in
+        # the memo until it stops making progress.  Priming with a failure
+        # stops the left recursion on the first round.
+        self._memo_store(slot, mark, None, mark)
+        lastresult, lastmark = None, mark
+        while True:
+            self._reset(mark)
+            self.in_recursive_rule += 1
+            try:
+                result = method(self)
+            finally:
+                self.in_recursive_rule -= 1
+            endmark = self._mark()
+            if not result or endmark <= lastmark:
+                break
+            self._memo_store(slot, mark, result, endmark)
+            lastresult, lastmark = result, endmark
+
+        self._reset(lastmark)
+        tree = lastresult
+
+        self._level -= 1
+        if self._verbose:
+            print(f"{'  ' * self._level}{method_name}() -> {tree!s:.200}")
+        if tree:
+            endmark = self._mark()
+        else:
+            endmark = mark
+            self._reset(endmark)
+        self._memo_store(slot, mark, tree, endmark)
+        return tree
+
+    memoize_left_rec_wrapper.__wrapped__ = method  # type: ignore
+    memoize_left_rec_wrapper.memo_slot = slot  # type: ignore
+    return memoize_left_rec_wrapper
+
+
+# Token types the parser never sees
+_SKIPPED_TOKENS = frozenset((tokenize.NL, tokenize.COMMENT))
+
+# A `TokenBuffer` record is the token's type, string id, line id, start row,
+# start column, end row and end column
+_FIELDS = 7
+
+
+class TokenBuffer:
+    """
+    A drop-in replacement for pegen's `Tokenizer` that tokenizes the whole
+    source up front.
+
+    Tokens are kept as fixed-size records in one array, with strings and
+    source lines stored once and referred to by index, and a `TokenInfo` is
+    only built the first time the parser looks at a position.  With nothing
+    left to read lazily, `peek()` and `getnext()` are a list index.  An error
+    from the tokenizer is raised when the parser reaches the position it
+    happened at, as it would be when reading tokens as the parser goes.
+
+    `release()` drops the `TokenInfo`s and source lines behind a mark.  The
+    records stay, at 28 bytes a token, so that a mark is always an index into
+    them.
+    """
+
+    def __init__(
+        self,
+        tokengen: Iterator[tokenize.TokenInfo],
+        *,
+        path: str = "",
+        verbose: bool = False,
+    ):
+        self._index = 0
+        self._verbose = verbose
+        self._path = path
+        # First source line of the tokens starting on each line, as pegen's
+        # `Tokenizer` keeps them for error messages
+        self._lines: Dict[int, str] = {}
+        # Tokens before this index have been released
+        self._released = 0
+        # ... and source lines before this index in `_source_lines`, and
+        # before this line number in `_lines`
+        self._released_line_id = 0
+        self._released_row = 0
+        # Index past the furthest token the parser has looked at
+        self._seen = 0
+        # Raised when the parser reads past the last token
+        self._error: Optional[Exception] = None
+
+        # One record of `_FIELDS` per token, see `_token()`
+        self._records = array("I")
+        self._strings: List[str] = []
+        self._source_lines: List[Optional[str]] = []
+        self._fill(tokengen)
+        self._tokens: List[Optional[tokenize.TokenInfo]] = [None] * (
+            len(self._records) // _FIELDS
+        )
+
+    def _fill(self, tokengen: Iterator[tokenize.TokenInfo]) -> None:
+        # Filtered as by pegen's `Tokenizer.peek`
+        string_ids: Dict[str, int] = {}
+        records = self._records
+        line = None
+        last_type = None
+        try:
+            for tok in tokengen:
+                if tok.type in _SKIPPED_TOKENS:
+                    continue
+                if tok.type == token.ERRORTOKEN and tok.string.isspace():
+                    continue
+                if tok.type == token.NEWLINE and last_type == token.NEWLINE:
+                    continue
+                last_type = tok.type
+                string_id = string_ids.get(tok.string)
+                if string_id is None:
+                    string_id = string_ids[tok.string] = len(self._strings)
+                    self._strings.append(tok.string)
+                if tok.line is not line:
+                    line = tok.line
+                    self._source_lines.append(line)
+                    if tok.start[0] not in self._lines:
+                        self._lines[tok.start[0]] = line
+                records.extend(
+                    (tok.type, string_id, len(self._source_lines) - 1)
+                    + tok.start
+                    + tok.end
+                )
+        except (tokenize.TokenError, SyntaxError) as e:
+            self._error = e
+
+    def _token(self, index: Mark) -> tokenize.TokenInfo:
+        if index >= len(self._tokens):
+            # pegen's `Tokenizer` would have gotten here by exhausting the
+            # token generator
+            raise self._error or StopIteration
+        (
+            type,
+            string_id,
+            line_id,
+            start_row,
+            start_col,
+            end_row,
+            end_col,
+        ) = self._records[index * _FIELDS : (index + 1) * _FIELDS]
+        tok = self._tokens[index] = tokenize.TokenInfo(
+            type,
+            self._strings[string_id],
+            (start_row, start_col),
+            (end_row, end_col),
+            self._source_lines[line_id],
+        )
+        if index >= self._seen:
+            self._seen = index + 1
+        return tok
+
+    def getnext(self) -> tokenize.TokenInfo:
+        """Return the next token and updates the index."""
+        index = self._index
+        try:
+            tok = self._tokens[index]
+        except IndexError:
+            tok = None
+        if tok is None:
+            tok = self._token(index)
+        self._index = index + 1
+        if self._verbose:
+            print(f"{'-' * self._index}* {shorttok(tok)}")
+        return tok
+
+    def peek(self) -> tokenize.TokenInfo:
+        """Return the next token *without* updating the index."""
+        try:
+            tok = self._tokens[self._index]
+        except IndexError:
+            tok = None
+        if tok is None:
+            tok = self._token(self._index)
+        return tok
+
+    def diagnose(self) -> tokenize.TokenInfo:
+        "The furthest token the parser has looked at"
+        if not self._seen:
+            self.getnext()
+        return self._tokens[self._seen - 1] or self._token(self._seen - 1)
+
+    def seen(self) -> Mark:
+        "Index past the furthest token the parser has looked at"
+        return self._seen
+
+    def get_last_non_whitespace_token(self) -> tokenize.TokenInfo:
+        records = self._records
+        for index in range(self._index - 1, self._released - 1, -1):
+            type = records[index * _FIELDS]
+            if type != tokenize.ENDMARKER and (
+                type < tokenize.NEWLINE or type > tokenize.DEDENT
+            ):
+                break
+        return self._tokens[index] or self._token(index)
+
+    def get_lines(self, line_numbers: List[int]) -> List[str]:
+        """Retrieve source lines corresponding to line numbers."""
+        return [self._lines[n] for n in line_numbers]
+
+    def text(self, start: Mark, end: Mark) -> str:
+        "The source of the tokens from `start` to `end`, on one line"
+        parts = []
+        last_end = None
+        for index in range(start, end):
+            tok = self._tokens[index] or self._token(index)
+            if last_end is not None and tok.start != last_end:
+                parts.append(" ")
+            parts.append(tok.string)
+            last_end = tok.end
+        return "".join(parts)
+
+    def mark(self) -> Mark:
+        return self._index
+
+    def reset(self, index: Mark) -> None:
+        self._index = index
+
+    def release(self, mark: Mark) -> None:
+        "Drop the tokens before `mark`, which the parser won't reset to"
+        if mark <= self._released:
+            return
+        tokens = self._tokens
+        for index in range(self._released, mark):
+            tokens[index] = None
+        self._released = mark
+
+        # Lines the token at `mark` starts on are still needed
+        if mark < len(tokens):
+            record = mark * _FIELDS
+            line_id, row = self._records[record + 2], self._records[record + 3]
+        else:
+            line_id, row = len(self._source_lines), self._records[-_FIELDS + 5] + 1
+        source_lines = self._source_lines
+        for index in range(self._released_line_id, line_id):
+            source_lines[index] = None
+        for n in range(self._released_row, row):
+            self._lines.pop(n, None)
+        self._released_line_id = max(self._released_line_id, line_id)
+        self._released_row = max(self._released_row, row)
+
+
+class Parser(_PegenParser):
+    """pegen's `Parser` with per-rule memo tables"""
+
+    def __init__(self, tokenizer: TokenBuffer, *, verbose: bool = False):
+        super().__init__(tokenizer, verbose=verbose)
+        del self._cache
+        self._memo_clear()
+        # Memo pages before this one have been released
+        self._released_pages = 0
+
+    def _memo_clear(self) -> None:
+        "Forget every memoized result, e.g. before re-parsing from the start"
+        self._memo_ends: List[List[Optional[array]]] = [[] for _ in _RULE_NAMES]
+        self._memo_trees: List[List[Optional[List[Any]]]] = [[] for _ in _RULE_NAMES]
+
+    def _memo_clear_except(
+        self, rule: Callable, stale_ends: Container[Mark] = ()
+    ) -> None:
+        """
+        Forget every memoized result except the matches of the memoized
+        `rule`, other than those ending at one of `stale_ends`
+        """
+        slot = rule.memo_slot  # type: ignore
+        ends_pages, trees_pages = self._memo_ends[slot], self._memo_trees[slot]
+        self._memo_clear()
+        for ends, trees in zip(ends_pages, trees_pages):
+            if ends is not None:
+                for index, tree in enumerate(trees):
+                    if tree is None or ends[index] in stale_ends:
+                        ends[index] = _MISSING
+        self._memo_ends[slot], self._memo_trees[slot] = ends_pages, trees_pages
+
+    def _memo_store(self, slot: int, mark: Mark, tree: Any, end: Mark) -> None:
+        page = mark >> _PAGE_BITS
+        ends_pages = self._memo_ends[slot]
+        if page >= len(ends_pages):
+            grow = page + 1 - len(ends_pages)
+            ends_pages.extend([None] * grow)
+            self._memo_trees[slot].extend([None] * grow)
+        ends = ends_pages[page]
+        if ends is None:
+            ends = ends_pages[page] = array("i", _EMPTY_ENDS)
+            self._memo_trees[slot][page] = [None] * _PAGE_SIZE
+        ends[mark & _PAGE_MASK] = end
+        self._memo_trees[slot][page][mark & _PAGE_MASK] = tree
+
+    def _memo_has(self, slot: int, mark: Mark) -> bool:
+        "Whether the rule in `slot` has a memoized result at `mark`"
+        pages = self._memo_ends[slot]
+        page = mark >> _PAGE_BITS
+        if page >= len(pages) or pages[page] is None:
+            return False
+        return pages[page][mark & _PAGE_MASK] != _MISSING
+
+    def _release_before(self, mark: Mark) -> None:
+        "Drop memo entries and tokens before `mark`, which must never be reset to"
+        self._tokenizer.release(mark)
+        # Only whole pages are released, and so this only does any work once
+        # per page.
+        page_end = mark >> _PAGE_BITS
+        if page_end <= self._released_pages:
+            return
+        for ends_pages, trees_pages in zip(self._memo_ends, self._memo_trees):
+            for page in range(self._released_pages, min(page_end, len(ends_pages))):
+                ends_pages[page] = trees_pages[page] = None
+        self._released_pages = page_end
+
+    def name(self) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.type == token.NAME and tok.string not in self.KEYWORDS:
+            return self._tokenizer.getnext()
+        return None
+
+    def number(self) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.type == token.NUMBER:
+            return self._tokenizer.getnext()
+        return None
+
+    def string(self) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.type == token.STRING:
+            return self._tokenizer.getnext()
+        return None
+
+    def op(self) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.type == token.OP:
+            return self._tokenizer.getnext()
+        return None
+
+    def type_comment(self) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.type == token.TYPE_COMMENT:
+            return self._tokenizer.getnext()
+        return None
+
+    def soft_keyword(self) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.type == token.NAME and tok.string in self.SOFT_KEYWORDS:
+            return self._tokenizer.getnext()
+        return None
+
+    def expect(self, type: str) -> Optional[tokenize.TokenInfo]:
+        tok = self._tokenizer.peek()
+        if tok.string == type:
+            return self._tokenizer.getnext()
+        if type in exact_token_types:
+            if tok.type == exact_token_types[type]:
+                return self._tokenizer.getnext()
+        if type in token.__dict__:
+            if tok.type == token.__dict__[type]:
+                return self._tokenizer.getnext()
+        if tok.type == token.OP and tok.string == type:
+            return self._tokenizer.getnext()
+        return None
+
+
+class RuleProfile:
+    "What a profiled parser did in one grammar rule"
+
+    __slots__ = (
+        "calls",
+        "memo_hits",
+        "memo_misses",
+        "failures",
+        "self_seconds",
+        "seconds",
+        "failed_seconds",
+        "_active",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        # Only counted for memoized rules
+        self.memo_hits = 0
+        self.memo_misses = 0
+        # Calls that didn't match, after which the caller backtracks
+        self.failures = 0
+        # Time spent in the rule itself, not counting the rules it calls
+        self.self_seconds = 0.0
+        # Time including the rules it calls, without double-counting
+        # recursive calls, and the part of that in calls that failed.  That
+        # includes work memoized for other rules, which is charged to
+        # whichever rule first needed it.
+        self.seconds = 0.0
+        self.failed_seconds = 0.0
+        self._active = 0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if name[0] != "_"}
+
+
+def _profiled_rule(method: Callable, name: str) -> Callable:
+    slot = getattr(method, "memo_slot", None)
+
+    @functools.wraps(method)
+    def profiled_wrapper(self: "Parser") -> Any:
+        profile = self._profile
+        stats = profile.rules.get(name)
+        if stats is None:
+            stats = profile.rules[name] = RuleProfile()
+        stats.calls += 1
+        if slot is not None:
+            if self._memo_has(slot, self._mark()):
+                stats.memo_hits += 1
+            else:
+                stats.memo_misses += 1
+
+        stats._active += 1
+        # Time spent in rules called from this one
+        profile._child_seconds.append(0.0)
+        start = time.perf_counter()
+        tree = None
+        try:
+            tree = method(self)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats.self_seconds += elapsed - profile._child_seconds.pop()
+            if profile._child_seconds:
+                profile._child_seconds[-1] += elapsed
+            stats._active -= 1
+            if not stats._active:
+                stats.seconds += elapsed
+                if not tree:
+                    stats.failed_seconds += elapsed
+        if not tree:
+            stats.failures += 1
+        return tree
+
+    return profiled_wrapper
+
+
+class ParserProfile:
+    """
+    Per-rule call counts, memo hits and misses, failures and time, collected
+    over every parse given this profile.
+    """
+
+    def __init__(self) -> None:
+        self.rules: Dict[str, RuleProfile] = {}
+        self._child_seconds: List[float] = []
+        self._parser_classes: Dict[type, type] = {}
+
+    def parser_class(self, cls: type) -> type:
+        "A subclass of the parser `cls` that records into this profile"
+        profiled = self._parser_classes.get(cls)
+        if profiled is None:
+            # Every grammar rule is decorated, which leaves `__wrapped__`
+            names = {name for klass in cls.__mro__ for name in vars(klass)}
+            rules = {
+                name: _profiled_rule(getattr(cls, name), name)
+                for name in names
+                if hasattr(getattr(cls, name), "__wrapped__")
+            }
+            profiled = type(
+                f"Profiled{cls.__name__}", (cls,), {"_profile": self, **rules}
+            )
+            self._parser_classes[cls] = profiled
+        return profiled
+
+    def to_json(self) -> Dict[str, Dict[str, Any]]:
+        return {name: stats.to_json() for name, stats in self.rules.items()}
+
+    def report(
+        self,
+        file: Optional[IO[str]] = None,
+        sort: str = "self_seconds",
+        limit: Optional[int] = 40,
+    ) -> None:
+        "Print the rules with the highest `sort` statistic, e.g. `failures`"
+        file = file or sys.stdout
+        rules = sorted(
+            self.rules.items(), key=lambda item: getattr(item[1], sort), reverse=True
+        )
+        print(
+            f"{'rule':<32}{'calls':>9}{'hits':>9}{'misses':>9}{'failures':>9}"
+            f"{'self s':>9}{'total s':>9}{'failed s':>9}",
+            file=file,
+        )
+        for name, stats in rules[:limit]:
+            print(
+                f"{name:<32}{stats.calls:>9}{stats.memo_hits:>9}{stats.memo_misses:>9}"
+                f"{stats.failures:>9}{stats.self_seconds:>9.3f}{stats.seconds:>9.3f}"
+                f"{stats.failed_seconds:>9.3f}",
+                file=file,
+            )
+
+
+_ENV_PROFILE: Optional[ParserProfile] = None
+
+
+def _write_env_profile(profile: ParserProfile, destination: str) -> None:
+    if destination.endswith(".json"):
+        with open(destination, "w") as f:
+            json.dump(profile.to_json(), f, indent=2)
+    else:
+        profile.report(sys.stderr)
+
+
+def profile_from_env() -> Optional[ParserProfile]:
+    """
+    The profile every parse records into when `UNIT_SYNTAX_PROFILE` is set.
+    It is written out when the process exits: as JSON if the variable names a
+    `.json` file, otherwise as a report on stderr.
+    """
+    global _ENV_PROFILE
+    destination = os.environ.get("UNIT_SYNTAX_PROFILE")
+    if not destination:
+        return None
+    if _ENV_PROFILE is None:
+        _ENV_PROFILE = ParserProfile()
+        atexit.register(_write_env_profile, _ENV_PROFILE, destination)
+    return _ENV_PROFILE
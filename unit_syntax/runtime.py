@@ -0,0 +1,149 @@
+"""
+The runtime support needed by transformed code.  This deliberately imports
+nothing but pint and the standard library, so packages transformed at build
+time (see `python -m unit_syntax compile --emit-source`) don't load the units
+parser.
+"""
+import functools
+import weakref
+
+import pint
+
+# Package name -> registry passed to `enable_units_for_package`
+_PACKAGE_REGISTRIES: dict[str, pint.UnitRegistry] = {}
+
+
+# Distinct unit strings kept by `unit_parser` and `base_unit_factor`, per
+# registry
+_UNIT_CACHE_SIZE = 1024
+
+_UNIT_PARSERS: "weakref.WeakKeyDictionary[pint.UnitRegistry, any]" = (
+    weakref.WeakKeyDictionary()
+)
+_BASE_UNIT_FACTORS: "weakref.WeakKeyDictionary[pint.UnitRegistry, any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_cache(caches: weakref.WeakKeyDictionary, ureg: pint.UnitRegistry, fn):
+    "`fn(ureg, units)` as a function of `units`, cached in `caches[ureg]`"
+    cached = caches.get(ureg)
+    if cached is None:
+        # Held weakly, or the registry would keep its own entry alive
+        registry = weakref.ref(ureg)
+
+        @functools.lru_cache(maxsize=_UNIT_CACHE_SIZE)
+        def cached(units: str):
+            return fn(registry(), units)
+
+        caches[ureg] = cached
+    return cached
+
+
+def unit_parser(ureg: pint.UnitRegistry):
+    """
+    `ureg.Unit`, remembering the most recently used units.  It is shared by
+    all the code using `ureg`, e.g. every module of a package and every
+    notebook cell, so each unit string is only parsed once.
+    """
+    return _shared_cache(_UNIT_PARSERS, ureg, lambda ureg, units: ureg.Unit(units))
+
+
+def _base_unit_factor(ureg: pint.UnitRegistry, units: str) -> float:
+    quantity = ureg.Quantity(1, units)
+    if not quantity._is_multiplicative:
+        raise ValueError(f"Units with an offset can't be stripped: {units}")
+    return quantity.to_base_units().magnitude
+
+
+def base_unit_factor(ureg: pint.UnitRegistry):
+    """
+    The factor converting a magnitude in the given units to `ureg`'s base
+    units, shared like `unit_parser`.
+    """
+    return _shared_cache(_BASE_UNIT_FACTORS, ureg, _base_unit_factor)
+
+
+def stripped_quantity(value, factor: float):
+    "A unit expression's value in base units, when units are stripped"
+    if type(value) in (list, tuple) and pint.compat.HAS_NUMPY:
+        # As pint would store it
+        value = pint.compat.np.asarray(value)
+    return value * factor
+
+
+def unit_converter(ureg: pint.UnitRegistry):
+    """
+    The function transformed code calls to convert a unit expression to other
+    units, e.g. `(88 miles/hour) km/hour`, given the conversion factor.
+    """
+    Quantity = ureg.Quantity
+
+    def convert(value, units: pint.Unit, factor: float, to_units: pint.Unit):
+        # pint itself converts numbers and arrays with this one multiplication
+        if type(value) in _FACTOR_TYPES:
+            return Quantity(value * factor, to_units)
+        # Anything else, e.g. a list or a quantity in yet other units, is
+        # left to pint
+        return Quantity(Quantity(value, units), to_units)
+
+    return convert
+
+
+_FACTOR_TYPES = frozenset((int, float, complex, pint.compat.ndarray))
+
+
+def plain_values(*values) -> bool:
+    """
+    Whether each value is a number or numpy array, rather than e.g. a quantity,
+    so arithmetic on them can stand in for arithmetic on quantities.
+    """
+    for value in values:
+        if type(value) not in _FACTOR_TYPES:
+            return False
+    return True
+
+
+def injected_globals(
+    ureg: pint.UnitRegistry, strip_units: bool = False
+) -> dict[str, any]:
+    """
+    The globals transformed code expects, for units from `ureg`.  Code
+    transformed with `strip_units` instead gets plain magnitudes in the
+    registry's base units.
+    """
+    if strip_units:
+        return {
+            "_unit_syntax_q": stripped_quantity,
+            "_unit_syntax_u": base_unit_factor(ureg),
+            "_unit_syntax_plain": plain_values,
+            "_unit_syntax_lazy": functools.cache,
+        }
+    return {
+        "_unit_syntax_q": ureg.Quantity,
+        "_unit_syntax_u": unit_parser(ureg),
+        "_unit_syntax_convert": unit_converter(ureg),
+        "_unit_syntax_plain": plain_values,
+        # Wraps constants folded at transform time, which take no arguments
+        "_unit_syntax_lazy": functools.cache,
+    }
+
+
+def set_package_registry(package_name: str, ureg: pint.UnitRegistry | None):
+    if ureg is None:
+        ureg = pint._DEFAULT_REGISTRY
+    _PACKAGE_REGISTRIES[package_name] = ureg
+
+
+def module_globals(module_name: str, strip_units: bool = False) -> dict[str, any]:
+    """
+    The globals for a module transformed at build time, using the registry of
+    the nearest enclosing package that called `enable_units_for_package`.
+    """
+    name = module_name
+    while name:
+        ureg = _PACKAGE_REGISTRIES.get(name)
+        if ureg is not None:
+            return injected_globals(ureg, strip_units)
+        name = name.rpartition(".")[0]
+    return injected_globals(pint._DEFAULT_REGISTRY, strip_units)
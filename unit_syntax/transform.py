@@ -1,54 +1,878 @@
 import ast
+import atexit
+import collections
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import importlib.util
+import io
+import multiprocessing
+import os
+import sys
+import threading
+import tokenize
+import types
+import weakref
+from typing import Callable, Iterator
 import pint
-from .parser import parse_string, UnitsExpr
+from . import runtime
+from .dimensions import DimensionChecker
 from import_transforms import SourceTransform
 
 
+def _parse_with_units(source: str) -> ast.Module:
+    # The generated parser is large, so it's only imported once there's a
+    # source that needs it.  Code that just needs the runtime or already has
+    # cached bytecode never pays for it.
+    from .parser import parse_string
+
+    return parse_string(source, mode="file")
+
+
+# Below this much source for the units-aware parser, starting worker
+# processes and pickling the trees back costs more than it saves.  Parsing is
+# roughly 15us per character, and a pickled tree round trip 2us.
+_PARALLEL_MIN_CHARS = 32 * 1024
+
+_PARSE_POOL: concurrent.futures.ProcessPoolExecutor | None = None
+
+
+def _parse_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        # The pool is started from inside an import, where forking would copy
+        # whatever threads and locks the importing program holds
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context(
+            "forkserver" if "forkserver" in methods else "spawn"
+        )
+        _PARSE_POOL = concurrent.futures.ProcessPoolExecutor(mp_context=context)
+        atexit.register(_shutdown_parse_pool)
+    return _PARSE_POOL
+
+
+def _shutdown_parse_pool():
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown(cancel_futures=True)
+        _PARSE_POOL = None
+
+
+@contextlib.contextmanager
+def _main_module_hidden():
+    """
+    Hide `__main__` from multiprocessing while the pool starts workers.  Each
+    worker would otherwise import the program's main script, running any code
+    not behind an `if __name__ == "__main__"` guard, when all it needs is this
+    module.
+    """
+    main = sys.modules["__main__"]
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main
+
+
+# Logical lines starting with these continue the compound statement above
+# them rather than starting a new one.
+_CONTINUATION_KEYWORDS = frozenset(("else", "elif", "except", "finally"))
+_NON_CODE_TOKENS = frozenset(
+    (
+        tokenize.NL,
+        tokenize.COMMENT,
+        tokenize.INDENT,
+        tokenize.DEDENT,
+        tokenize.ENDMARKER,
+    )
+)
+
+
+def _split_statements(lines: list[str]) -> list[tuple[int, int]]:
+    """
+    Split a module into its top-level statements, as a list of `(start, end)`
+    0-based line ranges covering every line.  A decorated definition and the
+    clauses of a compound statement stay together.
+
+    Raises `tokenize.TokenError` or `SyntaxError` if the source can't be
+    tokenized.
+    """
+    starts = [0]
+    depth = 0
+    line_start = True
+    decorator = False
+    for tok in tokenize.generate_tokens(iter(lines).__next__):
+        if tok.type == tokenize.INDENT:
+            depth += 1
+        elif tok.type == tokenize.DEDENT:
+            depth -= 1
+        elif tok.type == tokenize.NEWLINE:
+            line_start = True
+        elif line_start and tok.type not in _NON_CODE_TOKENS:
+            line_start = False
+            if depth == 0:
+                if not decorator and tok.string not in _CONTINUATION_KEYWORDS:
+                    row = tok.start[0] - 1
+                    if row > starts[-1]:
+                        starts.append(row)
+                decorator = tok.string == "@"
+    return list(zip(starts, starts[1:] + [len(lines)]))
+
+
+def _shift_syntax_error(e: SyntaxError, lines: int) -> SyntaxError:
+    "Move an error in a statement parsed on its own to its line in the module"
+
+    def shift(lineno):
+        return None if lineno is None else lineno + lines
+
+    details = (e.filename, shift(e.lineno), e.offset, e.text)
+    details += (shift(e.end_lineno), e.end_offset)
+    return type(e)(e.msg, details)
+
+
+def _combine_unit_factors(factors) -> list[tuple[str, float]]:
+    "Sum the exponents of repeated units, dropping any that cancel out"
+    combined = {}
+    for name, exponent in factors:
+        combined[name] = combined.get(name, 0) + exponent
+    return [(name, exponent) for name, exponent in combined.items() if exponent]
+
+
+def _units_key(factors: list[tuple[str, float]]) -> str:
+    "A canonical pint expression for combined unit factors"
+    return " * ".join(
+        name if exponent == 1 else f"{name}**{exponent}" for name, exponent in factors
+    )
+
+
+# Words pint's string preprocessor turns into operators, see
+# `pint.util.string_preprocessor`
+_PREPROCESSOR_WORDS = frozenset(("per", "square", "squared", "cubic", "cubed", "sq"))
+
+
+def _unit_constant_name(units: str) -> str:
+    # Derived from the unit string rather than a counter so that separately
+    # transformed sources (e.g. notebook cells) sharing a namespace agree on
+    # what each name refers to.
+    digest = hashlib.sha1(units.encode("utf-8")).hexdigest()[:12]
+    return f"_unit_syntax_u_{digest}"
+
+
+def _is_future_import(stmt: ast.stmt) -> bool:
+    return isinstance(stmt, ast.ImportFrom) and stmt.module == "__future__"
+
+
+def _is_docstring(stmt: ast.stmt) -> bool:
+    return (
+        isinstance(stmt, ast.Expr)
+        and isinstance(stmt.value, ast.Constant)
+        and isinstance(stmt.value.value, str)
+    )
+
+
+def _prologue_end(body: list[ast.stmt]) -> int:
+    "Index of the first statement after the docstring and __future__ imports"
+    i = 0
+    if body and _is_docstring(body[0]):
+        i = 1
+    while i < len(body) and _is_future_import(body[i]):
+        i += 1
+    return i
+
+
+def _is_number(node: ast.expr) -> bool:
+    "A numeric literal, with an optional sign, or arithmetic on them"
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        return _is_number(node.operand)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, _FOLDED_BINOPS):
+        return _is_number(node.left) and _is_number(node.right)
+    return (
+        isinstance(node, ast.Constant)
+        and isinstance(node.value, (int, float, complex))
+        and not isinstance(node.value, bool)
+    )
+
+
+_FOLDED_BINOPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+
+
+def _is_literal_quantity(node: ast.expr) -> bool:
+    """
+    Whether `node` is transformed code computing a quantity from literals
+    alone, e.g. `(101 kPa)` or `(1 lumen) / (2 meter**2) * 3`.
+    """
+    if isinstance(node, ast.Call):
+        return (
+            isinstance(node.func, ast.Name)
+            and node.func.id in ("_unit_syntax_q", "_unit_syntax_convert")
+            and _is_number(node.args[0])
+        )
+    if isinstance(node, ast.UnaryOp):
+        return isinstance(node.op, (ast.UAdd, ast.USub)) and _is_literal_quantity(
+            node.operand
+        )
+    if isinstance(node, ast.BinOp) and isinstance(node.op, _FOLDED_BINOPS):
+        left = _is_literal_quantity(node.left)
+        right = _is_literal_quantity(node.right)
+        return (
+            (left or right)
+            and (left or _is_number(node.left))
+            and (right or _is_number(node.right))
+        )
+    return False
+
+
+class _LiteralQuantityFolder(ast.NodeTransformer):
+    """
+    Replaces each largest literal quantity expression in transformed code
+    with a call of a module-level constant, which evaluates the expression
+    the first time it's called and returns the same quantity from then on.
+    Evaluating lazily keeps any error, e.g. adding incompatible units, at the
+    point the expression is used.
+    """
+
+    def __init__(self):
+        # constant name -> the expression it evaluates
+        self.constants = {}
+
+    def visit(self, node):
+        if isinstance(node, ast.expr) and _is_literal_quantity(node):
+            # Named after the code, as with unit constants
+            digest = hashlib.sha1(ast.unparse(node).encode("utf-8")).hexdigest()[:12]
+            name = f"_unit_syntax_c_{digest}"
+            self.constants.setdefault(name, node)
+            call = ast.Call(ast.Name(id=name, ctx=ast.Load()), args=[], keywords=[])
+            return ast.copy_location(call, node)
+        return super().visit(node)
+
+    def assigns(self) -> list[ast.stmt]:
+        return [
+            ast.Assign(
+                targets=[ast.Name(id=name, ctx=ast.Store())],
+                value=ast.Call(
+                    ast.Name(id="_unit_syntax_lazy", ctx=ast.Load()),
+                    args=[
+                        ast.Lambda(
+                            args=ast.arguments(
+                                posonlyargs=[],
+                                args=[],
+                                kwonlyargs=[],
+                                kw_defaults=[],
+                                defaults=[],
+                            ),
+                            body=expr,
+                        )
+                    ],
+                    keywords=[],
+                ),
+            )
+            for name, expr in self.constants.items()
+        ]
+
+
+# Makes a module transformed at build time independent of the import hook,
+# see `unit_syntax.runtime`.  `__unit_syntax_transpiled__` tells
+# `enable_units_for_package` the package doesn't need the hook.
+_STANDALONE_PROLOGUE = """
+__unit_syntax_transpiled__ = True
+from unit_syntax.runtime import module_globals as _unit_syntax_module_globals
+globals().update(_unit_syntax_module_globals(__name__))
+"""
+
+# The same, for code transformed with `strip_units`
+_STRIPPED_PROLOGUE = """
+__unit_syntax_transpiled__ = True
+__unit_syntax_strip_units__ = True
+from unit_syntax.runtime import module_globals as _unit_syntax_module_globals
+globals().update(_unit_syntax_module_globals(__name__, strip_units=True))
+"""
+
+
+def _insert_prologue(source: str, body: list[ast.stmt], prologue: str) -> str:
+    "Add `prologue` to the text of a module that parsed as `body`"
+    insert_at = _prologue_end(body)
+    if insert_at:
+        lineno = body[insert_at - 1].end_lineno
+    elif body:
+        # Before the first statement, keeping any comments above it there
+        first = body[0]
+        lineno = min(n.lineno for n in [first, *getattr(first, "decorator_list", [])])
+        lineno -= 1
+    else:
+        lineno = 0
+    lines = io.StringIO(source).readlines()
+    if lineno and not lines[lineno - 1].endswith("\n"):
+        lines[lineno - 1] += "\n"
+    lines.insert(lineno, prologue.lstrip("\n"))
+    return "".join(lines)
+
+
+# Entries kept by each UnitCache
+_UNIT_CACHE_SIZE = 4096
+
+
+class UnitCache:
+    """
+    What the transform has looked up in a unit registry: whether each unit
+    name is defined, and conversion factors.  It is shared by every transform
+    using the registry, see `unit_cache`, and keeps the `maxsize` most
+    recently used entries.
+    """
+
+    def __init__(self, stamp: int, maxsize: int = _UNIT_CACHE_SIZE):
+        # `_registry_stamp` of the registry the entries came from
+        self.stamp = stamp
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key, compute: Callable[[], any]) -> tuple[any, bool]:
+        "The value for `key`, calling `compute` on a miss, and whether it hit"
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key], True
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value, False
+
+
+_UNIT_CACHES: "weakref.WeakKeyDictionary[pint.UnitRegistry, UnitCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def unit_cache(ureg: pint.UnitRegistry) -> UnitCache:
+    """
+    The UnitCache shared by all transforms using `ureg`, e.g. every module of
+    a package and every notebook cell.  It starts over whenever a definition
+    has been added or replaced.
+    """
+    stamp = _registry_stamp(ureg)
+    cache = _UNIT_CACHES.get(ureg)
+    if cache is None or cache.stamp != stamp:
+        cache = _UNIT_CACHES[ureg] = UnitCache(stamp)
+    return cache
+
+
 class UnitExprTransformer(ast.NodeTransformer):
     """
     AST transformer to turn python-with-units into standard python
+
+    The parser gives units as `(name, exponent)` factors, and each name is
+    checked against the registry directly.  Each distinct unit is turned into
+    a `pint.Unit` once, in an assignment at the top of the module, and every
+    use of that unit refers to the resulting global.
+
+    Converting a unit expression to other units, e.g. `(88 miles/hour)
+    km/hour`, multiplies the value by a conversion factor found here,
+    rather than building a quantity and having pint convert it at runtime.
+
+    With `fold_constants` set, quantities computed from literals alone, e.g.
+    `(9.81 m/s**2)` or `(1 lumen) / (1 m**2)`, are only evaluated once per
+    module, see `_LiteralQuantityFolder`.  Each use gets the same quantity
+    object, so changing it in place, e.g. with `ito()`, changes it everywhere.
+
+    With `check_dimensions` set, arithmetic on unit expressions is checked and
+    where possible done on plain magnitudes, see `DimensionChecker`.
+
+    With `strip_units` set, the code is for `runtime.injected_globals` with
+    `strip_units`, where each unit expression is its magnitude in base units.
+    A conversion then changes nothing, and units with an offset, such as
+    degC, are a SyntaxError.
     """
 
     ureg: pint.UnitRegistry
+    unit_constants: dict[str, str]
 
-    def __init__(self, ureg: pint.UnitRegistry):
+    def __init__(
+        self,
+        ureg: pint.UnitRegistry,
+        fold_constants: bool = False,
+        check_dimensions: bool = False,
+        strip_units: bool = False,
+    ):
         self.ureg = ureg
+        self.fold_constants = fold_constants
+        self.check_dimensions = check_dimensions
+        self.strip_units = strip_units
+        # canonical unit string -> name of the module-level Unit constant
+        self.unit_constants = {}
+        self.cache = unit_cache(ureg)
+        self.cache_hits = 0
+        self.cache_misses = 0
 
-    def generic_visit(self, node):
-        if isinstance(node, UnitsExpr):
-            # Check units are valid
-            try:
-                self.ureg.parse_units(node.units.value)
-            except pint.UndefinedUnitError as e:
-                raise SyntaxError(e)
-
-            value = self.generic_visit(node.value)
-            return ast.Call(
-                ast.Name(id="_unit_syntax_q", ctx=ast.Load()),
-                args=[value, node.units],
-                keywords=[],
+    def cached(self, key, compute: Callable[[], any]) -> any:
+        value, hit = self.cache.lookup(key, compute)
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+        return value
+
+    def _undefined_unit(self, name: str) -> pint.UndefinedUnitError | None:
+        try:
+            self.ureg.get_name(name)
+        except pint.UndefinedUnitError as e:
+            return e
+        return None
+
+    def unit_constant(self, units: str) -> ast.Name:
+        name = self.unit_constants.get(units)
+        if name is None:
+            name = self.unit_constants[units] = _unit_constant_name(units)
+        return ast.Name(id=name, ctx=ast.Load())
+
+    def visit_Module(self, node: ast.Module) -> ast.Module:
+        node = self.generic_visit(node)
+        if self.check_dimensions:
+            checker = DimensionChecker(
+                self.ureg,
+                {name: units for units, name in self.unit_constants.items()},
+                lambda unit: self.unit_constant(_units_key(list(unit._units.items()))),
+            )
+            node = checker.visit(node)
+
+        assigns = [
+            ast.Assign(
+                targets=[ast.Name(id=name, ctx=ast.Store())],
+                value=ast.Call(
+                    ast.Name(id="_unit_syntax_u", ctx=ast.Load()),
+                    args=[ast.Constant(value=units)],
+                    keywords=[],
+                ),
             )
+            for units, name in self.unit_constants.items()
+        ]
+        if self.fold_constants:
+            folder = _LiteralQuantityFolder()
+            node = folder.visit(node)
+            assigns += folder.assigns()
+
+        # Docstrings and `from __future__` imports must stay first
+        insert_at = _prologue_end(node.body)
+        node.body[insert_at:insert_at] = assigns
+        return node
+
+    def checked_units(self, units) -> str:
+        "The canonical unit string for a `Units` node, once its names are checked"
+        factors = _combine_unit_factors(units.factors)
+        if not self.cached(("rewritten", units.text), lambda: self._rewritten(units)):
+            for name, _ in factors:
+                if self.cached(("name", name), lambda: self._undefined_unit(name)):
+                    break
+            else:
+                return _units_key(factors)
+
+        # e.g. "meter per second" or "square meter", which pint rewrites
+        # before looking up any names
+        key = self.cached(("text", units.text), lambda: self._parse_units(units.text))
+        if isinstance(key, Exception):
+            raise SyntaxError(key)
+        return key
+
+    def _rewritten(self, units) -> bool:
+        "Whether pint would read `units` as something other than its factors"
+        if any(name in _PREPROCESSOR_WORDS for name, _ in units.factors):
+            return True
+        text = units.text
+        for preprocessor in self.ureg.preprocessors:
+            text = preprocessor(text)
+        return text != units.text
+
+    def _parse_units(self, text: str) -> str | pint.PintError:
+        try:
+            parsed = self.ureg.parse_units(text)
+        except pint.PintError as e:
+            return e
+        return _units_key(list(parsed._units.items()))
+
+    def check_strippable(self, units: str) -> None:
+        multiplicative = self.cached(
+            ("multiplicative", units),
+            lambda: self.ureg.Quantity(
+                1, runtime.unit_parser(self.ureg)(units)
+            )._is_multiplicative,
+        )
+        if not multiplicative:
+            raise SyntaxError(f"Units with an offset can't be stripped: {units}")
+
+    def conversion_factor(self, from_units: str, to_units: str) -> float | None:
+        """
+        The factor that converts a magnitude in `from_units` to `to_units`, or
+        None if the conversion is more than a multiplication, e.g. between
+        temperatures with an offset, or fails.
+        """
+        return self.cached(
+            ("conversion", from_units, to_units),
+            lambda: self._conversion_factor(from_units, to_units),
+        )
+
+    def _conversion_factor(self, from_units: str, to_units: str) -> float | None:
+        parse = runtime.unit_parser(self.ureg)
+        factor = None
+        try:
+            source = self.ureg.Quantity(1, parse(from_units))
+            target = parse(to_units)
+            if (
+                source._is_multiplicative
+                and self.ureg.Quantity(1, target)._is_multiplicative
+            ):
+                factor = source.to(target).magnitude
+        except pint.PintError:
+            pass
+        # e.g. a Decimal, for a registry with `non_int_type` set
+        if type(factor) not in (int, float):
+            factor = None
+        return factor
+
+    def visit_UnitsExpr(self, node) -> ast.Call:
+        inner = node.value
+        if type(inner) is type(node):
+            # A conversion, e.g. `(88 miles/hour) km/hour`
+            from_units = self.checked_units(inner.units)
+            units = self.checked_units(node.units)
+            factor = self.conversion_factor(from_units, units)
+            if self.strip_units:
+                if factor is None:
+                    raise SyntaxError(
+                        f"Can't strip units from a conversion of {from_units}"
+                        f" to {units}"
+                    )
+                # Both are the same magnitude in base units
+                return self.visit(inner)
+            if factor is not None:
+                return ast.Call(
+                    ast.Name(id="_unit_syntax_convert", ctx=ast.Load()),
+                    args=[
+                        self.visit(inner.value),
+                        self.unit_constant(from_units),
+                        ast.Constant(value=factor),
+                        self.unit_constant(units),
+                    ],
+                    keywords=[],
+                )
         else:
-            return super().generic_visit(node)
+            units = self.checked_units(node.units)
+        if self.strip_units:
+            self.check_strippable(units)
+
+        value = self.visit(inner)
+        return ast.Call(
+            ast.Name(id="_unit_syntax_q", ctx=ast.Load()),
+            args=[value, self.unit_constant(units)],
+            keywords=[],
+        )
+
+
+# Source positions of a definition, which don't change its meaning
+_DEFINITION_POSITION_FIELDS = {"start_line", "start_col", "end_line", "end_col", "raw"}
+
+
+def _definition_repr(definition) -> str:
+    if not dataclasses.is_dataclass(definition):
+        return repr(definition)
+    return repr(
+        [
+            (f.name, getattr(definition, f.name))
+            for f in dataclasses.fields(definition)
+            if f.name not in _DEFINITION_POSITION_FIELDS
+        ]
+    )
+
+
+# Registry -> its `_registry_stamp`, or None once a definition is added
+_REGISTRY_STAMPS: "weakref.WeakKeyDictionary[pint.UnitRegistry, int | None]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _registry_stamp(ureg: pint.UnitRegistry) -> int:
+    """
+    A number that changes whenever a definition is added to or replaced in
+    `ureg`.  It's looked up for every import, so it's only computed again
+    after pint has added a definition.
+    """
+    stamp = _REGISTRY_STAMPS.get(ureg)
+    if stamp is None:
+        if ureg not in _REGISTRY_STAMPS and not _watch_definitions(ureg):
+            return _definitions_stamp(ureg)
+        stamp = _REGISTRY_STAMPS[ureg] = _definitions_stamp(ureg)
+    return stamp
+
+
+def _watch_definitions(ureg: pint.UnitRegistry) -> bool:
+    "Forget `ureg`'s stamp whenever pint adds a definition to it, if possible"
+    add = getattr(ureg, "_helper_dispatch_adder", None)
+    if add is None:
+        return False
+    registry = weakref.ref(ureg)
+
+    # `define()` and `load_definitions()` both add each definition with this
+    def dispatch_adder(definition):
+        add(definition)
+        _REGISTRY_STAMPS[registry()] = None
+
+    ureg._helper_dispatch_adder = dispatch_adder
+    return True
+
+
+def _definitions_stamp(ureg: pint.UnitRegistry) -> int:
+    # Much cheaper than hashing the definitions, and changes whenever one is
+    # added or replaced.  Units are held in a ChainMap, whose methods build
+    # the union of its maps, so look at the maps directly.
+    ids = []
+    for definitions in (ureg._units, ureg._prefixes, ureg._dimensions):
+        for d in getattr(definitions, "maps", [definitions]):
+            ids.extend(map(id, d.values()))
+    return hash(tuple(ids))
+
+
+# The modules that decide what code the transform produces, and what it runs
+# with
+_CODE_MODULES = ("transform", "dimensions", "parser", "runtime")
+
+
+@functools.cache
+def _code_digest() -> str:
+    """
+    A hash of `_CODE_MODULES`, so that cached code is never reused after a
+    change to how it's generated, whether or not the version changed
+    """
+    h = hashlib.blake2b(digest_size=16)
+    package_dir = os.path.dirname(__file__)
+    for name in _CODE_MODULES:
+        try:
+            with open(os.path.join(package_dir, f"{name}.py"), "rb") as f:
+                h.update(f.read())
+        except OSError:
+            # Installed without sources, which only a release does
+            from . import __version__
+
+            return __version__
+    return h.hexdigest()
+
+
+def registry_fingerprint(ureg: pint.UnitRegistry) -> str:
+    "Hash the definitions and settings of `ureg` that the transform depends on"
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"case_sensitive={ureg.case_sensitive}\n".encode("utf-8"))
+    h.update(f"default_system={ureg.default_system}\n".encode("utf-8"))
+    for kind, definitions in (
+        ("unit", ureg._units),
+        ("prefix", ureg._prefixes),
+        ("dimension", ureg._dimensions),
+    ):
+        for name in sorted(definitions):
+            line = f"{kind} {name} {_definition_repr(definitions[name])}\n"
+            h.update(line.encode("utf-8"))
+    return h.hexdigest()
+
+
+@dataclasses.dataclass
+class TransformStats:
+    "Counts of which parser handled the sources seen by a UnitSourceTransform"
+
+    # Sources that were plain Python and went straight to CPython's parser
+    native_parses: int = 0
+    # Sources that needed the (much slower) units-aware parser
+    unit_parses: int = 0
+    # Top-level statements of those sources that the units-aware parser
+    # handled; the rest were still parsed by CPython
+    unit_statements: int = 0
+    # Sources whose unit statements were parsed in worker processes
+    parallel_parses: int = 0
+    # Lookups of unit names and conversions answered by the registry's
+    # shared UnitCache, and those it had to compute
+    unit_cache_hits: int = 0
+    unit_cache_misses: int = 0
+
+    @property
+    def unit_cache_hit_rate(self) -> float:
+        lookups = self.unit_cache_hits + self.unit_cache_misses
+        return self.unit_cache_hits / lookups if lookups else 0.0
 
 
 class UnitSourceTransform(SourceTransform):
+    """
+    Transforms python-with-units into standard python.
+
+    With `parallel` set, a module with enough unit statements has them parsed
+    in a shared pool of worker processes, see `_PARALLEL_MIN_CHARS`.  This is
+    meant for very large modules, e.g. generated tables.
+
+    With `fold_constants` set, quantities computed from literals alone are
+    evaluated once per module, and with `check_dimensions` set arithmetic on
+    unit expressions is checked statically, see `UnitExprTransformer`.  With
+    `strip_units` set, the code does plain arithmetic on magnitudes in the
+    registry's base units instead of using pint quantities.
+    """
+
     ureg: pint.UnitRegistry
+    stats: TransformStats
 
-    def __init__(self, ureg: pint.UnitRegistry | None):
+    def __init__(
+        self,
+        ureg: pint.UnitRegistry | None,
+        parallel: bool = False,
+        fold_constants: bool = False,
+        check_dimensions: bool = False,
+        strip_units: bool = False,
+    ):
         if ureg is None:
             ureg = pint._DEFAULT_REGISTRY
         self.ureg = ureg
+        self.parallel = parallel
+        self.fold_constants = fold_constants
+        self.check_dimensions = check_dimensions
+        self.strip_units = strip_units
+        self.stats = TransformStats()
+        self._fingerprint = None
 
     def injected_globals(self) -> dict[str, any]:
-        return {"_unit_syntax_q": self.ureg.Quantity}
+        return runtime.injected_globals(self.ureg, self.strip_units)
+
+    def registry_fingerprint(self) -> str:
+        """
+        A hex digest of the unit registry's definitions, used to tell whether
+        anything derived from the registry at transform time (e.g. a cached
+        module) is still valid.  It is stable across processes, and is only
+        recomputed when a definition has been added or replaced.
+        """
+        stamp = _registry_stamp(self.ureg)
+        if self._fingerprint is None or self._fingerprint[0] != stamp:
+            self._fingerprint = (stamp, registry_fingerprint(self.ureg))
+        return self._fingerprint[1]
+
+    def cache_key(self, source: bytes) -> bytes:
+        """
+        A key identifying the code this transform produces for `source`.  It
+        covers the source, the unit-syntax code and Python version, and the
+        unit registry, since that decides which units are accepted, and any
+        options that change the generated code.
+        """
+        prefix = f"{_code_digest()}|{self.registry_fingerprint()}|"
+        if self.fold_constants:
+            prefix += "fold_constants|"
+        if self.check_dimensions:
+            prefix += "check_dimensions|"
+        if self.strip_units:
+            prefix += "strip_units|"
+        prefix = prefix.encode("ascii")
+        h = hashlib.blake2b(prefix + importlib.util.MAGIC_NUMBER, digest_size=16)
+        h.update(source)
+        return h.digest()
 
     def transform(self, source: str) -> ast.AST:
-        tree = parse_string(source, mode="file")
-        tree_std = UnitExprTransformer(self.ureg).visit(tree)
+        # A unit expression is never valid Python, so anything CPython can
+        # parse has no units and needs no transform.  This keeps the cost of
+        # e.g. `enable_units_everywhere()` close to that of a normal import.
+        try:
+            tree = ast.parse(source)
+        except SyntaxError as e:
+            return self._transform_units(source, e)
+        self.stats.native_parses += 1
+        return tree
+
+    def _transform_units(self, source: str, native_error: SyntaxError) -> ast.AST:
+        self.stats.unit_parses += 1
+        try:
+            tree = self._parse_statements(source)
+        except tokenize.TokenError:
+            # The pure-python tokenizer gives up on e.g. an unclosed bracket
+            # without a usable location; CPython's error says more.
+            raise native_error from None
+        transformer = UnitExprTransformer(
+            self.ureg, self.fold_constants, self.check_dimensions, self.strip_units
+        )
+        try:
+            tree_std = transformer.visit(tree)
+        finally:
+            self.stats.unit_cache_hits += transformer.cache_hits
+            self.stats.unit_cache_misses += transformer.cache_misses
         return ast.fix_missing_locations(tree_std)
 
-    def transform_to_str(self, source: str) -> str:
-        "Transform a string of python-with-units into a standard python string"
-        tree_std = self.transform(source)
+    def _parse_statements(self, source: str) -> ast.Module:
+        # Unit expressions are usually a handful of statements in an otherwise
+        # ordinary module, so only the top-level statements CPython rejects
+        # go through the units-aware parser.  Each is parsed on its own and
+        # moved back to its place in the module.
+        lines = io.StringIO(source).readlines()
+        parts = []
+        unit_chunks = []
+        for start, end in _split_statements(lines):
+            chunk = "".join(lines[start:end])
+            try:
+                parts.append((start, ast.parse(chunk)))
+            except SyntaxError:
+                unit_chunks.append((len(parts), start, chunk))
+                parts.append((start, None))
+
+        self.stats.unit_statements += len(unit_chunks)
+        for (index, start, _), part in zip(
+            unit_chunks, self._parse_unit_chunks(unit_chunks)
+        ):
+            parts[index] = (start, part)
+
+        tree = ast.Module(body=[], type_ignores=[])
+        for start, part in parts:
+            ast.increment_lineno(part, start)
+            tree.body.extend(part.body)
+            tree.type_ignores.extend(part.type_ignores)
+        return tree
+
+    def _parse_unit_chunks(self, unit_chunks) -> Iterator[ast.Module]:
+        "Parse `(index, start line, source)` chunks with units, in order"
+        chunks = [chunk for _, _, chunk in unit_chunks]
+        workers = os.cpu_count() or 1
+        if (
+            self.parallel
+            and workers > 1
+            and len(chunks) > 1
+            and sum(map(len, chunks)) >= _PARALLEL_MIN_CHARS
+        ):
+            self.stats.parallel_parses += 1
+            # A few batches per worker, to balance uneven chunks
+            chunksize = max(1, len(chunks) // (4 * workers))
+            # Workers are started as tasks are submitted, which `map` does
+            # before returning
+            with _main_module_hidden():
+                pool = _parse_pool()
+                results = pool.map(_parse_with_units, chunks, chunksize=chunksize)
+        else:
+            results = map(_parse_with_units, chunks)
+
+        for _, start, _ in unit_chunks:
+            try:
+                yield next(results)
+            except SyntaxError as e:
+                raise _shift_syntax_error(e, start) from None
+
+    def transform_to_str(self, source: str, standalone: bool = False) -> str:
+        """
+        Transform a string of python-with-units into a standard python string.
+
+        If `standalone` is set the result sets up its own globals with
+        `unit_syntax.runtime`, rather than relying on the import hook.  A
+        source without units is returned as it is, apart from that setup.
+        """
+        prologue = _STRIPPED_PROLOGUE if self.strip_units else _STANDALONE_PROLOGUE
+        try:
+            tree = ast.parse(source)
+        except SyntaxError as e:
+            tree_std = self._transform_units(source, e)
+        else:
+            # Plain python is kept as written, comments and all
+            self.stats.native_parses += 1
+            if standalone:
+                source = _insert_prologue(source, tree.body, prologue)
+            return source
+        if standalone:
+            insert_at = _prologue_end(tree_std.body)
+            tree_std.body[insert_at:insert_at] = ast.parse(prologue).body
         return ast.unparse(tree_std)